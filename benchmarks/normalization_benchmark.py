@@ -0,0 +1,80 @@
+"""
+Benchmark the translation column normalization on a synthetic sheet
+
+Compares the previous per-cell .apply() clean-up (all object columns,
+re.sub + html.unescape per cell) with the vectorized normalize_columns
+stage and prints rows per second for each.
+
+Usage:
+    python -m benchmarks.normalization_benchmark [--rows 200000]
+"""
+import argparse
+import html
+import random
+import re
+import time
+import pandas as pd
+from src.excel_parser import is_text_column, normalize_columns
+
+
+def build_sheet(rows, seed=42):
+    """Build a synthetic translations sheet with the workbook's column layout"""
+    rng = random.Random(seed)
+    words = ["Account", "Balance", "Transfer", "Payroll", "Beneficiary", "Amount", "Date", "Bill",
+             "ផ្ទាំងគ្រប់គ្រង", "គណនី", "ចូល", "仪表板", "账户", "登录", "&amp;", "&lt;b&gt;"]
+
+    def phrase():
+        return "  ".join(rng.choice(words) for _ in range(rng.randint(1, 6))) + rng.choice(["", " ", "\n"])
+
+    return pd.DataFrame({
+        "Key": [f"key.{i}" for i in range(rows)],
+        "Original EN": [phrase() for _ in range(rows)],
+        "Original CN": [phrase() for _ in range(rows)],
+        "Original KH": [phrase() for _ in range(rows)],
+        "KH Confirm from BIC": [phrase() if i % 10 else None for i in range(rows)],
+        "CN Confirm from BIC": [phrase() if i % 10 else None for i in range(rows)],
+        "Remarks": [phrase() for _ in range(rows)],
+        "Module": [rng.choice(["Dashboard", "Account", "Pay & Transfer"]) for _ in range(rows)]
+    })
+
+
+def legacy_normalize(df):
+    """Per-cell clean-up used by the loaders before normalize_columns"""
+    for col in df.columns:
+        if is_text_column(df[col]):
+            df[col] = df[col].fillna('')
+            df[col] = df[col].str.strip()
+            df[col] = df[col].apply(lambda x: re.sub(r'\s+', ' ', str(x)) if isinstance(x, str) else x)
+            df[col] = df[col].apply(lambda x: html.unescape(str(x)) if isinstance(x, str) else x)
+    return df
+
+
+def measure(label, func, sheet, repeat):
+    """Run func on fresh copies of the sheet and report the best rows/second"""
+    best = float('inf')
+    for _ in range(repeat):
+        df = sheet.copy()
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    rows_per_second = len(sheet) / best
+    print(f"{label:<12} {best:8.3f}s  {rows_per_second:12,.0f} rows/s")
+    return rows_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark translation column normalization')
+    parser.add_argument('--rows', type=int, default=200000, help='Number of synthetic rows')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    sheet = build_sheet(args.rows)
+    print(f"Synthetic sheet: {len(sheet)} rows x {len(sheet.columns)} columns")
+
+    before = measure("before", legacy_normalize, sheet, args.repeat)
+    after = measure("after", normalize_columns, sheet, args.repeat)
+    print(f"Speed-up: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,10 @@ import logging
 import os
 import sys
 from datetime import datetime
-from src.tester import TranslationTester
+from src.async_runner import run_async
+from src.browser_manager import run_sharded_tests
+from src.incremental import run_incremental_tests
+from src.snapshot_store import replay_snapshots
 
 from src.config_manager import ConfigManager
 
@@ -19,6 +22,13 @@ def main():
     parser.add_argument('--browser', type=str, default='chrome', help='Browser to use (chrome, firefox, edge)')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--report-dir', type=str, default='reports', help='Directory for reports')
+    parser.add_argument('--workers', type=int, help='Browser instances per browser type (shards pages and languages)')
+    parser.add_argument('--async', dest='async_engine', action='store_true', help='Drive all browser sessions from one asyncio event loop')
+    parser.add_argument('--capture', type=str, help='Also store page text snapshots in this directory for later replay')
+    parser.add_argument('--replay', type=str, help='Verify snapshots from this directory against the workbook, without a browser')
+    parser.add_argument('--incremental', action='store_true', help='Only re-check pages showing translations changed since the last run')
+    parser.add_argument('--bundle', action='store_true', help='Write the report as a self-contained zip with Chart.js and screenshot thumbnails')
+    parser.add_argument('--export', action='store_true', help='Also export per-element results as JSONL (and Parquet if pyarrow is installed)')
     
     args = parser.parse_args()
     
@@ -38,9 +48,36 @@ def main():
         config_manager.set_config('browsers', [args.browser])
     if args.headless:
         config_manager.set_config('headless', True)
+    if args.workers:
+        config_manager.set_config('workers_per_browser', args.workers)
+    if args.async_engine:
+        config_manager.set_config('async_engine', True)
+    if args.capture:
+        config_manager.set_config('snapshot_dir', args.capture)
+    if args.incremental:
+        config_manager.set_config('incremental', True)
+    if args.bundle:
+        config_manager.set_config('report_bundle', True)
+    if args.export:
+        config_manager.set_config('export_results', True)
     
     config = config_manager.get_config()
     
+    if args.replay:
+        # Offline re-verification: only the workbook is needed
+        if not config['excel_path']:
+            print("Missing required configuration: excel_path")
+            sys.exit(1)
+        
+        results = replay_snapshots(config, args.replay)
+        
+        print("\nReplay Results:")
+        for browser, result in results.items():
+            total_mismatches = sum(result['results'][f"{lang}_mismatched"] for lang in ["en", "kh", "cn"])
+            print(f"  {browser or 'unknown browser'}: {'Passed' if result['success'] else 'Failed'} ({total_mismatches} mismatches)")
+            print(f"    Report generated: {result['report_file']}")
+        return
+    
     # Validate required config values
     required_config = ['base_url', 'excel_path', 'username', 'password']
     missing_config = [key for key in required_config if not config[key]]
@@ -51,44 +88,22 @@ def main():
         sys.exit(1)
     
     # Run tests
-    if len(config['browsers']) > 1:
-        # Run parallel tests on multiple browsers
-        results = run_parallel_tests(
-            config['base_url'],
-            config['excel_path'],
-            config['username'],
-            config['password'],
-            config['browsers']
-        )
-        
-        # Print results
-        print("\nTest Results:")
-        for browser, result in results.items():
-            print(f"  {browser}: {'Passed' if result else 'Failed'}")
+    if config['incremental']:
+        # Carry over results for pages whose translations did not change
+        results = run_incremental_tests(config)
+    elif config['async_engine']:
+        # Many concurrent sessions driven from a single event loop
+        results = run_async(config)
     else:
-        # Run single browser test
-        tester = TranslationTester(
-            config['base_url'],
-            config['excel_path'],
-            config['username'],
-            config['password']
-        )
-        
-        # Configure additional options
-        tester.headless = config['headless']
-        tester.wait_time = config['wait_time']
-        tester.check_dynamic_content = config['check_dynamic_content']
-        tester.screenshot_on_mismatch = config['screenshot_on_mismatch']
-        
-        # Run the test
-        result = tester.run_test()
-        
-        # Print result
-        print(f"\nTest Result: {'Passed' if result else 'Failed'}")
-        
-        # Print report location if generated
-        if hasattr(tester, 'report_file') and tester.report_file:
-            print(f"Report generated: {tester.report_file}")
+        # Pages and languages run as units on a pool of drivers per browser (one worker each by default)
+        results = run_sharded_tests(config)
+    
+    # Print results
+    print("\nTest Results:")
+    for browser, result in results.items():
+        print(f"  {browser}: {'Passed' if result['success'] else 'Failed'}")
+        if result.get('report_file'):
+            print(f"    Report generated: {result['report_file']}")
 
 if __name__ == "__main__":
     main()
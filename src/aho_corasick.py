@@ -0,0 +1,178 @@
+from collections import deque, namedtuple
+from src.translation_index import LANGUAGES
+
+# One occurrence of a sheet translation inside scanned text (offsets into the normalized text)
+Match = namedtuple('Match', ['start', 'end', 'key', 'language', 'text'])
+
+# Separates item texts when a whole page is scanned at once; normalized patterns never contain it
+ITEM_SEPARATOR = "\n"
+
+
+class AhoCorasick:
+    """Multi-pattern string automaton: finds every occurrence of every pattern in one pass"""
+
+    def __init__(self):
+        # Trie as parallel lists indexed by state number
+        self._goto = [{}]
+        self._fail = [0]
+        # state -> ids of patterns ending at that state (including via fail links)
+        self._out = [[]]
+        self.patterns = []
+        self._built = False
+
+    def add(self, pattern):
+        """
+        Add a pattern before build()
+
+        Args:
+            pattern (str): Non-empty pattern
+
+        Returns:
+            int: Pattern id reported by iter_matches
+        """
+        if self._built:
+            raise RuntimeError("Cannot add patterns after the automaton is built")
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._out[state].append(pattern_id)
+        return pattern_id
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """
+        Scan text once
+
+        Args:
+            text (str): Text to scan
+
+        Yields:
+            tuple: (end offset, pattern id) for every occurrence, overlapping ones included
+        """
+        if not self._built:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                yield position + 1, pattern_id
+
+
+class TranslationMatcher:
+    """Aho–Corasick automaton over every translation in the sheet, in all languages"""
+
+    def __init__(self, index, min_length=2):
+        """
+        Args:
+            index (TranslationIndex): Translation lookups to build the automaton from
+            min_length (int): Skip translations shorter than this (avoids noise from one-letter entries)
+        """
+        self.normalize = index.normalize
+        self.automaton = AhoCorasick()
+        # pattern id -> [(key, language)]
+        self.owners = []
+        pattern_ids = {}
+        for lang in LANGUAGES:
+            for text, keys in index.text_index[lang].items():
+                if len(text) < min_length:
+                    continue
+                pattern_id = pattern_ids.get(text)
+                if pattern_id is None:
+                    pattern_id = pattern_ids[text] = self.automaton.add(text)
+                    self.owners.append([])
+                self.owners[pattern_id].extend((key, lang) for key in keys)
+        self.automaton.build()
+
+    def __len__(self):
+        return len(self.automaton.patterns)
+
+    @staticmethod
+    def _on_word_boundary(text, start, end):
+        """Latin-script hits must not start or end inside a word ("in" in "login")"""
+        pattern_start, pattern_end = text[start], text[end - 1]
+        if pattern_start.isascii() and pattern_start.isalnum() and start > 0 and text[start - 1].isalnum():
+            return False
+        if pattern_end.isascii() and pattern_end.isalnum() and end < len(text) and text[end].isalnum():
+            return False
+        return True
+
+    def _scan(self, normalized, language=None):
+        for end, pattern_id in self.automaton.iter_matches(normalized):
+            start = end - len(self.automaton.patterns[pattern_id])
+            if not self._on_word_boundary(normalized, start, end):
+                continue
+            for key, lang in self.owners[pattern_id]:
+                if language is None or lang == language:
+                    yield Match(start, end, key, lang, self.automaton.patterns[pattern_id])
+
+    def find_all(self, text, language=None):
+        """
+        Find every sheet translation contained in a text
+
+        Args:
+            text (str): Text to scan (normalized first)
+            language (str): Only report hits in this language, or None for all
+
+        Returns:
+            list: Match tuples in order of their end offset
+        """
+        return list(self._scan(self.normalize(text), language))
+
+    def best_match(self, text, language=None):
+        """Get the longest translation contained in the text, or None"""
+        matches = self.find_all(text, language)
+        return max(matches, key=lambda match: match.end - match.start) if matches else None
+
+    def scan_items(self, texts, language=None):
+        """
+        Scan many strings (e.g. all texts of a page) in a single pass
+
+        Args:
+            texts (list): Strings to scan
+            language (str): Only report hits in this language, or None for all
+
+        Returns:
+            list: Match lists, one per input string, with offsets relative to that string
+        """
+        normalized = [self.normalize(text) for text in texts]
+        starts = []
+        offset = 0
+        for text in normalized:
+            starts.append(offset)
+            offset += len(text) + len(ITEM_SEPARATOR)
+
+        hits = [[] for _ in texts]
+        item = 0
+        for match in self._scan(ITEM_SEPARATOR.join(normalized), language):
+            # Hits arrive in end-offset order, so the owning item only moves forward
+            while item + 1 < len(starts) and match.start >= starts[item + 1]:
+                item += 1
+            base = starts[item]
+            hits[item].append(match._replace(start=match.start - base, end=match.end - base))
+        return hits
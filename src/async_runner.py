@@ -0,0 +1,192 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+from src.browser_manager import build_work_units, collect_unit_results, configure_tester, get_browser_driver
+from src.driver_resolver import DriverResolver
+from src.page_readiness import PageReadiness
+from src.results import new_results
+
+logger = logging.getLogger()
+
+
+class AsyncBrowserSession:
+    """
+    One browser session driven from the event loop
+
+    Selenium has no async client, so each WebDriver call runs on a shared
+    thread pool. Waiting between calls (page readiness polling) happens with
+    asyncio.sleep, so no thread is held while a page settles.
+    """
+
+    def __init__(self, browser, config, executor):
+        self.browser = browser
+        self.config = config
+        self.executor = executor
+        self.tester = None
+        self.readiness = None
+
+    async def call(self, func, *args, **kwargs):
+        """Run one blocking WebDriver call on the thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def start(self):
+        """Launch the driver, load translations and log in"""
+        from src.tester import TranslationTester
+
+        driver = await self.call(
+            get_browser_driver, self.browser, self.config.get('headless', False), DriverResolver.from_config(self.config)
+        )
+        tester = TranslationTester(
+            self.config.get('base_url', ''),
+            self.config.get('excel_path', ''),
+            self.config.get('username', ''),
+            self.config.get('password', '')
+        )
+        tester.driver = driver
+        tester.browser_name = self.browser
+        configure_tester(tester, self.config)
+        tester.defer_page_waits = True
+        self.tester = tester
+        self.readiness = tester.page_readiness()
+
+        await self.call(tester.load_translations)
+        if not await self.call(tester.authenticate):
+            raise RuntimeError("Login failed")
+        await self.wait_until_ready()
+
+    async def _poll(self, condition, timeout, description):
+        """Poll the page's readiness state cooperatively until condition holds"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                if condition(await self.call(self.readiness.state)):
+                    return True
+            except Exception as e:
+                # Scripts can fail while a new document is loading; keep polling
+                logger.debug(f"Readiness poll failed: {str(e)}")
+            if loop.time() >= deadline:
+                logger.warning(f"Timed out after {timeout}s waiting for {description}")
+                return False
+            await asyncio.sleep(self.readiness.poll_interval)
+
+    async def wait_until_ready(self, language_code=None):
+        """Async counterpart of PageReadiness.wait_until_ready"""
+        if language_code and not self.readiness.lang_missing:
+            matched = await self._poll(
+                lambda state: PageReadiness.matches_lang(state, language_code),
+                self.readiness.lang_timeout,
+                f"html[lang] to change to {language_code}"
+            )
+            if not matched:
+                await self.call(self.readiness.detect_missing_lang)
+        return await self._poll(self.readiness.is_settled, self.readiness.timeout, "page to settle")
+
+    async def run_unit(self, language, path):
+        """Check one page in one language; returns the unit's results"""
+        tester = self.tester
+        tester.results = new_results()
+
+        if not await self.call(tester.navigate_to_page, list(path)):
+            raise RuntimeError(f"Failed to navigate to {' > '.join(path)}")
+        await self.wait_until_ready()
+
+        if not await self.call(tester.change_language, language):
+            raise RuntimeError(f"Failed to change language to {language}")
+        await self.wait_until_ready(language)
+
+        await self.call(tester.check_page, language)
+        return tester.results
+
+    async def close(self):
+        if self.tester and self.tester.driver:
+            try:
+                await self.call(self.tester.driver.quit)
+            except Exception as e:
+                logger.warning(f"Failed to quit {self.browser} driver: {str(e)}")
+
+
+async def _session_worker(browser, work_queue, unit_results, config, executor, unit_timeout):
+    """Consume a browser's units with one session; units time out individually"""
+    session = AsyncBrowserSession(browser, config, executor)
+    try:
+        await asyncio.wait_for(session.start(), unit_timeout)
+
+        while not work_queue.empty():
+            unit = work_queue.get_nowait()
+            _, language, path = unit
+            try:
+                unit_results[unit] = await asyncio.wait_for(session.run_unit(language, path), unit_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Unit {unit} timed out after {unit_timeout}s")
+                unit_results[unit] = TimeoutError(f"Timed out after {unit_timeout}s")
+                # A WebDriver call may still be running on the pool; retire this session
+                return
+            except Exception as e:
+                logger.error(f"Unit {unit} failed: {str(e)}")
+                unit_results[unit] = e
+    except asyncio.CancelledError:
+        logger.info(f"Session for {browser} cancelled")
+        raise
+    except Exception as e:
+        # Leave the remaining units to the other sessions of this browser
+        logger.error(f"Session for {browser} stopped: {str(e)}")
+    finally:
+        await session.close()
+
+
+async def run_async_tests(config, sessions_per_browser=None, unit_timeout=None):
+    """
+    Run all (browser, language, navigation path) units from a single event loop
+
+    Args:
+        config (dict): Test configuration
+        sessions_per_browser (int): Concurrent browser sessions per browser type
+            (they share config 'async_threads' threads for WebDriver calls)
+        unit_timeout (float): Seconds before a single unit (or session start-up) is abandoned
+
+    Returns:
+        dict: Results for each browser, merged in unit order
+    """
+    units = build_work_units(config)
+    if not units:
+        logger.warning("No browsers or navigation paths specified for testing")
+        return {}
+
+    sessions_per_browser = sessions_per_browser or config.get('workers_per_browser', 1)
+    unit_timeout = unit_timeout or config.get('unit_timeout', 300)
+    browsers = list(dict.fromkeys(browser for browser, _, _ in units))
+
+    queues = {browser: asyncio.Queue() for browser in browsers}
+    for unit in units:
+        queues[unit[0]].put_nowait(unit)
+
+    unit_results = {}
+    # Threads only carry individual WebDriver calls, so a few serve many sessions;
+    # page-settle waits are awaited on the event loop
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=config.get('async_threads') or 8)
+    tasks = [
+        asyncio.create_task(_session_worker(browser, queues[browser], unit_results, config, executor, unit_timeout))
+        for browser in browsers
+        for _ in range(sessions_per_browser)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        # Never join the pool on the event loop: after a timeout or cancel a hung
+        # WebDriver call would block it until the call returns
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return collect_unit_results(units, unit_results, config)
+
+
+def run_async(config, sessions_per_browser=None, unit_timeout=None):
+    """Synchronous entry point for run_async_tests"""
+    return asyncio.run(run_async_tests(config, sessions_per_browser, unit_timeout))
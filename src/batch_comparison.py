@@ -0,0 +1,121 @@
+import time
+import pandas as pd
+from src.comparison import compare_item
+from src.results import LANGUAGE_LABELS
+from src.translation_index import LANGUAGES
+
+
+class BatchComparer:
+    """
+    Compares all strings of a page against the index in one vectorized pass
+
+    Known texts per language are held in a hashed pandas Index and each
+    key's expected text in a Series, so membership and key checks for the
+    whole page are a single get_indexer/map call instead of a Python loop.
+    Only the strings that fail go through the per-item path, which records
+    the mismatch details.
+    """
+
+    def __init__(self, index):
+        """
+        Args:
+            index (TranslationIndex): Translation lookups to vectorize
+        """
+        self.index = index
+        # language -> hashed Index of every normalized translation
+        self.known = {lang: pd.Index(list(index.text_index[lang]), dtype=object) for lang in LANGUAGES}
+        # language -> Series of key -> normalized expected text
+        self.expected = {
+            lang: pd.Series({key: texts[lang] for key, texts in index.normalized.items()}, dtype=object)
+            for lang in LANGUAGES
+        }
+
+    def match_flags(self, texts, language, keys=None):
+        """
+        Check a page's strings against the index
+
+        Strings whose element carries a known key must equal that key's
+        translation; other strings must be a known translation in the language.
+
+        Args:
+            texts (list): Extracted strings
+            language (str): Language code the page is displayed in
+            keys (list): Translation key per string (None where the element has none)
+
+        Returns:
+            ndarray: Boolean matched flag per string
+        """
+        # Normalization is cached per distinct string, so repeated page text is cheap
+        normalized = pd.Series(texts, dtype=object).map(self.index.normalize)
+        flags = self.known[language].get_indexer(normalized) >= 0
+
+        if keys is not None:
+            keys = pd.Series(keys, dtype=object)
+            expected = self.expected[language]
+            has_key = keys.isin(expected.index).to_numpy()
+            if has_key.any():
+                keyed_match = (keys.map(expected) == normalized).to_numpy()
+                flags[has_key] = keyed_match[has_key]
+        return flags
+
+    def compare(self, results, page, language, items, dynamic=True, record_checks=False):
+        """
+        Compare a page's extracted items and update the results counters
+
+        Args:
+            results (dict): Results structure to update in place
+            page (str): Page the items were found on
+            language (str): Language code the page is displayed in
+            items (list): Extracted elements with 'text' and optional 'element'/'key'
+            dynamic (bool): Match sheet entries with placeholders as templates
+            record_checks (bool): Also append a check record per item to results['checks']
+
+        Returns:
+            dict: The updated results
+        """
+        if not items:
+            return results
+
+        started = time.perf_counter()
+        flags = self.match_flags([item["text"] for item in items], language, [item.get("key") for item in items])
+        matched = int(flags.sum())
+        results["total_elements"] += matched
+        results[f"{language}_matched"] += matched
+
+        # Templates, substring hits and fuzzy ranking only run for the leftovers
+        outcomes = flags.tolist()
+        leftovers = [position for position, flag in enumerate(outcomes) if not flag]
+        page_hits = self.index.matcher().scan_items([items[position]["text"] for position in leftovers])
+        mismatches = {}
+        for position, hits in zip(leftovers, page_hits):
+            outcomes[position] = compare_item(
+                self.index, results, page, language, items[position], hits, dynamic, exact=False
+            )
+            if not outcomes[position]:
+                mismatches[position] = results["mismatches"][-1]
+
+        if record_checks:
+            self._record_checks(results, page, language, items, outcomes, mismatches, time.perf_counter() - started)
+        return results
+
+    def _record_checks(self, results, page, language, items, outcomes, mismatches, elapsed):
+        """Append one check record (see CHECK_FIELDS) per compared item"""
+        checked_at = time.time()
+        compare_ms = round(elapsed * 1000, 3)
+        label = LANGUAGE_LABELS[language]
+        for position, (item, matched) in enumerate(zip(items, outcomes)):
+            mismatch = mismatches.get(position)
+            if mismatch:
+                key, expected = mismatch["key"], mismatch["expected"]
+            else:
+                key = item.get("key")
+                if key not in self.index:
+                    key = self.index.key_for_text(item["text"], language)
+                if not key:
+                    # Only strings matched as a dynamic template get here
+                    template_match = self.index.templates().match(item["text"], language)
+                    key = template_match.key if template_match else None
+                expected = self.index.translation(key, language) if key else ""
+            results["checks"].append((
+                page, label, item.get("element", ""), key or "", expected, item["text"], matched, checked_at, compare_ms
+            ))
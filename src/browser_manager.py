@@ -1,24 +1,35 @@
 import concurrent.futures
+import logging
+import os
+import queue
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from src.comparison_pipeline import ComparisonPipeline
+from src.driver_pool import DriverPool
+from src.driver_resolver import DriverResolver
+from src.report_generator import ReportGenerator
+from src.results import LANGUAGES, merge_results, new_results
+from src.translation_cache import load_translation_table
+from src.translation_index import TranslationIndex
 
-def get_browser_driver(browser_name, headless=False):
+logger = logging.getLogger()
+
+def get_browser_driver(browser_name, headless=False, resolver=None):
     """
     Get WebDriver instance for specified browser
     
     Args:
         browser_name (str): Name of the browser (chrome, firefox, edge)
         headless (bool): Whether to run in headless mode
+        resolver (DriverResolver): Resolves the driver binary (defaults to the standard manifest)
         
     Returns:
         WebDriver: Configured browser driver
     """
     browser_name = browser_name.lower()
+    resolver = resolver or DriverResolver()
     
     if browser_name == 'chrome':
         options = webdriver.ChromeOptions()
@@ -29,7 +40,7 @@ def get_browser_driver(browser_name, headless=False):
         options.add_argument('--disable-extensions')
         options.add_argument('--no-sandbox')
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        return webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        return webdriver.Chrome(service=ChromeService(resolver.resolve('chrome')), options=options)
     
     elif browser_name == 'firefox':
         options = webdriver.FirefoxOptions()
@@ -37,7 +48,7 @@ def get_browser_driver(browser_name, headless=False):
             options.add_argument('--headless')
         options.add_argument('--width=1920')
         options.add_argument('--height=1080')
-        return webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
+        return webdriver.Firefox(service=FirefoxService(resolver.resolve('firefox')), options=options)
     
     elif browser_name == 'edge':
         options = webdriver.EdgeOptions()
@@ -45,59 +56,59 @@ def get_browser_driver(browser_name, headless=False):
             options.add_argument('--headless')
         options.add_argument('--start-maximized')
         options.add_argument('--disable-notifications')
-        return webdriver.Edge(service=EdgeService(EdgeChromiumDriverManager().install()), options=options)
+        return webdriver.Edge(service=EdgeService(resolver.resolve('edge')), options=options)
     
     else:
         raise ValueError(f"Unsupported browser: {browser_name}")
 
-def run_test_on_browser(browser, config):
+def configure_tester(tester, config):
+    """
+    Apply the optional settings from the configuration to a tester
+    
+    Args:
+        tester (TranslationTester): Tester to configure
+        config (dict): Test configuration
+    """
+    tester.headless = config.get('headless', False)
+    tester.wait_time = config.get('wait_time', 10)
+    tester.check_dynamic_content = config.get('check_dynamic_content', True)
+    tester.record_checks = config.get('export_results', False)
+    tester.screenshot_on_mismatch = config.get('screenshot_on_mismatch', True)
+    tester.screenshots_dir = config.get('screenshots_dir', 'screenshots')
+    tester.cache_dir = config.get('cache_dir', '.cache')
+    tester.excel_loader = config.get('excel_loader', 'pandas')
+    tester.extraction_mode = config.get('extraction_mode', 'script')
+    tester.verify_translation_keys = config.get('verify_translation_keys', False)
+    tester.reuse_session = config.get('reuse_session', True)
+    tester.session_file = config.get('session_file', None)
+    tester.session_max_age = config.get('session_max_age', 1800)
+    tester.readiness = config.get('readiness', tester.readiness)
+    tester.normalization = config.get('normalization')
+    tester.driver_resolver = DriverResolver.from_config(config)
+    tester.snapshot_dir = config.get('snapshot_dir')
+    return tester
+
+def run_test_on_browser(browser, config, pool=None):
     """
     Run test on a specific browser
     
     Args:
         browser (str): Browser name
         config (dict): Test configuration
+        pool (DriverPool): Take warm drivers from this pool instead of launching them
     
     Returns:
         dict: Test results for this browser
     """
-    from src.tester import TranslationTester
-    
     logger.info(f"Starting test on {browser}")
     
     try:
-        # Setup driver for this browser
-        driver = get_browser_driver(browser, config.get('headless', False))
-        
-        # Create and configure tester
-        tester = TranslationTester(
-            config.get('base_url', ''),
-            config.get('excel_path', ''),
-            config.get('username', ''),
-            config.get('password', '')
-        )
-        
-        # Use the provided driver
-        tester.driver = driver
-        
-        # Configure additional options
-        tester.headless = config.get('headless', False)
-        tester.wait_time = config.get('wait_time', 10)
-        tester.check_dynamic_content = config.get('check_dynamic_content', True)
-        tester.screenshot_on_mismatch = config.get('screenshot_on_mismatch', True)
-        
-        # Run the test
-        success = tester.run_test()
-        
-        # Get results
-        results = {
-            'browser': browser,
-            'success': success,
-            'results': tester.results,
-            'report_file': tester.report_file if hasattr(tester, 'report_file') else None
-        }
-        
-        logger.info(f"Test on {browser} completed with success={success}")
+        browser_config = dict(config, browsers=[browser])
+        units = build_work_units(browser_config)
+        unit_results = run_units(browser_config, units, pools={browser: pool} if pool else None)
+        results = collect_unit_results(units, unit_results, browser_config).get(browser)
+        if results is None:
+            raise ValueError("No navigation paths specified for testing")
         return results
     
     except Exception as e:
@@ -107,17 +118,15 @@ def run_test_on_browser(browser, config):
             'success': False,
             'error': str(e)
         }
-    finally:
-        if 'driver' in locals() and driver:
-            driver.quit()
 
-def run_parallel_tests(config, concurrency=None):
+def run_parallel_tests(config, concurrency=None, pools=None):
     """
     Run tests in parallel on multiple browsers
     
     Args:
         config (dict): Test configuration
         concurrency (int): Max number of concurrent tests (defaults to number of browsers)
+        pools (dict): Optional browser -> DriverPool to take warm drivers from
     
     Returns:
         dict: Results for each browser
@@ -135,7 +144,7 @@ def run_parallel_tests(config, concurrency=None):
     
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
         future_to_browser = {
-            executor.submit(run_test_on_browser, browser, config): browser
+            executor.submit(run_test_on_browser, browser, config, (pools or {}).get(browser)): browser
             for browser in browsers
         }
         
@@ -153,6 +162,252 @@ def run_parallel_tests(config, concurrency=None):
     
         return results
     
+def build_work_units(config):
+    """
+    Split a test run into (browser, language, navigation path) units
+    
+    Args:
+        config (dict): Test configuration
+    
+    Returns:
+        list: Units in a fixed order, used to merge results deterministically
+    """
+    return [
+        (browser, language, tuple(path))
+        for browser in config.get('browsers', ['chrome'])
+        for path in config.get('navigation_paths', [])
+        for language in LANGUAGES
+    ]
+
+def run_unit(tester, language, path, pipeline=None):
+    """
+    Check one page in one language with an authenticated tester
+    
+    Args:
+        tester (TranslationTester): Logged-in tester
+        language (str): Language code
+        path (tuple): Navigation path
+        pipeline (ComparisonPipeline): Compare on this process pool instead of in the browser thread
+    
+    Returns:
+        dict or Future: Results for this unit only (a Future when a pipeline is used)
+    """
+    tester.results = new_results()
+    if not tester.navigate_to_page(list(path)):
+        raise RuntimeError(f"Failed to navigate to {' > '.join(path)}")
+    if not tester.change_language(language):
+        raise RuntimeError(f"Failed to change language to {language}")
+    if pipeline:
+        return tester.check_page(language, pipeline)
+    tester.check_page(language)
+    return tester.results
+
+def load_translation_index(config):
+    """Load the translation index for the run (through the shared workbook cache)"""
+    _, index = load_translation_table(
+        config.get('excel_path', ''), config.get('cache_dir', '.cache'), config.get('excel_loader', 'pandas'),
+        config.get('normalization')
+    )
+    return index
+
+def create_driver_pools(config, size):
+    """
+    Create one warm driver pool per configured browser
+    
+    Args:
+        config (dict): Test configuration
+        size (int): Drivers per browser
+    
+    Returns:
+        dict: browser -> DriverPool
+    """
+    pool_config = config.get('driver_pool', {})
+    return {
+        browser: DriverPool(
+            lambda browser=browser: get_browser_driver(browser, config.get('headless', False), DriverResolver.from_config(config)),
+            size=size,
+            max_uses=pool_config.get('max_uses', 50),
+            max_memory_mb=pool_config.get('max_memory_mb')
+        )
+        for browser in config.get('browsers', ['chrome'])
+    }
+
+def _shard_worker(browser, work_queue, unit_results, config, pool, pipeline=None):
+    """
+    Worker loop: units until the browser's queue is empty, on a pooled driver
+
+    The driver and its login are kept between units; the pool counts each
+    unit and swaps in a fresh driver (which logs in again, usually from the
+    cached session) once the use or memory limit is reached.
+    """
+    from src.tester import TranslationTester
+    
+    driver = None
+    try:
+        driver = pool.acquire()
+        tester = TranslationTester(
+            config.get('base_url', ''),
+            config.get('excel_path', ''),
+            config.get('username', ''),
+            config.get('password', '')
+        )
+        tester.driver = driver
+        tester.browser_name = browser
+        configure_tester(tester, config)
+        tester.load_translations()
+        
+        if not tester.authenticate():
+            raise RuntimeError("Login failed")
+        
+        units_run = 0
+        while True:
+            try:
+                unit = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            if units_run:
+                previous, driver = driver, None
+                driver = pool.renew(previous)
+                if driver is not previous:
+                    tester.driver = driver
+                    if not tester.authenticate():
+                        work_queue.put(unit)
+                        raise RuntimeError("Login failed on recycled driver")
+            units_run += 1
+            
+            _, language, path = unit
+            try:
+                unit_results[unit] = run_unit(tester, language, path, pipeline)
+            except Exception as e:
+                logger.error(f"Unit {unit} failed: {str(e)}")
+                unit_results[unit] = e
+    except Exception as e:
+        # Leave the remaining units to the other workers of this browser
+        logger.error(f"Worker for {browser} stopped: {str(e)}")
+    finally:
+        if driver:
+            pool.release(driver)
+
+def run_sharded_tests(config, workers_per_browser=None, pools=None):
+    """
+    Run (browser, language, navigation path) units on a pool of drivers per browser
+    
+    Args:
+        config (dict): Test configuration
+        workers_per_browser (int): Drivers per browser type (defaults to config 'workers_per_browser')
+        pools (dict): browser -> DriverPool to reuse warm drivers across runs (created and closed here if omitted)
+    
+    Returns:
+        dict: Results for each browser, merged in unit order
+    """
+    units = build_work_units(config)
+    if not units:
+        logger.warning("No browsers or navigation paths specified for testing")
+        return {}
+    
+    unit_results = run_units(config, units, workers_per_browser, pools)
+    return collect_unit_results(units, unit_results, config)
+
+def run_units(config, units, workers_per_browser=None, pools=None):
+    """
+    Execute work units on a pool of drivers per browser
+    
+    Args:
+        config (dict): Test configuration
+        units (list): (browser, language, navigation path) units to run
+        workers_per_browser (int): Drivers per browser type (defaults to config 'workers_per_browser')
+        pools (dict): browser -> DriverPool to reuse warm drivers across runs (created and closed here if omitted)
+    
+    Returns:
+        dict: unit -> results dict, or the exception that failed it
+    """
+    if not units:
+        return {}
+    
+    workers_per_browser = workers_per_browser or config.get('workers_per_browser', 1)
+    browsers = list(dict.fromkeys(browser for browser, _, _ in units))
+    
+    # One queue per browser type: any driver of that type may take any of its units
+    queues = {browser: queue.Queue() for browser in browsers}
+    for unit in units:
+        queues[unit[0]].put(unit)
+    
+    owned_pools = pools is None
+    if owned_pools:
+        pools = create_driver_pools(dict(config, browsers=browsers), workers_per_browser)
+        for pool in pools.values():
+            pool.prestart()
+    
+    # Optional process pool so fuzzy matching and diffing never stall the browser threads
+    comparison_workers = config.get('comparison_workers', 0)
+    pipeline = ComparisonPipeline(
+        load_translation_index(config), comparison_workers,
+        config.get('check_dynamic_content', True), config.get('export_results', False)
+    ) if comparison_workers else None
+    
+    unit_results = {}
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers_per_browser * len(browsers)) as executor:
+            futures = [
+                executor.submit(_shard_worker, browser, queues[browser], unit_results, config, pools[browser], pipeline)
+                for browser in browsers
+                for _ in range(workers_per_browser)
+            ]
+            concurrent.futures.wait(futures)
+        
+        # Wait for comparisons still running on the process pool
+        for unit, unit_result in unit_results.items():
+            if isinstance(unit_result, concurrent.futures.Future):
+                try:
+                    unit_results[unit] = unit_result.result()
+                except Exception as e:
+                    logger.error(f"Comparison for unit {unit} failed: {str(e)}")
+                    unit_results[unit] = e
+        return unit_results
+    finally:
+        if owned_pools:
+            for pool in pools.values():
+                pool.close()
+        if pipeline:
+            pipeline.close()
+
+def collect_unit_results(units, unit_results, config):
+    """
+    Merge per-unit results into per-browser results and generate their reports
+    
+    Args:
+        units (list): Units in build_work_units order
+        unit_results (dict): unit -> results dict, or the exception that failed it
+        config (dict): Test configuration
+    
+    Returns:
+        dict: Results for each browser
+    """
+    browsers = list(dict.fromkeys(browser for browser, _, _ in units))
+    results = {
+        browser: {'browser': browser, 'success': True, 'results': new_results(), 'failed_units': []}
+        for browser in browsers
+    }
+    for unit in units:
+        browser_results = results[unit[0]]
+        unit_result = unit_results.get(unit)
+        if isinstance(unit_result, dict):
+            merge_results(browser_results['results'], unit_result)
+        else:
+            # Failed, or never run because every worker of this browser stopped
+            browser_results['success'] = False
+            browser_results['failed_units'].append(unit)
+    
+    for browser, browser_results in results.items():
+        if browser_results['results']['mismatches']:
+            browser_results['success'] = False
+        report_config = dict(config, report_dir=os.path.join(config.get('report_dir', 'reports'), browser), browser=browser)
+        browser_results['report_file'] = ReportGenerator(browser_results['results'], report_config).generate()
+        logger.info(f"Test on {browser} completed with success={browser_results['success']}")
+    
+    return results
+    
 def optimize_memory_usage(self):
     """
     Optimize memory usage during test run
@@ -170,16 +425,11 @@ def optimize_memory_usage(self):
             self.driver.set_window_size(1024, 768)  # Smaller window size
         
         # Limit Excel data in memory by using chunked processing
-        if len(self.translations_df) > 5000:
+        if self.translations_df is not None and len(self.translations_df) > 5000:
             # Convert to dict of key translations for faster lookups
-            self.translation_lookup = {}
-            for _, row in self.translations_df.iterrows():
-                key = row['Key']
-                self.translation_lookup[key] = {
-                    'en': row['Original EN'],
-                    'kh': row['KH Confirm from BIC'],
-                    'cn': row['CN Confirm from BIC']
-                }
+            if self.translation_index is None:
+                self.translation_index = TranslationIndex.from_dataframe(self.translations_df)
+            self.translation_lookup = self.translation_index.to_lookup_dict()
             
             # Clear DataFrame to free memory
             self.translations_df = None
@@ -0,0 +1,108 @@
+from src.results import LANGUAGE_LABELS, new_results
+
+
+def item_matches(index, text, language, key=None, dynamic=True, exact=None):
+    """
+    Decide whether one scraped string shows a correct translation
+
+    Elements carrying a known key must show that key's translation; other
+    strings must be a known translation in the language. With dynamic
+    matching, sheet entries with placeholders also match as templates.
+
+    Args:
+        index (TranslationIndex): Translation lookups
+        text (str): Scraped text
+        language (str): Language code the page is displayed in
+        key (str): Translation key carried by the element, if any
+        dynamic (bool): Match sheet entries with placeholders as templates
+        exact (bool): Result of the exact check when the caller already ran it (e.g. vectorized)
+
+    Returns:
+        bool: Whether the text matched
+    """
+    if key in index:
+        expected = index.normalized_translation(key, language)
+        if exact is None:
+            exact = index.normalize(text) == expected
+        return exact or (dynamic and index.templates().matches_text(expected, text))
+
+    if exact is None:
+        exact = index.contains(text, language)
+    return exact or (dynamic and index.templates().match(text, language) is not None)
+
+
+def compare_item(index, results, page, language, item, hits=None, dynamic=True, exact=None):
+    """
+    Check one scraped string against the translation index and update results
+
+    Args:
+        index (TranslationIndex): Translation lookups
+        results (dict): Results structure to update in place
+        page (str): Page the text was found on
+        language (str): Language code the page is displayed in
+        item (dict): Extracted element with 'text' and optional 'element'/'key'
+        hits (list): Translations contained in the text, from TranslationMatcher (found if None)
+        dynamic (bool): Match sheet entries with placeholders ("{n} transactions") as templates
+        exact (bool): Result of the exact check when the caller already ran it (see item_matches)
+
+    Returns:
+        bool: Whether the text matched
+    """
+    text = item["text"]
+    key = item.get("key")
+    results["total_elements"] += 1
+
+    if item_matches(index, text, language, key, dynamic, exact):
+        results[f"{language}_matched"] += 1
+        return True
+
+    # Text belongs to another language (or is unknown): report what was expected
+    if key not in index:
+        key = index.key_for_text(text)
+    if not key and dynamic:
+        # Dynamic string filled into another language's template
+        template_match = index.templates().match(text)
+        key = template_match.key if template_match else None
+    if not key:
+        # Text embeds known translations (e.g. "Welcome back, John"): blame the longest one
+        if hits is None:
+            hits = index.matcher().find_all(text)
+        if hits:
+            key = max(hits, key=lambda hit: hit.end - hit.start).key
+
+    # Nearest sheet entry, so near misses (spacing, punctuation, diacritics) can be ranked
+    closest = index.fuzzy().closest(text, language)
+    if not key and closest:
+        key = closest.key
+
+    results[f"{language}_mismatched"] += 1
+    results["mismatches"].append({
+        "page": page,
+        "element": item.get("element", ""),
+        "language": LANGUAGE_LABELS[language],
+        "key": key or "",
+        "actual": text,
+        "expected": index.translation(key, language) if key else "",
+        "closest_key": closest.key if closest else "",
+        "score": closest.score if closest else 0.0
+    })
+    return False
+
+
+def compare_snapshot(index, snapshot, dynamic=True, record_checks=False):
+    """
+    Compare every string of a page snapshot against the translation index
+
+    Args:
+        index (TranslationIndex): Translation lookups
+        snapshot (dict): 'page', 'language' and extracted 'items'
+        dynamic (bool): Match sheet entries with placeholders as templates
+        record_checks (bool): Keep a per-element check record for the results export
+
+    Returns:
+        dict: Results for this snapshot only
+    """
+    # Vectorized pass over the whole page; only the strings that fail are checked one by one
+    return index.batch().compare(
+        new_results(), snapshot["page"], snapshot["language"], snapshot["items"], dynamic, record_checks
+    )
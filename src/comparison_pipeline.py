@@ -0,0 +1,76 @@
+import concurrent.futures
+import logging
+from src.comparison import compare_snapshot
+from src.results import merge_results, new_results
+
+logger = logging.getLogger()
+
+# Read-only translation index of the current worker process, set once by the initializer
+_worker_index = None
+_worker_dynamic = True
+_worker_record_checks = False
+
+
+def _init_worker(index, dynamic, record_checks):
+    global _worker_index, _worker_dynamic, _worker_record_checks
+    _worker_index = index
+    _worker_dynamic = dynamic
+    _worker_record_checks = record_checks
+
+
+def _compare_in_worker(snapshot):
+    return compare_snapshot(_worker_index, snapshot, _worker_dynamic, _worker_record_checks)
+
+
+class ComparisonPipeline:
+    """
+    Compares page snapshots on a process pool so browser threads never wait on CPU work
+
+    Browser workers only submit raw snapshots; normalization, matching and
+    diffing run in worker processes that each hold one copy of the index.
+    """
+
+    def __init__(self, index, workers=None, dynamic=True, record_checks=False):
+        """
+        Args:
+            index (TranslationIndex): Translation lookups, sent once to each worker process
+            workers (int): Number of processes (defaults to the CPU count)
+            dynamic (bool): Match sheet entries with placeholders as templates
+            record_checks (bool): Keep per-element check records for the results export
+        """
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(index, dynamic, record_checks)
+        )
+        self.futures = []
+
+    def submit(self, snapshot):
+        """
+        Queue a snapshot for comparison without waiting for the result
+
+        Args:
+            snapshot (dict): 'page', 'language' and extracted 'items'
+
+        Returns:
+            Future: Resolves to the snapshot's results
+        """
+        future = self.executor.submit(_compare_in_worker, snapshot)
+        self.futures.append(future)
+        return future
+
+    def results(self):
+        """Wait for every submitted snapshot and merge the results in submission order"""
+        results = new_results()
+        for future in self.futures:
+            merge_results(results, future.result())
+        return results
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,3 +1,9 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger()
+
 class ConfigManager:
     """Configuration manager with validation and defaults"""
     
@@ -6,13 +12,45 @@ class ConfigManager:
         self.config = {
             "base_url": "",
             "excel_path": "CDB-Translate.xlsx",
+            "excel_loader": "pandas",
             "username": "",
             "password": "",
             "browsers": ["chrome"],
+            "workers_per_browser": 1,
+            "async_engine": False,
+            "async_threads": 8,
+            "unit_timeout": 300,
+            "comparison_workers": 0,
+            "snapshot_dir": None,
+            "incremental": False,
+            "incremental_state": ".cache/incremental_state.json",
+            "driver_pool": {
+                "max_uses": 50,
+                "max_memory_mb": None
+            },
             "screenshot_on_mismatch": True,
             "check_dynamic_content": True,
             "headless": False,
             "wait_time": 10,
+            "extraction_mode": "script",
+            "verify_translation_keys": False,
+            "reuse_session": True,
+            "session_file": None,
+            "session_max_age": 1800,
+            "readiness": {
+                "timeout": 10,
+                "lang_timeout": 3,
+                "quiet_period_ms": 300,
+                "poll_interval": 0.1
+            },
+            "normalization": {
+                "unicode_form": "NFC",
+                "strip_zero_width": True,
+                "khmer_reorder": True,
+                "fold_width": True,
+                "fold_punctuation": True,
+                "lowercase": True
+            },
             "navigation_paths": [
                 ["Dashboard"],
                 ["Account"],
@@ -20,7 +58,15 @@ class ConfigManager:
             ],
             "report_dir": "reports",
             "screenshots_dir": "screenshots",
+            "report_bundle": False,
+            "export_results": False,
+            "chartjs_path": None,
+            "thumbnail_size": 480,
+            "thumbnail_format": "webp",
             "logs_dir": "logs",
+            "cache_dir": ".cache",
+            "driver_manifest": ".cache/webdrivers.json",
+            "driver_manifest_ttl": 604800,
             "log_level": "INFO"
         }
         
@@ -38,6 +84,14 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Error loading config file: {str(e)}")
             
+    def get_config(self):
+        """Get the full configuration dictionary"""
+        return self.config
+        
+    def set_config(self, key, value):
+        """Override a single configuration value"""
+        self.config[key] = value
+            
     def validate(self):
         """Validate the configuration"""
         required_fields = ["base_url", "excel_path"]
@@ -54,6 +108,19 @@ class ConfigManager:
         if not os.path.exists(self.config["excel_path"]):
             raise ValueError(f"Excel file not found: {self.config['excel_path']}")
             
+        # Validate Excel loader
+        if self.config["excel_loader"] not in ("pandas", "streaming"):
+            raise ValueError(f"Invalid excel_loader: {self.config['excel_loader']}. Must be 'pandas' or 'streaming'")
+            
+        # Validate extraction mode
+        if self.config["extraction_mode"] not in ("script", "xpath"):
+            raise ValueError(f"Invalid extraction_mode: {self.config['extraction_mode']}. Must be 'script' or 'xpath'")
+            
+        # Validate Unicode normalization form
+        unicode_form = (self.config.get("normalization") or {}).get("unicode_form")
+        if unicode_form and unicode_form not in ("NFC", "NFD", "NFKC", "NFKD"):
+            raise ValueError(f"Invalid normalization unicode_form: {unicode_form}. Must be NFC, NFD, NFKC or NFKD")
+            
         # Validate browsers
         valid_browsers = ["chrome", "firefox", "edge"]
         invalid_browsers = [b for b in self.config["browsers"] if b not in valid_browsers]
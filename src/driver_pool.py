@@ -0,0 +1,190 @@
+import concurrent.futures
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger()
+
+# Clears the page's web storage before a driver is handed to the next test unit
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Chromium exposes the JS heap size; other browsers return null
+JS_HEAP_SCRIPT = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+class DriverPool:
+    """Pool of warm WebDriver instances that are reset and reused between test units"""
+
+    def __init__(self, factory, size=1, max_uses=50, max_memory_mb=None):
+        """
+        Args:
+            factory (callable): Creates a new driver, e.g. lambda: get_browser_driver('chrome', True)
+            size (int): Maximum number of live drivers
+            max_uses (int): Recycle a driver after this many units
+            max_memory_mb (int): Recycle a driver whose JS heap exceeds this size (Chromium only)
+        """
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._live = 0
+        self._lock = threading.Lock()
+
+    def prestart(self):
+        """Launch all drivers up front, in parallel"""
+        with self._lock:
+            missing = self.size - self._live
+            self._live += missing
+        if missing <= 0:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self.factory) for _ in range(missing)]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    driver = future.result()
+                    self._uses[id(driver)] = 0
+                    self._idle.put(driver)
+                except Exception as e:
+                    logger.error(f"Failed to start pooled driver: {str(e)}")
+                    with self._lock:
+                        self._live -= 1
+
+    def _spawn(self):
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def acquire(self, timeout=None):
+        """
+        Get a healthy driver, starting one if the pool is not full
+
+        Args:
+            timeout (float): Max seconds to wait for a driver to be released
+
+        Returns:
+            WebDriver: Driver reserved for the caller until release()
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_spawn = self._live < self.size
+                    if can_spawn:
+                        self._live += 1
+                if can_spawn:
+                    try:
+                        return self._spawn()
+                    except Exception:
+                        with self._lock:
+                            self._live -= 1
+                        raise
+                driver = self._idle.get(timeout=timeout)
+
+            if self.is_healthy(driver):
+                return driver
+            logger.warning("Discarding unhealthy pooled driver")
+            self._discard(driver)
+
+    def _count_use(self, driver):
+        """Count one finished unit; returns True if the driver is due for recycling"""
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+        if self._uses[id(driver)] >= self.max_uses:
+            logger.info(f"Recycling driver after {self.max_uses} uses")
+            return True
+
+        memory_mb = self.memory_mb(driver)
+        if self.max_memory_mb and memory_mb and memory_mb > self.max_memory_mb:
+            logger.info(f"Recycling driver using {memory_mb:.0f} MB of JS heap")
+            return True
+        return False
+
+    def renew(self, driver, timeout=None):
+        """
+        Count a finished unit on a driver its worker keeps between units
+
+        Keeping the driver avoids resetting it and logging in again for every
+        unit; the use and memory limits still apply, as they would on release().
+
+        Args:
+            driver (WebDriver): Driver acquired from this pool
+            timeout (float): Max seconds to wait for a replacement
+
+        Returns:
+            WebDriver: The same driver, or a fresh one (not logged in) if it was recycled
+        """
+        if not self._count_use(driver):
+            return driver
+        self._discard(driver)
+        return self.acquire(timeout)
+
+    def release(self, driver):
+        """Return a driver to the pool, resetting or recycling it"""
+        if self._count_use(driver):
+            self._discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+            self._idle.put(driver)
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled driver: {str(e)}")
+            self._discard(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager around acquire() and release()"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    @staticmethod
+    def reset(driver):
+        """Clear cookies and web storage and park the driver on a blank page"""
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.get("about:blank")
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check the driver session still responds"""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def memory_mb(driver):
+        """Get the page's JS heap size in MB, or None if the browser doesn't report it"""
+        try:
+            used = driver.execute_script(JS_HEAP_SCRIPT)
+            return used / (1024 * 1024) if used else None
+        except Exception:
+            return None
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        with self._lock:
+            self._live -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+logger = logging.getLogger()
+
+DRIVER_MANAGERS = {
+    'chrome': ChromeDriverManager,
+    'firefox': GeckoDriverManager,
+    'edge': EdgeChromiumDriverManager
+}
+
+
+class DriverResolver:
+    """Resolves webdriver binary paths once per process and pins them in a local manifest"""
+
+    # (manifest path, browser) -> path already resolved in this process, shared by every driver launch
+    _resolved = {}
+    _lock = threading.Lock()
+
+    def __init__(self, manifest_path=".cache/webdrivers.json", ttl=7 * 24 * 3600):
+        """
+        Args:
+            manifest_path (str): JSON manifest of resolved driver paths
+            ttl (int): Seconds before a manifest entry is re-resolved
+        """
+        self.manifest_path = manifest_path
+        self.ttl = ttl
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a resolver from the test configuration"""
+        return cls(
+            config.get('driver_manifest', ".cache/webdrivers.json"),
+            config.get('driver_manifest_ttl', 7 * 24 * 3600)
+        )
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable driver manifest {self.manifest_path}: {str(e)}")
+            return {}
+
+    def _write_manifest(self, manifest):
+        try:
+            manifest_dir = os.path.dirname(self.manifest_path) or "."
+            os.makedirs(manifest_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2)
+                os.replace(tmp_path, self.manifest_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Failed to write driver manifest: {str(e)}")
+
+    def resolve(self, browser_name):
+        """
+        Get the driver binary path for a browser
+
+        Uses, in order: the path resolved earlier in this process, a fresh
+        manifest entry, a new webdriver-manager install, and finally a stale
+        manifest entry (so air-gapped runners keep working).
+
+        Args:
+            browser_name (str): chrome, firefox or edge
+
+        Returns:
+            str: Path to the driver binary
+        """
+        browser_name = browser_name.lower()
+        if browser_name not in DRIVER_MANAGERS:
+            raise ValueError(f"Unsupported browser: {browser_name}")
+
+        # Resolvers pinned to another manifest must not pick up this one's paths
+        cache_key = (os.path.abspath(self.manifest_path), browser_name)
+        with self._lock:
+            path = self._resolved.get(cache_key)
+            if path:
+                return path
+
+            manifest = self._read_manifest()
+            entry = manifest.get(browser_name)
+            entry_usable = bool(entry) and os.path.exists(entry.get('path', ''))
+
+            if entry_usable and time.time() - entry.get('resolved_at', 0) < self.ttl:
+                path = entry['path']
+            else:
+                try:
+                    path = DRIVER_MANAGERS[browser_name]().install()
+                    manifest[browser_name] = {'path': path, 'resolved_at': time.time()}
+                    self._write_manifest(manifest)
+                    logger.info(f"Resolved {browser_name} driver: {path}")
+                except Exception as e:
+                    if not entry_usable:
+                        raise
+                    path = entry['path']
+                    logger.warning(f"Driver resolution failed ({str(e)}), using pinned {browser_name} driver {path}")
+
+            self._resolved[cache_key] = path
+            return path
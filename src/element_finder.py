@@ -1,3 +1,113 @@
+import functools
+import json
+import logging
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+
+logger = logging.getLogger()
+
+# Walks the DOM once in the browser, applying the same tag/class/visibility rules
+# as the find_page_elements XPath selectors, and returns one record per element.
+EXTRACT_PAGE_TEXT_SCRIPT = """
+const ANY_CHILDREN = new Set(['H1', 'H2', 'H3', 'H4', 'LABEL', 'TH']);
+const LEAF_ONLY = new Set(['BUTTON', 'A', 'P', 'SPAN', 'TD', 'LI']);
+const LEAF_CLASSES = ['label', 'menu-item'];
+
+function isCandidate(el) {
+    if (ANY_CHILDREN.has(el.tagName)) return true;
+    const leaf = el.childElementCount === 0;
+    if (!leaf) return false;
+    if (LEAF_ONLY.has(el.tagName)) return true;
+    const cls = typeof el.className === 'string' ? el.className : '';
+    return LEAF_CLASSES.some(name => cls.includes(name));
+}
+
+function isVisible(el) {
+    if (el.getClientRects().length === 0) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+
+function xpathOf(el) {
+    const parts = [];
+    for (; el && el.nodeType === 1; el = el.parentNode) {
+        let index = 1;
+        for (let sib = el.previousElementSibling; sib; sib = sib.previousElementSibling) {
+            if (sib.tagName === el.tagName) index++;
+        }
+        parts.unshift(el.tagName.toLowerCase() + '[' + index + ']');
+    }
+    return '/' + parts.join('/');
+}
+
+function i18nKey(el) {
+    const key = el.getAttribute('data-i18n') || el.getAttribute('data-translation-key');
+    if (key) return key;
+    const cls = typeof el.className === 'string' ? el.className.split(/\\s+/) : [];
+    const match = cls.find(name => name.startsWith('i18n-'));
+    if (match) return match.slice(5);
+    return el.id && el.id.startsWith('i18n.') ? el.id.slice(5) : null;
+}
+
+const results = [];
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT, {
+    acceptNode(el) {
+        // Skip whole subtrees hidden with inline display: none, like the XPath ancestor rule
+        if ((el.getAttribute('style') || '').includes('display: none')) return NodeFilter.FILTER_REJECT;
+        return NodeFilter.FILTER_ACCEPT;
+    }
+});
+for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+    if (!isCandidate(el)) continue;
+    const text = (el.innerText || '').trim();
+    if (!text || !isVisible(el)) continue;
+    const rect = el.getBoundingClientRect();
+    results.push({
+        xpath: xpathOf(el),
+        tag: el.tagName.toLowerCase(),
+        text: text,
+        key: i18nKey(el),
+        rect: [Math.round(rect.x), Math.round(rect.y), Math.round(rect.width), Math.round(rect.height)]
+    });
+}
+return JSON.stringify(results);
+"""
+
+# Resolves many translation keys in one pass over the DOM. Strategies are tried in the
+# same order as find_by_translation_key and the first one with hits wins per key.
+FIND_BY_TRANSLATION_KEYS_SCRIPT = """
+const wanted = new Set(arguments[0]);
+const strategies = [{}, {}, {}, {}];
+
+function add(map, key, el) {
+    if (!wanted.has(key)) return;
+    (map[key] = map[key] || []).push((el.innerText || el.textContent || '').trim());
+}
+
+for (const el of document.querySelectorAll('[data-i18n], [data-translation-key], [class*="i18n-"], [id^="i18n."]')) {
+    const i18n = el.getAttribute('data-i18n');
+    if (i18n) add(strategies[0], i18n, el);
+    const translationKey = el.getAttribute('data-translation-key');
+    if (translationKey) add(strategies[1], translationKey, el);
+    if (el.classList) {
+        for (const name of el.classList) {
+            if (name.startsWith('i18n-')) add(strategies[2], name.slice(5), el);
+        }
+    }
+    if (el.id && el.id.startsWith('i18n.')) add(strategies[3], el.id.slice(5), el);
+}
+
+const found = {};
+for (const key of wanted) {
+    const hit = strategies.find(map => map[key]);
+    if (hit) found[key] = hit[key];
+}
+return JSON.stringify(found);
+"""
+
 class ElementFinder:
     def __init__(self, driver, wait_time=10):
         self.driver = driver
@@ -19,6 +129,22 @@ class ElementFinder:
         
         return []
     
+    def find_texts_by_translation_keys(self, keys):
+        """
+        Resolve many translation keys to element texts in a single script call.
+
+        Args:
+            keys (iterable): Translation keys to look up
+
+        Returns:
+            dict: key -> list of element texts, for keys present on the page
+        """
+        try:
+            return json.loads(self.driver.execute_script(FIND_BY_TRANSLATION_KEYS_SCRIPT, list(keys)) or "{}")
+        except Exception as e:
+            logger.warning(f"Bulk translation key lookup failed: {str(e)}")
+            return {}
+    
     def find_page_elements(self):
         """Find all translatable elements on the current page."""
         # Improved selector list with better coverage
@@ -57,6 +183,29 @@ class ElementFinder:
         # Filter out empty or invisible elements
         return [e for e in elements if e.text.strip() and e.is_displayed()]
     
+    def extract_page_texts(self):
+        """
+        Extract all translatable text on the current page in a single script call.
+
+        Errors are not swallowed: an empty list would record the page as
+        having nothing to check, so a failed extraction must fail the unit.
+
+        Returns:
+            list: Dicts with xpath, tag, text, key (i18n key or None) and rect [x, y, width, height]
+        """
+        try:
+            return json.loads(self.driver.execute_script(EXTRACT_PAGE_TEXT_SCRIPT) or "[]")
+        except Exception as e:
+            raise RuntimeError(f"Script text extraction failed: {str(e)}") from e
+    
+    def find_elements_safe(self, by, value):
+        """Find elements, returning an empty list instead of raising"""
+        try:
+            return self.driver.find_elements(by, value)
+        except Exception as e:
+            logger.warning(f"Elements lookup failed: {by}={value}: {str(e)}")
+            return []
+    
     # Add a retry decorator for flaky operations
 def retry(max_attempts=3, delay=1, backoff=2, exceptions=(Exception,)):
     """
@@ -1,3 +1,68 @@
+import html
+import logging
+import re
+import pandas as pd
+from openpyxl import load_workbook
+from src.translation_index import TranslationIndex
+
+logger = logging.getLogger()
+
+REQUIRED_COLUMNS = ["Key", "Original EN", "Original CN", "Original KH", "KH Confirm from BIC", "CN Confirm from BIC"]
+
+# Columns compared against the page; other columns are left untouched
+NORMALIZED_COLUMNS = ["Key", "Original EN", "KH Confirm from BIC", "CN Confirm from BIC"]
+
+# Text clean-up applied by load_translations; part of the parsed-workbook cache key
+NORMALIZATION_SETTINGS = {
+    "columns": NORMALIZED_COLUMNS,
+    "fill_empty": True,
+    "strip": True,
+    "collapse_whitespace": True,
+    "unescape_html": True
+}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def is_text_column(series):
+    """
+    Check whether a column holds text
+
+    Object columns and pandas' string dtype both count (newer pandas, or
+    future.infer_string, reads text columns as strings rather than objects).
+    """
+    return pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)
+
+
+def normalize_columns(df, columns=None, unescape_html=True):
+    """
+    Vectorized text clean-up shared by the DataFrame loaders
+
+    Replaces NaN with '', collapses whitespace, trims and (optionally)
+    unescapes HTML entities using pandas .str operations.
+
+    Args:
+        df (DataFrame): Translations dataframe, modified in place
+        columns (list): Columns to normalize (defaults to NORMALIZED_COLUMNS)
+        unescape_html (bool): Whether to decode HTML entities
+
+    Returns:
+        DataFrame: The same dataframe
+    """
+    for col in columns or NORMALIZED_COLUMNS:
+        if col not in df.columns or not is_text_column(df[col]):
+            continue
+        text = df[col].fillna('').astype(str)
+        text = text.str.replace(_WHITESPACE_RE, ' ', regex=True).str.strip()
+        if unescape_html:
+            # Only cells containing '&' can hold an entity
+            has_entity = text.str.contains('&', regex=False)
+            if has_entity.any():
+                text[has_entity] = text[has_entity].map(html.unescape)
+        df[col] = text
+    return df
+
+
 def parse_excel_with_validation(excel_path):
     """
     Enhanced Excel parser with validation and normalization
@@ -6,39 +71,26 @@ def parse_excel_with_validation(excel_path):
         excel_path (str): Path to the Excel file
         
     Returns:
-        DataFrame: Processed translations dataframe
+        DataFrame: Processed translations dataframe (build lookups with TranslationIndex.from_dataframe)
     """
     try:
         # Load the Excel file
         df = pd.read_excel(excel_path)
         
         # Validate the expected columns exist
-        required_columns = ["Key", "Original EN", "Original CN", "Original KH", "KH Confirm from BIC", "CN Confirm from BIC"]
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
         
         if missing_columns:
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
         # Clean up data
-        for col in df.columns:
-            if df[col].dtype == 'object':  # String columns
-                # Replace NaN with empty string
-                df[col] = df[col].fillna('')
-                # Trim whitespace
-                df[col] = df[col].str.strip()
-                # Normalize whitespace (replace multiple spaces with single space)
-                df[col] = df[col].apply(lambda x: re.sub(r'\s+', ' ', str(x)) if isinstance(x, str) else x)
+        normalize_columns(df, unescape_html=False)
         
         # Validate keys are unique
         duplicate_keys = df[df.duplicated('Key')]['Key'].tolist()
         if duplicate_keys:
             logger.warning(f"Found duplicate keys in Excel: {duplicate_keys}")
         
-        # Create additional search index for faster lookups
-        df['en_lower'] = df['Original EN'].str.lower()
-        df['kh_lower'] = df['KH Confirm from BIC'].str.lower()
-        df['cn_lower'] = df['CN Confirm from BIC'].str.lower()
-        
         logger.info(f"Successfully parsed Excel with {len(df)} translation entries")
         return df
     
@@ -63,30 +115,13 @@ def load_translations(self, excel_path):
             df = pd.read_excel(excel_path, encoding='utf-8')
         
         # Validate the expected columns exist
-        required_columns = ["Key", "Original EN", "Original CN", "Original KH", 
-                            "KH Confirm from BIC", "CN Confirm from BIC"]
-        
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
         
         if missing_columns:
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
         # Clean and normalize data
-        for col in df.columns:
-            if df[col].dtype == 'object':  # String columns
-                # Replace NaN with empty string
-                df[col] = df[col].fillna('')
-                # Trim whitespace
-                df[col] = df[col].str.strip()
-                # Normalize whitespace
-                df[col] = df[col].apply(lambda x: re.sub(r'\s+', ' ', str(x)) if isinstance(x, str) else x)
-                # Handle HTML entities
-                df[col] = df[col].apply(lambda x: html.unescape(str(x)) if isinstance(x, str) else x)
-        
-        # Create search indexes for faster lookups
-        df['en_lower'] = df['Original EN'].str.lower()
-        df['kh_lower'] = df['KH Confirm from BIC'].str.lower()
-        df['cn_lower'] = df['CN Confirm from BIC'].str.lower()
+        normalize_columns(df, unescape_html=NORMALIZATION_SETTINGS["unescape_html"])
         
         # Check for duplicate keys and warn
         duplicate_keys = df[df.duplicated('Key')]['Key'].tolist()
@@ -104,4 +139,78 @@ def load_translations(self, excel_path):
     
     except Exception as e:
         logger.error(f"Failed to load translations: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+def normalize_cell(value):
+    """
+    Apply the NORMALIZATION_SETTINGS clean-up to a single cell value
+
+    Args:
+        value: Raw cell value
+
+    Returns:
+        str: Cleaned text ('' for empty cells)
+    """
+    if value is None:
+        return ''
+    text = _WHITESPACE_RE.sub(' ', str(value).strip())
+    return html.unescape(text) if '&' in text else text
+
+
+def stream_translation_index(excel_path, sheet_name=None, normalization=None):
+    """
+    Stream the required columns of a workbook straight into a TranslationIndex
+
+    Uses openpyxl's read-only mode so only one row is held in memory at a time
+    and unrelated columns and sheets are never materialized.
+
+    Args:
+        excel_path (str): Path to the Excel file
+        sheet_name (str): Sheet to read (defaults to the first sheet, like pd.read_excel)
+        normalization (dict): TextNormalizer settings for the index
+
+    Returns:
+        TranslationIndex: Index built from the sheet
+    """
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+
+        header = next(rows, None) or ()
+        positions = {}
+        for position, name in enumerate(header):
+            name = str(name).strip() if name is not None else ''
+            if name in REQUIRED_COLUMNS and name not in positions:
+                positions[name] = position
+
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in positions]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+        # Stop reading each row after the last required column
+        last_column = max(positions.values()) + 1
+        rows = worksheet.iter_rows(min_row=2, max_col=last_column, values_only=True)
+
+        index = TranslationIndex(normalization)
+        row_count = 0
+        for row in rows:
+            values = {name: normalize_cell(row[position]) if position < len(row) else ''
+                      for name, position in positions.items()}
+            if not values["Key"]:
+                continue
+            index.add(values["Key"], {
+                'en': values["Original EN"],
+                'kh': values["KH Confirm from BIC"],
+                'cn': values["CN Confirm from BIC"]
+            })
+            row_count += 1
+
+        if row_count > len(index):
+            logger.warning(f"Found {row_count - len(index)} duplicate keys in Excel")
+
+        logger.info(f"Streamed {len(index)} translation entries from {excel_path}")
+        return index
+    finally:
+        workbook.close()
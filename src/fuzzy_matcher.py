@@ -0,0 +1,184 @@
+from collections import Counter, namedtuple
+from src.translation_index import LANGUAGES
+
+# Nearest sheet entry for a string; score is 1 - distance / length of the longer string
+FuzzyMatch = namedtuple('FuzzyMatch', ['key', 'language', 'text', 'distance', 'score'])
+
+# Pads strings so short ones still produce n-grams and edges weigh more
+_PAD_START = "\x02"
+_PAD_END = "\x03"
+
+
+def ngrams(text, n=3):
+    """
+    Split a normalized string into its set of character n-grams
+
+    Args:
+        text (str): Normalized text
+        n (int): Gram length
+
+    Returns:
+        set: Distinct n-grams of the padded text
+    """
+    padded = _PAD_START * (n - 1) + text + _PAD_END * (n - 1)
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def bounded_levenshtein(a, b, max_distance):
+    """
+    Edit distance between two strings, giving up once it must exceed a bound
+
+    Only a band of width 2 * max_distance + 1 around the diagonal is computed.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+        max_distance (int): Largest distance of interest
+
+    Returns:
+        int: The distance, or None if it is greater than max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return len(b)
+
+    over = max_distance + 1
+    previous = list(range(len(a) + 1))
+    for i, char in enumerate(b, 1):
+        current = [over] * (len(a) + 1)
+        if i <= max_distance:
+            current[0] = i
+        low = max(1, i - max_distance)
+        high = min(len(a), i + max_distance)
+        row_min = current[low - 1]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (a[j - 1] != char)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost if cost < over else over
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[len(a)]
+    return distance if distance <= max_distance else None
+
+
+class FuzzyMatcher:
+    """Finds the nearest sheet translation to a string with a trigram index and bounded edit distance"""
+
+    def __init__(self, index, threshold=0.75, n=3, max_candidates=12, max_posting=2000, cache_size=10000):
+        """
+        Args:
+            index (TranslationIndex): Translation lookups to build the n-gram index from
+            threshold (float): Lowest similarity score reported as a match
+            n (int): Gram length
+            max_candidates (int): Candidates verified with edit distance per query
+            max_posting (int): Grams shared by more entries than this are too common to rank candidates
+            cache_size (int): Queries remembered (pages repeat the same strings)
+        """
+        self.normalize = index.normalize
+        self.threshold = threshold
+        self.n = n
+        self.max_candidates = max_candidates
+        self.max_posting = max_posting
+        self.cache_size = cache_size
+        self._cache = {}
+
+        # entry id -> normalized text, and -> [(key, language)]
+        self.texts = []
+        self.owners = []
+        # gram -> [entry ids]
+        self.grams = {}
+
+        entry_ids = {}
+        for lang in LANGUAGES:
+            for text, keys in index.text_index[lang].items():
+                entry_id = entry_ids.get(text)
+                if entry_id is None:
+                    entry_id = entry_ids[text] = len(self.texts)
+                    self.texts.append(text)
+                    self.owners.append([])
+                    for gram in ngrams(text, n):
+                        self.grams.setdefault(gram, []).append(entry_id)
+                self.owners[entry_id].extend((key, lang) for key in keys)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def candidates(self, normalized):
+        """
+        Rank sheet entries by the number of n-grams they share with a string
+
+        Args:
+            normalized (str): Normalized query text
+
+        Returns:
+            list: Entry ids, most shared grams first
+        """
+        postings = sorted(
+            (self.grams[gram] for gram in ngrams(normalized, self.n) if gram in self.grams),
+            key=len
+        )
+        # Count only the rarer half of the grams: a string within a few edits still shares
+        # most of them, and common grams would dominate the cost without changing the ranking
+        keep = max(self.n + 1, len(postings) // 2)
+        rare = [posting for posting in postings[:keep] if len(posting) <= self.max_posting]
+        counts = Counter()
+        for posting in rare or postings[:1]:
+            counts.update(posting)
+        return [entry_id for entry_id, _ in counts.most_common(self.max_candidates)]
+
+    def closest(self, text, language=None):
+        """
+        Find the sheet translation nearest to a string
+
+        Args:
+            text (str): Scraped text (normalized first)
+            language (str): Prefer this language's entry when one text belongs to several
+
+        Returns:
+            FuzzyMatch: Nearest entry scoring at least the threshold, or None
+        """
+        normalized = self.normalize(text)
+        if not normalized:
+            return None
+        cache_key = (normalized, language)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        best_id, best_distance = None, None
+        for entry_id in self.candidates(normalized):
+            candidate = self.texts[entry_id]
+            longest = max(len(normalized), len(candidate))
+            # Largest distance that still reaches the threshold, tightened by the best so far
+            bound = int((1 - self.threshold) * longest)
+            if best_distance is not None:
+                bound = min(bound, best_distance - 1)
+            if bound < 0:
+                break
+            distance = bounded_levenshtein(normalized, candidate, bound)
+            if distance is not None:
+                best_id, best_distance = entry_id, distance
+                if distance == 0:
+                    break
+
+        match = None
+        if best_id is not None:
+            owners = self.owners[best_id]
+            key, lang = next((owner for owner in owners if owner[1] == language), owners[0])
+            candidate = self.texts[best_id]
+            score = 1 - best_distance / max(len(normalized), len(candidate))
+            match = FuzzyMatch(key, lang, candidate, best_distance, round(score, 4))
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[cache_key] = match
+        return match
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from src.browser_manager import build_work_units, collect_unit_results, load_translation_index, run_units
+from src.snapshot_store import SnapshotStore
+from src.results import LANGUAGES
+
+logger = logging.getLogger()
+
+# Bump when the state file layout changes; older states trigger a full run
+STATE_FORMAT_VERSION = 2
+
+
+def sheet_fingerprint(index):
+    """
+    Hash every sheet entry so changed rows can be found without keeping the old workbook
+
+    Args:
+        index (TranslationIndex): Translation lookups
+
+    Returns:
+        dict: key -> digest of its EN/KH/CN texts
+    """
+    return {
+        key: hashlib.sha1("\x1f".join(entry[lang] for lang in LANGUAGES).encode('utf-8')).hexdigest()
+        for key, entry in index.entries.items()
+    }
+
+
+def changed_keys(old_fingerprint, new_fingerprint):
+    """Get keys that were added, removed or edited between two fingerprints"""
+    keys = set(old_fingerprint) | set(new_fingerprint)
+    return {key for key in keys if old_fingerprint.get(key) != new_fingerprint.get(key)}
+
+
+def keys_on_snapshot(index, snapshot):
+    """Get the sheet keys whose text (in any language) or key attribute appears in a snapshot"""
+    items = snapshot["items"]
+    keys = {item["key"] for item in items if item.get("key") in index}
+    for item, hits in zip(items, index.matcher().scan_items([item["text"] for item in items])):
+        keys.update(index.keys_for_text(item["text"]))
+        # Translations embedded in longer strings are on the page too
+        keys.update(hit.key for hit in hits)
+    return keys
+
+
+def snapshot_page_keys(index, store):
+    """
+    Scan every stored snapshot for the keys it shows under the given sheet
+
+    Args:
+        index (TranslationIndex): Translation lookups (the current sheet)
+        store (SnapshotStore): Snapshots from earlier runs
+
+    Returns:
+        dict: page -> set of keys seen on it in any language or browser
+    """
+    page_keys = {}
+    for snapshot in store.iter_snapshots():
+        page_keys.setdefault(snapshot["page"], set()).update(keys_on_snapshot(index, snapshot))
+    return page_keys
+
+
+def _unit_id(unit):
+    browser, language, path = unit
+    return f"{browser}|{language}|{' > '.join(path)}"
+
+
+class IncrementalState:
+    """Sheet fingerprint, normalization, learned page -> keys map and per-unit results from the previous run"""
+
+    def __init__(self, path):
+        self.path = path
+        self.fingerprint = {}
+        self.normalization = None
+        self.page_keys = {}
+        self.unit_results = {}
+
+    def load(self):
+        """Load the previous run's state; returns False if there is none"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable incremental state {self.path}: {str(e)}")
+            return False
+        if state.get("version") != STATE_FORMAT_VERSION:
+            return False
+        self.fingerprint = state["fingerprint"]
+        self.normalization = state["normalization"]
+        self.page_keys = {page: set(keys) for page, keys in state["page_keys"].items()}
+        self.unit_results = state["unit_results"]
+        return True
+
+    def save(self):
+        """Write the state atomically"""
+        state_dir = os.path.dirname(self.path) or "."
+        os.makedirs(state_dir, exist_ok=True)
+        state = {
+            "version": STATE_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "normalization": self.normalization,
+            "page_keys": {page: sorted(keys) for page, keys in self.page_keys.items()},
+            "unit_results": self.unit_results
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def pages_for_keys(self, keys):
+        """Get the pages on which any of the keys was seen"""
+        return {page for page, page_keys in self.page_keys.items() if page_keys & keys}
+
+
+def run_incremental_tests(config, workers_per_browser=None, pools=None):
+    """
+    Re-check only the navigation paths that show translations changed since the last run
+
+    Units whose page shows no changed key keep their previous results. Pages
+    are matched against changed keys both with the keys learned under the
+    previous sheet (edited and removed keys) and by rescanning the stored
+    snapshots with the current sheet (added keys). The first run, a run
+    after the state is lost, or a change of normalization settings checks
+    everything.
+
+    Args:
+        config (dict): Test configuration
+        workers_per_browser (int): Drivers per browser type
+        pools (dict): browser -> DriverPool to reuse warm drivers
+
+    Returns:
+        dict: Results for each browser over the full matrix
+    """
+    # Snapshots are how the page -> keys map is learned
+    config = dict(config, snapshot_dir=config.get('snapshot_dir') or os.path.join(config.get('cache_dir', '.cache'), "snapshots"))
+    index = load_translation_index(config)
+    fingerprint = sheet_fingerprint(index)
+    normalization = index.normalize.settings
+    store = SnapshotStore(config['snapshot_dir'])
+
+    state = IncrementalState(config.get('incremental_state', ".cache/incremental_state.json"))
+    units = build_work_units(config)
+
+    if not state.load():
+        logger.info("No previous incremental state, checking every unit")
+        to_run = units
+    elif state.normalization != normalization:
+        logger.info("Normalization settings changed, checking every unit")
+        to_run = units
+        # Results matched under the old settings are not carried over
+        state.unit_results = {}
+    else:
+        changed = changed_keys(state.fingerprint, fingerprint)
+        # Added keys are on no learned page yet; the current sheet finds them in the stored snapshots
+        current_page_keys = snapshot_page_keys(index, store) if changed else {}
+        stale_pages = state.pages_for_keys(changed) | {
+            page for page, keys in current_page_keys.items() if keys & changed
+        }
+        to_run = [
+            unit for unit in units
+            if " > ".join(unit[2]) in stale_pages or _unit_id(unit) not in state.unit_results
+        ]
+        logger.info(f"{len(changed)} changed keys affect {len(stale_pages)} pages; re-checking {len(to_run)} of {len(units)} units")
+
+    unit_results = {unit: state.unit_results[_unit_id(unit)] for unit in units if _unit_id(unit) in state.unit_results}
+    fresh_results = run_units(config, to_run, workers_per_browser, pools)
+    unit_results.update(fresh_results)
+
+    # Learn which keys the re-checked pages show, using the sheet they were checked against
+    for page in {" > ".join(unit[2]) for unit in to_run}:
+        page_keys = set()
+        for browser in config.get('browsers', ['chrome']):
+            for language in LANGUAGES:
+                path = store.path_for(page, language, browser)
+                if os.path.exists(path):
+                    page_keys |= keys_on_snapshot(index, store.load(path))
+        state.page_keys[page] = page_keys
+
+    state.fingerprint = fingerprint
+    state.normalization = normalization
+    for unit, unit_result in fresh_results.items():
+        if isinstance(unit_result, dict):
+            state.unit_results[_unit_id(unit)] = unit_result
+        else:
+            # Failed units are retried on the next run
+            state.unit_results.pop(_unit_id(unit), None)
+    state.save()
+
+    return collect_unit_results(units, unit_results, config)
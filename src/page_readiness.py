@@ -0,0 +1,174 @@
+import json
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger()
+
+# Counts in-flight XHR/fetch requests and records the time of the last DOM mutation.
+# Safe to run repeatedly; hooks are installed once per document.
+INSTALL_HOOKS_SCRIPT = """
+(function() {
+if (window.__readinessHooks) return;
+window.__readinessHooks = true;
+window.__pendingRequests = 0;
+window.__lastMutation = performance.now();
+
+const done = () => { window.__pendingRequests = Math.max(0, window.__pendingRequests - 1); };
+
+const send = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function() {
+    window.__pendingRequests++;
+    this.addEventListener('loadend', done, {once: true});
+    return send.apply(this, arguments);
+};
+
+if (window.fetch) {
+    const fetch = window.fetch;
+    window.fetch = function() {
+        window.__pendingRequests++;
+        return fetch.apply(this, arguments).finally(done);
+    };
+}
+
+new MutationObserver(() => { window.__lastMutation = performance.now(); })
+    .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# Re-installs the hooks first, so a full page load during a wait is picked up on the next poll
+READINESS_STATE_SCRIPT = INSTALL_HOOKS_SCRIPT + """
+return JSON.stringify({
+    readyState: document.readyState,
+    pending: window.__pendingRequests,
+    quietMs: performance.now() - window.__lastMutation,
+    lang: (document.documentElement.getAttribute('lang') || '').toLowerCase()
+});
+"""
+
+# html[lang] values the application may use for each language code
+LANG_ATTRIBUTES = {
+    'en': ['en'],
+    'kh': ['kh', 'km'],
+    'cn': ['cn', 'zh']
+}
+
+
+class PageReadiness:
+    """Event-driven page readiness checks used instead of fixed sleeps"""
+
+    def __init__(self, driver, timeout=10, lang_timeout=3, quiet_period_ms=300, poll_interval=0.1):
+        """
+        Args:
+            driver (WebDriver): Browser driver
+            timeout (float): Max seconds to wait for the page to settle
+            lang_timeout (float): Max seconds to wait for html[lang] to change
+            quiet_period_ms (int): Milliseconds without DOM mutations that count as settled
+            poll_interval (float): Seconds between readiness checks
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.lang_timeout = lang_timeout
+        self.quiet_period_ms = quiet_period_ms
+        self.poll_interval = poll_interval
+        # Set once the app is seen not to use html[lang], so language switches stop waiting for it
+        self.lang_missing = False
+
+    def install_hooks(self):
+        """Install the XHR/fetch and mutation hooks in the current document"""
+        try:
+            self.driver.execute_script(INSTALL_HOOKS_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Failed to install readiness hooks: {str(e)}")
+
+    def state(self):
+        """Get the current readiness state of the page"""
+        return json.loads(self.driver.execute_script(READINESS_STATE_SCRIPT))
+
+    def _wait(self, condition, timeout, description):
+        """Poll a condition on the readiness state; log and continue on timeout"""
+        try:
+            # Scripts can fail while a new document is loading; keep polling
+            WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval,
+                          ignored_exceptions=(WebDriverException,)).until(
+                lambda driver: condition(self.state())
+            )
+            return True
+        except TimeoutException:
+            logger.warning(f"Timed out after {timeout}s waiting for {description}")
+            return False
+
+    def is_settled(self, state):
+        """Check a readiness state: document loaded, network idle and DOM quiet"""
+        return state["readyState"] == "complete" and state["pending"] == 0 and state["quietMs"] >= self.quiet_period_ms
+
+    @staticmethod
+    def matches_lang(state, language_code):
+        """Check whether a readiness state's html[lang] matches a language code"""
+        prefixes = LANG_ATTRIBUTES.get(language_code, [language_code])
+        return any(state["lang"].startswith(prefix) for prefix in prefixes)
+
+    def wait_for_document_ready(self, timeout=None):
+        """Wait until document.readyState is 'complete'"""
+        return self._wait(lambda s: s["readyState"] == "complete", timeout or self.timeout, "document ready")
+
+    def wait_for_network_idle(self, timeout=None):
+        """Wait until there are no in-flight XHR/fetch requests"""
+        return self._wait(lambda s: s["pending"] == 0, timeout or self.timeout, "network idle")
+
+    def wait_for_dom_quiescence(self, quiet_period_ms=None, timeout=None):
+        """Wait until the DOM has not changed for the quiet period"""
+        quiet_period_ms = quiet_period_ms or self.quiet_period_ms
+        return self._wait(lambda s: s["quietMs"] >= quiet_period_ms, timeout or self.timeout, "DOM quiescence")
+
+    def wait_for_lang(self, language_code, timeout=None):
+        """
+        Wait until the html[lang] attribute matches a language
+
+        Args:
+            language_code (str): 'en', 'kh' or 'cn'
+            timeout (float): Max seconds to wait (defaults to lang_timeout)
+        """
+        if self.lang_missing:
+            return True
+        matched = self._wait(
+            lambda s: self.matches_lang(s, language_code),
+            timeout or self.lang_timeout,
+            f"html[lang] to change to {language_code}"
+        )
+        if not matched:
+            self.detect_missing_lang()
+        return matched
+
+    def detect_missing_lang(self):
+        """After a timed-out language wait, check whether the page sets html[lang] at all"""
+        try:
+            lang = self.state()["lang"]
+        except Exception:
+            return
+        if not lang:
+            logger.info("The application does not set html[lang]; language switches will not wait for it")
+            self.lang_missing = True
+
+    def wait_until_ready(self, language_code=None, timeout=None):
+        """
+        Wait for the page to settle: document loaded, network idle and DOM quiet
+
+        Args:
+            language_code (str): Also wait for html[lang] to match this language
+            timeout (float): Max seconds to wait (defaults to timeout)
+
+        Returns:
+            bool: True if every signal was observed before its timeout
+        """
+        timeout = timeout or self.timeout
+        ready = self.wait_for_document_ready(timeout)
+        if language_code:
+            ready = self.wait_for_lang(language_code) and ready
+
+        settled = self._wait(
+            self.is_settled,
+            timeout,
+            "network idle and DOM quiescence"
+        )
+        return ready and settled
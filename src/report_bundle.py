@@ -0,0 +1,139 @@
+import hashlib
+import io
+import logging
+import os
+import shutil
+import urllib.request
+import zipfile
+from PIL import Image, features
+
+logger = logging.getLogger()
+
+CHARTJS_URL = "https://cdn.jsdelivr.net/npm/chart.js@4/dist/chart.umd.min.js"
+CHARTJS_NAME = "chart.umd.min.js"
+
+
+def resolve_chartjs(config):
+    """
+    Find a local copy of Chart.js, downloading it into the cache once if needed
+
+    Args:
+        config (dict): Test configuration ('chartjs_path', 'cache_dir')
+
+    Returns:
+        str: Path to chart.umd.min.js, or None if no copy is available (the report then has no chart)
+    """
+    configured = config.get("chartjs_path")
+    if configured and os.path.exists(configured):
+        return configured
+
+    cached = os.path.join(config.get("cache_dir", ".cache"), "assets", CHARTJS_NAME)
+    if os.path.exists(cached):
+        return cached
+
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        tmp_path = cached + ".tmp"
+        with urllib.request.urlopen(CHARTJS_URL, timeout=15) as response, open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response, f)
+        os.replace(tmp_path, cached)
+        logger.info(f"Vendored Chart.js into {cached}")
+        return cached
+    except Exception as e:
+        logger.warning(f"Chart.js is not available offline ({str(e)}); set chartjs_path to bundle the chart")
+        return None
+
+
+class ReportBundle:
+    """
+    Single-file report archive: the HTML report, Chart.js and deduplicated screenshots with thumbnails
+
+    Screenshots are stored once per distinct content (named by SHA-256) and
+    get a downscaled WebP (or JPEG) thumbnail; the report shows thumbnails
+    and only loads a full-size image when it is opened.
+    """
+
+    def __init__(self, archive_path, thumbnail_size=480, thumbnail_format="webp", quality=70):
+        """
+        Args:
+            archive_path (str): Zip file to create
+            thumbnail_size (int): Longest thumbnail side in pixels
+            thumbnail_format (str): 'webp' or 'jpeg' (WebP falls back to JPEG if Pillow lacks support)
+            quality (int): Thumbnail encoder quality
+        """
+        self.archive_path = archive_path
+        self.thumbnail_size = thumbnail_size
+        self.quality = quality
+        self.thumbnail_format = thumbnail_format.lower()
+        if self.thumbnail_format == "webp" and not features.check("webp"):
+            self.thumbnail_format = "jpeg"
+        self.archive = zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED)
+        # source path -> (thumbnail name, full-size name), and content digest -> the same
+        self._by_path = {}
+        self._by_digest = {}
+        self.duplicates = 0
+
+    def add_file(self, arcname, path):
+        """Copy a file into the archive"""
+        self.archive.write(path, arcname)
+
+    def add_screenshot(self, path):
+        """
+        Add a screenshot once per distinct content
+
+        Args:
+            path (str): Screenshot file
+
+        Returns:
+            tuple: (thumbnail name, full-size name) inside the archive, or None if the file is unreadable
+        """
+        if path in self._by_path:
+            return self._by_path[path]
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            logger.warning(f"Skipping screenshot {path}: {str(e)}")
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()[:20]
+        names = self._by_digest.get(digest)
+        if names:
+            self.duplicates += 1
+        else:
+            names = self._by_digest[digest] = self._store_screenshot(digest, data, os.path.splitext(path)[1] or ".png")
+        self._by_path[path] = names
+        return names
+
+    def _store_screenshot(self, digest, data, extension):
+        full_name = f"screenshots/full/{digest}{extension}"
+        # Images are already compressed; deflating them again only costs time
+        self.archive.writestr(zipfile.ZipInfo(full_name), data, compress_type=zipfile.ZIP_STORED)
+
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                image = image.convert("RGB")
+                image.thumbnail((self.thumbnail_size, self.thumbnail_size))
+                buffer = io.BytesIO()
+                image.save(buffer, format=self.thumbnail_format.upper(), quality=self.quality)
+        except Exception as e:
+            logger.warning(f"Failed to create thumbnail for {digest}: {str(e)}")
+            return full_name, full_name
+
+        extension = ".webp" if self.thumbnail_format == "webp" else ".jpg"
+        thumb_name = f"screenshots/thumbs/{digest}{extension}"
+        self.archive.writestr(zipfile.ZipInfo(thumb_name), buffer.getvalue(), compress_type=zipfile.ZIP_STORED)
+        return thumb_name, full_name
+
+    def open_text(self, arcname):
+        """Open a text member for streaming writes (no other member can be written until it is closed)"""
+        return io.TextIOWrapper(self.archive.open(arcname, 'w'), encoding='utf-8')
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,6 +1,213 @@
 import os
+import html
 import json
+import itertools
+import logging
 from datetime import datetime
+from src.report_bundle import CHARTJS_NAME, ReportBundle, resolve_chartjs
+from src.results_export import write_checks_jsonl, write_checks_parquet
+from src.screenshot_registry import ScreenshotRegistry
+
+logger = logging.getLogger()
+
+CHARTJS_CDN_URL = "https://cdn.jsdelivr.net/npm/chart.js"
+
+# Renders the mismatch blob with pagination and virtual scrolling; only visible rows exist in the DOM
+MISMATCH_TABLE_SCRIPT = """
+(function() {
+    const data = JSON.parse(document.getElementById('mismatchData').textContent);
+    const rows = data.rows;
+    const ROW_HEIGHT = 32;
+    const OVERSCAN = 10;
+
+    const search = document.getElementById('mismatchSearch');
+    const languageFilter = document.getElementById('languageFilter');
+    const pageFilter = document.getElementById('pageFilter');
+    const pageSizeSelect = document.getElementById('pageSize');
+    const viewport = document.getElementById('mismatchViewport');
+    const spacer = document.getElementById('mismatchSpacer');
+    const detail = document.getElementById('mismatchDetail');
+
+    // Search index, built once on load: a lowercase haystack per row and row ids per page and language
+    const haystacks = new Array(rows.length);
+    const byPage = new Map();
+    const byLanguage = new Map();
+    function addTo(map, key, id) {
+        let ids = map.get(key);
+        if (!ids) map.set(key, ids = []);
+        ids.push(id);
+    }
+    for (let i = 0; i < rows.length; i++) {
+        const r = rows[i];
+        haystacks[i] = [data.pages[r[0]], r[1], data.languages[r[2]], r[3], r[4], r[5], r[6]].join('\\n').toLowerCase();
+        addTo(byPage, data.pages[r[0]], i);
+        addTo(byLanguage, data.languages[r[2]], i);
+    }
+
+    let filtered = [];
+    let pageIndex = 0;
+
+    function applyFilters() {
+        const query = search.value.trim().toLowerCase();
+        const language = languageFilter.value;
+        const page = pageFilter.value;
+
+        let candidates = null;
+        if (page && language) {
+            const inLanguage = new Set(byLanguage.get(language) || []);
+            candidates = (byPage.get(page) || []).filter(id => inLanguage.has(id));
+        } else if (page) {
+            candidates = byPage.get(page) || [];
+        } else if (language) {
+            candidates = byLanguage.get(language) || [];
+        }
+
+        filtered = [];
+        const count = candidates ? candidates.length : rows.length;
+        for (let n = 0; n < count; n++) {
+            const id = candidates ? candidates[n] : n;
+            if (!query || haystacks[id].includes(query)) filtered.push(id);
+        }
+        pageIndex = 0;
+        renderPage();
+    }
+
+    function pageSize() { return parseInt(pageSizeSelect.value, 10); }
+    function pageCount() { return Math.max(1, Math.ceil(filtered.length / pageSize())); }
+    function pageBounds() {
+        const start = pageIndex * pageSize();
+        return [start, Math.min(filtered.length, start + pageSize())];
+    }
+
+    function renderPage() {
+        const [start, end] = pageBounds();
+        spacer.style.height = ((end - start) * ROW_HEIGHT) + 'px';
+        viewport.scrollTop = 0;
+        document.getElementById('pageInfo').textContent = 'Page ' + (pageIndex + 1) + ' of ' + pageCount();
+        document.getElementById('mismatchCount').textContent = filtered.length + ' of ' + rows.length + ' mismatches';
+        renderVisible();
+    }
+
+    function renderVisible() {
+        const [start, end] = pageBounds();
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const last = Math.min(end - start, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+        const fragment = document.createDocumentFragment();
+        for (let n = first; n < last; n++) {
+            const id = filtered[start + n];
+            const r = rows[id];
+            const row = document.createElement('div');
+            row.className = 'vtable-row';
+            row.style.top = (n * ROW_HEIGHT) + 'px';
+            row.dataset.id = id;
+            for (const value of [data.pages[r[0]], r[1], data.languages[r[2]], r[3], r[4]]) {
+                const cell = document.createElement('div');
+                cell.textContent = value;
+                cell.title = value;
+                row.appendChild(cell);
+            }
+            fragment.appendChild(row);
+        }
+        spacer.replaceChildren(fragment);
+    }
+
+    function showDetail(id) {
+        const r = rows[id];
+        const fields = [
+            ['Page', data.pages[r[0]]], ['Element', r[1]], ['Language', data.languages[r[2]]],
+            ['Key', r[5]], ['Actual', r[3]], ['Expected', r[4]]
+        ];
+        if (r[6]) fields.push(['Closest', r[6] + ' (' + Math.round(r[7] * 100) + '% similar)']);
+
+        const text = document.createElement('div');
+        text.className = 'text-comparison';
+        for (const [label, value] of fields) {
+            const line = document.createElement('p');
+            const strong = document.createElement('strong');
+            strong.textContent = label + ': ';
+            line.append(strong, value || '');
+            text.appendChild(line);
+        }
+        detail.replaceChildren(text);
+
+        if (r[8] >= 0) {
+            // Screenshots are [thumbnail, full size]; the full image only loads when opened
+            const [thumbnail, fullSize] = data.screenshots[r[8]];
+            const visual = document.createElement('div');
+            visual.className = 'visual-comparison';
+            const link = document.createElement('a');
+            link.href = fullSize;
+            link.target = '_blank';
+            const image = document.createElement('img');
+            image.className = 'screenshot';
+            image.loading = 'lazy';
+            image.alt = 'Screenshot of mismatch';
+            image.src = thumbnail;
+            link.appendChild(image);
+            visual.appendChild(link);
+            detail.appendChild(visual);
+        }
+    }
+
+    let scheduled = false;
+    viewport.addEventListener('scroll', () => {
+        if (scheduled) return;
+        scheduled = true;
+        requestAnimationFrame(() => { scheduled = false; renderVisible(); });
+    });
+    viewport.addEventListener('click', event => {
+        const row = event.target.closest('.vtable-row');
+        if (row) showDetail(parseInt(row.dataset.id, 10));
+    });
+
+    let searchTimer = null;
+    search.addEventListener('input', () => {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(applyFilters, 150);
+    });
+    languageFilter.addEventListener('change', applyFilters);
+    pageFilter.addEventListener('change', applyFilters);
+    pageSizeSelect.addEventListener('change', () => { pageIndex = 0; renderPage(); });
+    document.getElementById('prevPage').addEventListener('click', () => {
+        if (pageIndex > 0) { pageIndex--; renderPage(); }
+    });
+    document.getElementById('nextPage').addEventListener('click', () => {
+        if (pageIndex < pageCount() - 1) { pageIndex++; renderPage(); }
+    });
+
+    // Pages tab: fill a page's table the first time it is opened
+    const PAGE_TABLE_LIMIT = 1000;
+    for (const button of document.querySelectorAll('.page-mismatches-toggle')) {
+        button.addEventListener('click', () => {
+            const tbody = button.nextElementSibling.querySelector('tbody');
+            if (tbody.dataset.loaded) return;
+            tbody.dataset.loaded = '1';
+            const ids = byPage.get(button.dataset.page) || [];
+            for (const id of ids.slice(0, PAGE_TABLE_LIMIT)) {
+                const r = rows[id];
+                const tr = document.createElement('tr');
+                for (const value of [r[1], data.languages[r[2]], r[3], r[4]]) {
+                    const td = document.createElement('td');
+                    td.textContent = value;
+                    tr.appendChild(td);
+                }
+                tbody.appendChild(tr);
+            }
+            if (ids.length > PAGE_TABLE_LIMIT) {
+                const tr = document.createElement('tr');
+                const td = document.createElement('td');
+                td.colSpan = 4;
+                td.textContent = (ids.length - PAGE_TABLE_LIMIT) + ' more; filter the Mismatches tab by this page to see them all';
+                tr.appendChild(td);
+                tbody.appendChild(tr);
+            }
+        });
+    }
+
+    applyFilters();
+})();
+"""
+
 
 class ReportGenerator:
     """Generate comprehensive HTML reports with interactive features"""
@@ -17,6 +224,10 @@ class ReportGenerator:
         self.results = results
         self.config = config
         self.report_file = None
+        self.screenshots = None
+        # Set for bundles: screenshot path -> (thumbnail, full size) inside the archive
+        self.screenshot_links = None
+        self.chart_script_src = CHARTJS_CDN_URL
         self.matched_data = self._get_language_data('matched')
         self.mismatched_data = self._get_language_data('mismatched')
 
@@ -73,7 +284,7 @@ class ReportGenerator:
         }
 
     def generate(self):
-        """Generate a detailed HTML report"""
+        """Generate a detailed HTML report, streaming it to disk section by section"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         report_dir = self.config.get("report_dir", "reports")
         
@@ -83,14 +294,131 @@ class ReportGenerator:
         self.report_file = os.path.join(report_dir, f"translation_test_report_{timestamp}.html")
         
         # Calculate statistics
-        total_checks = self.results["total_elements"] * 3  # 3 languages
         total_matches = sum([self.results.get(f"{lang}_matched", 0) for lang in ["en", "kh", "cn"]])
         total_mismatches = sum([self.results.get(f"{lang}_mismatched", 0) for lang in ["en", "kh", "cn"]])
+        # total_elements already counts one check per element and language
+        total_checks = total_matches + total_mismatches
         
         match_percentage = (total_matches / total_checks) * 100 if total_checks > 0 else 0
         
-        # Generate HTML with interactive features
-        html_content = f"""
+        # Loaded once; each mismatch row then resolves its screenshot with a dict lookup
+        self.screenshots = ScreenshotRegistry(self.config.get("screenshots_dir", "screenshots")).load()
+        
+        # Each section is written as it is rendered so memory stays flat however many rows there are
+        if self.config.get("report_bundle", False):
+            self.report_file = self._write_bundle(match_percentage, total_mismatches)
+        else:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                self._write_chunks(f, self._iter_report(match_percentage, total_mismatches))
+        
+        logger.info(f"Report generated: {self.report_file}")
+        
+        if self.config.get("export_results", False):
+            self.export_results(timestamp)
+        return self.report_file
+        
+    def export_results(self, run):
+        """
+        Write the per-element check records next to the report as JSONL and, with pyarrow, Parquet
+
+        Args:
+            run (str): Run identifier stored in every row (the report timestamp)
+
+        Returns:
+            list: Paths of the files written
+        """
+        checks = self.results.get("checks", [])
+        base_path = os.path.splitext(self.report_file)[0]
+        
+        exported = []
+        rows = write_checks_jsonl(checks, base_path + ".jsonl", run)
+        exported.append(base_path + ".jsonl")
+        if write_checks_parquet(checks, base_path + ".parquet", run) is not None:
+            exported.append(base_path + ".parquet")
+        
+        logger.info(f"Exported {rows} check records to {', '.join(exported)}")
+        return exported
+        
+    def _iter_report(self, match_percentage, total_mismatches):
+        """Chain the report sections in document order"""
+        return itertools.chain(
+            [self._render_header(match_percentage, total_mismatches)],
+            self._iter_mismatch_data(),
+            [self._render_pages_start()],
+            self._iter_pages_content(),
+            [self._render_config_start()],
+            self._iter_config_rows(),
+            [self._render_footer()]
+        )
+        
+    def _write_bundle(self, match_percentage, total_mismatches):
+        """
+        Write the report as a self-contained zip for offline review
+
+        Chart.js is included once, screenshots are deduplicated by content and
+        shown as thumbnails, and all links are relative to index.html.
+
+        Returns:
+            str: Path of the archive
+        """
+        archive_path = os.path.splitext(self.report_file)[0] + ".zip"
+        with ReportBundle(
+            archive_path,
+            self.config.get("thumbnail_size", 480),
+            self.config.get("thumbnail_format", "webp")
+        ) as bundle:
+            chartjs = resolve_chartjs(self.config)
+            if chartjs:
+                bundle.add_file(f"assets/{CHARTJS_NAME}", chartjs)
+                self.chart_script_src = f"assets/{CHARTJS_NAME}"
+            else:
+                self.chart_script_src = None
+            
+            # Screenshots go in before the page, since a zip takes one member at a time
+            self.screenshot_links = {}
+            for mismatch in self.results.get("mismatches", []):
+                screenshot_file = self.screenshots.lookup(
+                    mismatch.get("page", "Unknown"), mismatch.get("language", "Unknown"), mismatch.get("element", "Unknown"),
+                    self.config.get("browser", "")
+                )
+                if screenshot_file and screenshot_file not in self.screenshot_links:
+                    self.screenshot_links[screenshot_file] = bundle.add_screenshot(screenshot_file)
+            
+            with bundle.open_text("index.html") as f:
+                self._write_chunks(f, self._iter_report(match_percentage, total_mismatches))
+            
+            distinct = len(set(link for link in self.screenshot_links.values() if link))
+            logger.info(f"Bundled {distinct} distinct screenshots ({bundle.duplicates} duplicates skipped) into {archive_path}")
+        return archive_path
+        
+    def _screenshot_link(self, screenshot_file):
+        """Get the (thumbnail, full size) links of a screenshot, relative to the report"""
+        if self.screenshot_links is not None:
+            return self.screenshot_links.get(screenshot_file)
+        path = os.path.relpath(screenshot_file, os.path.dirname(self.report_file))
+        return path, path
+        
+    def _render_chart_script(self):
+        """Script tag loading Chart.js from the bundle, or from the CDN for a normal report"""
+        if self.chart_script_src is None:
+            return ""
+        return f'<script src="{self.chart_script_src}"></script>'
+        
+    @staticmethod
+    def _write_chunks(f, chunks, batch_size=500):
+        """Write chunks to a file handle, joining them in small batches to limit write calls"""
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                f.write("".join(batch))
+                batch.clear()
+        if batch:
+            f.write("".join(batch))
+            
+    def _render_header(self, match_percentage, total_mismatches):
+        """Render the document head, summary and the mismatch table shell"""
+        return f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -130,8 +458,18 @@ class ReportGenerator:
                 .active, .collapsible:hover {{ background-color: #e9ecef; }}
                 .collapsible-content {{ padding: 0 18px; display: none; overflow: hidden; }}
                 .chart-container {{ width: 100%; height: 300px; margin-bottom: 20px; }}
+                .table-toolbar {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }}
+                .pager button, .pager select {{ padding: 6px 10px; margin-left: 5px; border: 1px solid #ddd; border-radius: 4px; background-color: white; }}
+                .vtable-head, .vtable-row {{ display: grid; grid-template-columns: 2fr 2fr 1fr 3fr 3fr; gap: 10px; box-sizing: border-box; }}
+                .vtable-head {{ padding: 12px 15px; font-weight: bold; background-color: #f8f9fa; border-bottom: 1px solid #ddd; }}
+                .vtable-viewport {{ height: 600px; overflow-y: auto; border: 1px solid #ddd; }}
+                .vtable-spacer {{ position: relative; }}
+                .vtable-row {{ position: absolute; left: 0; right: 0; height: 32px; line-height: 32px; padding: 0 15px; border-bottom: 1px solid #eee; cursor: pointer; }}
+                .vtable-row div {{ overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }}
+                .vtable-row:hover {{ background-color: #f1f1f1; }}
+                #mismatchDetail {{ display: flex; margin-top: 20px; }}
             </style>
-            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+            {self._render_chart_script()}
         </head>
         <body>
             <div class="container">
@@ -183,24 +521,43 @@ class ReportGenerator:
                         </select>
                     </div>
                     
-                    <table id="mismatchTable">
-                        <thead>
-                            <tr>
-                                <th>Page</th>
-                                <th>Element</th>
-                                <th>Language</th>
-                                <th>Details</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {self._generate_mismatch_rows()}
-                        </tbody>
-                    </table>
-                </div>
+                    <div class="table-toolbar">
+                        <span id="mismatchCount"></span>
+                        <div class="pager">
+                            <button id="prevPage">Prev</button>
+                            <span id="pageInfo"></span>
+                            <button id="nextPage">Next</button>
+                            <select id="pageSize">
+                                <option value="100">100 per page</option>
+                                <option value="1000" selected>1000 per page</option>
+                                <option value="10000">10000 per page</option>
+                            </select>
+                        </div>
+                    </div>
+                    
+                    <div class="vtable-head">
+                        <div>Page</div>
+                        <div>Element</div>
+                        <div>Language</div>
+                        <div>Actual</div>
+                        <div>Expected</div>
+                    </div>
+                    <div id="mismatchViewport" class="vtable-viewport">
+                        <div id="mismatchSpacer" class="vtable-spacer"></div>
+                    </div>
+                    <div id="mismatchDetail"></div>
+"""
+        
+    def _render_pages_start(self):
+        """Close the Mismatches tab and open the Pages tab"""
+        return """                </div>
                 
                 <div id="pages" class="tab-content">
-                    {self._generate_pages_content()}
-                </div>
+"""
+        
+    def _render_config_start(self):
+        """Close the Pages tab and open the configuration table"""
+        return """                </div>
                 
                 <div id="config" class="tab-content">
                     <h2>Test Configuration</h2>
@@ -209,15 +566,19 @@ class ReportGenerator:
                             <th>Parameter</th>
                             <th>Value</th>
                         </tr>
-                        {self._generate_config_rows()}
-                    </table>
+"""
+        
+    def _render_footer(self):
+        """Close the configuration table and add the scripts"""
+        return f"""                    </table>
                 </div>
                 
                 <script>
-                    // Chart generation
-                    const ctx = document.getElementById('languageChart').getContext('2d');
+                    // Chart generation (skipped when Chart.js could not be loaded or bundled)
                     const chartConfig = {json.dumps(self._get_chart_config(), indent=4)};
-                    new Chart(ctx, chartConfig);
+                    if (window.Chart) {{
+                        new Chart(document.getElementById('languageChart').getContext('2d'), chartConfig);
+                    }}
                     
                     // Tab functionality
                     function openTab(evt, tabName) {{
@@ -235,40 +596,8 @@ class ReportGenerator:
                         evt.currentTarget.className += " active";
                     }}
                     
-                    // Filtering functionality
-                    document.getElementById('mismatchSearch').addEventListener('keyup', filterTable);
-                    document.getElementById('languageFilter').addEventListener('change', filterTable);
-                    document.getElementById('pageFilter').addEventListener('change', filterTable);
-                    
-                    function filterTable() {{
-                        const search = document.getElementById('mismatchSearch').value.toLowerCase();
-                        const languageFilter = document.getElementById('languageFilter').value;
-                        const pageFilter = document.getElementById('pageFilter').value;
-                        
-                        const rows = document.getElementById('mismatchTable').getElementsByTagName('tbody')[0].getElementsByTagName('tr');
-                        
-                        for (let i = 0; i < rows.length; i++) {{
-                            const page = rows[i].getElementsByTagName('td')[0].textContent;
-                            const language = rows[i].getElementsByTagName('td')[2].textContent;
-                            const text = rows[i].textContent.toLowerCase();
-                            
-                            let displayRow = true;
-                            
-                            if (search && !text.includes(search)) {{
-                                displayRow = false;
-                            }}
-                            
-                            if (languageFilter && language !== languageFilter) {{
-                                displayRow = false;
-                            }}
-                            
-                            if (pageFilter && page !== pageFilter) {{
-                                displayRow = false;
-                            }}
-                            
-                            rows[i].style.display = displayRow ? '' : 'none';
-                        }}
-                    }}
+                    // Mismatch table
+                    {MISMATCH_TABLE_SCRIPT}
                     
                     // Collapsible sections
                     const coll = document.getElementsByClassName("collapsible");
@@ -285,13 +614,6 @@ class ReportGenerator:
         </html>
         """
         
-        # Write the HTML report
-        with open(self.report_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"Report generated: {self.report_file}")
-        return self.report_file
-        
     def _get_status_class(self, percentage):
         """Get CSS class based on percentage"""
         if percentage >= 90:
@@ -301,49 +623,51 @@ class ReportGenerator:
         else:
             return "error"
             
-    def _generate_mismatch_rows(self):
-        """Generate HTML table rows for mismatches"""
-        rows = ""
+    def _iter_mismatch_data(self):
+        """
+        Yield the mismatches as a compact JSON blob, one row at a time
+
+        Rows are arrays of [page id, element, language id, actual, expected,
+        key, closest key, score, screenshot id]; pages, languages and
+        screenshot [thumbnail, full size] link pairs are stored once and
+        referenced by id.
+        """
+        ids = {"pages": {}, "languages": {}, "screenshots": {}}
+
+        def lookup_id(kind, value):
+            return ids[kind].setdefault(value, len(ids[kind]))
+
+        yield '<script type="application/json" id="mismatchData">{"rows":['
         for idx, mismatch in enumerate(self.results.get("mismatches", [])):
             page = mismatch.get("page", "Unknown")
             element = mismatch.get("element", "Unknown")
             language = mismatch.get("language", "Unknown")
-            actual = mismatch.get("actual", "")
-            expected = mismatch.get("expected", "")
-            
-            screenshot_path = ""
-            screenshot_name = f"mismatch_{language.lower()}_{page.replace(' > ', '_')}"
-            screenshots_dir = self.config.get("screenshots_dir", "screenshots")
             
-            # Find matching screenshots
-            if os.path.exists(screenshots_dir):
-                for file in os.listdir(screenshots_dir):
-                    if file.startswith(screenshot_name) and file.endswith(".png"):
-                        screenshot_path = os.path.join("..", screenshots_dir, file)
-                        break
+            screenshot_id = -1
+            screenshot_file = self.screenshots.lookup(page, language, element, self.config.get("browser", ""))
+            screenshot_link = self._screenshot_link(screenshot_file) if screenshot_file else None
+            if screenshot_link:
+                screenshot_id = lookup_id("screenshots", screenshot_link)
             
-            rows += f"""
-            <tr>
-                <td>{page}</td>
-                <td>{element}</td>
-                <td>{language}</td>
-                <td>
-                    <button class="collapsible">View Details</button>
-                    <div class="collapsible-content">
-                        <div class="mismatch-details">
-                            <div class="text-comparison">
-                                <p><strong>Actual:</strong> <span style="background-color: #ffcccc;">{actual}</span></p>
-                                <p><strong>Expected:</strong> <span style="background-color: #ccffcc;">{expected}</span></p>
-                                <p><strong>Difference:</strong></p>
-                                <div id="diff-{idx}" class="diff-display"></div>
-                            </div>
-                            {"<div class='visual-comparison'><img src='" + screenshot_path + "' class='screenshot' alt='Screenshot of mismatch'></div>" if screenshot_path else ""}
-                        </div>
-                    </div>
-                </td>
-            </tr>
-            """
-        return rows
+            row = [
+                lookup_id("pages", page),
+                element,
+                lookup_id("languages", language),
+                mismatch.get("actual", ""),
+                mismatch.get("expected", ""),
+                mismatch.get("key", ""),
+                mismatch.get("closest_key", ""),
+                mismatch.get("score", 0.0),
+                screenshot_id
+            ]
+            yield ("," if idx else "") + self._json_for_script(row)
+        
+        yield '],' + ','.join(f'"{kind}":{self._json_for_script(list(values))}' for kind, values in ids.items()) + '}</script>\n'
+        
+    @staticmethod
+    def _json_for_script(value):
+        """Serialize a value for embedding inside a <script> element"""
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace("</", "<\\/")
     
     def _generate_page_options(self):
         """Generate options for page filter dropdown"""
@@ -353,14 +677,13 @@ class ReportGenerator:
             if page:
                 pages.add(page)
         
-        options = ""
-        for page in sorted(pages):
-            options += f'<option value="{page}">{page}</option>'
-        return options
+        return "".join(f'<option value="{html.escape(page)}">{html.escape(page)}</option>' for page in sorted(pages))
         
-    def _generate_pages_content(self):
-        """Generate content for the Pages tab"""
-        # Group mismatches by page
+    def _iter_pages_content(self):
+        """Yield the content of the Pages tab in chunks; mismatch rows are filled in from the JSON blob when opened"""
+        language_codes = dict(zip(self.LANGUAGE_LABELS, self.LANGUAGES))
+        
+        # Count mismatches by page
         pages_data = {}
         for mismatch in self.results.get("mismatches", []):
             page = mismatch.get("page", "Unknown")
@@ -368,24 +691,20 @@ class ReportGenerator:
                 pages_data[page] = {
                     "en_mismatched": 0,
                     "kh_mismatched": 0,
-                    "cn_mismatched": 0,
-                    "mismatches": []
+                    "cn_mismatched": 0
                 }
             
-            lang_code = mismatch.get("language", "").lower()[:2]
-            if lang_code in ["en", "kh", "cn"]:
+            lang_code = language_codes.get(mismatch.get("language", ""))
+            if lang_code:
                 pages_data[page][f"{lang_code}_mismatched"] += 1
-            
-            pages_data[page]["mismatches"].append(mismatch)
         
         # Generate HTML for each page
-        html = ""
         for page_name, page_data in sorted(pages_data.items()):
             total_mismatches = page_data["en_mismatched"] + page_data["kh_mismatched"] + page_data["cn_mismatched"]
             
-            html += f"""
+            yield f"""
             <div class="page-section">
-                <h3>{page_name}</h3>
+                <h3>{html.escape(page_name)}</h3>
                 <div class="page-stats">
                     <p><strong>Total Mismatches:</strong> {total_mismatches}</p>
                     <p><strong>English Mismatches:</strong> {page_data["en_mismatched"]}</p>
@@ -393,7 +712,7 @@ class ReportGenerator:
                     <p><strong>Chinese Mismatches:</strong> {page_data["cn_mismatched"]}</p>
                 </div>
                 
-                <button class="collapsible">View Mismatches</button>
+                <button class="collapsible page-mismatches-toggle" data-page="{html.escape(page_name)}">View Mismatches</button>
                 <div class="collapsible-content">
                     <table class="page-mismatches">
                         <thead>
@@ -404,31 +723,14 @@ class ReportGenerator:
                                 <th>Expected</th>
                             </tr>
                         </thead>
-                        <tbody>
-            """
-            
-            for mismatch in page_data["mismatches"]:
-                html += f"""
-                <tr>
-                    <td>{mismatch.get("element", "")}</td>
-                    <td>{mismatch.get("language", "")}</td>
-                    <td>{mismatch.get("actual", "")}</td>
-                    <td>{mismatch.get("expected", "")}</td>
-                </tr>
-                """
-            
-            html += """
-                        </tbody>
+                        <tbody></tbody>
                     </table>
                 </div>
             </div>
             """
-        
-        return html
     
-    def _generate_config_rows(self):
-        """Generate rows for configuration table"""
-        rows = ""
+    def _iter_config_rows(self):
+        """Yield rows for configuration table"""
         # Don't display sensitive information
         safe_config = self.config.copy()
         if "password" in safe_config:
@@ -446,10 +748,9 @@ class ReportGenerator:
             else:
                 display_value = str(value)
             
-            rows += f"""
+            yield f"""
             <tr>
                 <td>{key}</td>
                 <td>{display_value}</td>
             </tr>
-            """
-        return rows
\ No newline at end of file
+            """
\ No newline at end of file
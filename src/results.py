@@ -0,0 +1,41 @@
+LANGUAGES = ['en', 'kh', 'cn']
+
+# Display names used in results and reports
+LANGUAGE_LABELS = {
+    'en': 'English',
+    'kh': 'Khmer',
+    'cn': 'Chinese'
+}
+
+# Counters summed when results from several test units are merged
+COUNTER_FIELDS = ["total_elements"] + [f"{lang}_{kind}" for kind in ("matched", "mismatched") for lang in LANGUAGES]
+
+# Per-element check records (kept as tuples in this order when results are exported)
+# checked_at is Unix time; compare_ms is the time taken to compare the element's whole page
+CHECK_FIELDS = ["page", "language", "element", "key", "expected", "actual", "matched", "checked_at", "compare_ms"]
+
+
+def new_results():
+    """Create an empty results structure"""
+    results = {field: 0 for field in COUNTER_FIELDS}
+    results["mismatches"] = []
+    results["checks"] = []
+    return results
+
+
+def merge_results(target, source):
+    """
+    Add the counters, mismatches and check records of one results structure into another
+
+    Args:
+        target (dict): Results to update in place
+        source (dict): Results to add
+
+    Returns:
+        dict: The updated target
+    """
+    for field in COUNTER_FIELDS:
+        target[field] = target.get(field, 0) + source.get(field, 0)
+    target.setdefault("mismatches", []).extend(source.get("mismatches", []))
+    target.setdefault("checks", []).extend(source.get("checks", []))
+    return target
@@ -0,0 +1,86 @@
+import itertools
+import json
+import logging
+from src.results import CHECK_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+logger = logging.getLogger()
+
+# Column types of the Parquet export; 'run' identifies the report the rows belong to
+CHECK_SCHEMA = [
+    ("run", "string"),
+    ("page", "string"),
+    ("language", "string"),
+    ("element", "string"),
+    ("key", "string"),
+    ("expected", "string"),
+    ("actual", "string"),
+    ("matched", "bool_"),
+    ("checked_at", "float64"),
+    ("compare_ms", "float64")
+]
+
+
+def write_checks_jsonl(checks, path, run, batch_size=1000):
+    """
+    Stream check records to a JSON-lines file, one object per element
+
+    Args:
+        checks (iterable): Check records in CHECK_FIELDS order
+        path (str): File to write
+        run (str): Run identifier added to every row
+
+    Returns:
+        int: Rows written
+    """
+    rows = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        batch = []
+        for check in checks:
+            record = {"run": run}
+            record.update(zip(CHECK_FIELDS, check))
+            batch.append(json.dumps(record, ensure_ascii=False))
+            if len(batch) >= batch_size:
+                f.write("\n".join(batch) + "\n")
+                rows += len(batch)
+                batch.clear()
+        if batch:
+            f.write("\n".join(batch) + "\n")
+            rows += len(batch)
+    return rows
+
+
+def write_checks_parquet(checks, path, run, batch_size=65536):
+    """
+    Stream check records to a Parquet file in row groups of batch_size rows
+
+    Args:
+        checks (iterable): Check records in CHECK_FIELDS order
+        path (str): File to write
+        run (str): Run identifier added to every row
+        batch_size (int): Rows converted to columns and written at a time
+
+    Returns:
+        int: Rows written, or None if pyarrow is not installed
+    """
+    if pa is None:
+        logger.warning("pyarrow is not installed; skipping the Parquet results export")
+        return None
+
+    schema = pa.schema([(name, getattr(pa, type_name)()) for name, type_name in CHECK_SCHEMA])
+    rows = 0
+    checks = iter(checks)
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        while True:
+            batch = list(itertools.islice(checks, batch_size))
+            if not batch:
+                break
+            columns = [[run] * len(batch)] + [list(column) for column in zip(*batch)]
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+            rows += len(batch)
+    return rows
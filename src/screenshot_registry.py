@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger()
+
+MANIFEST_NAME = "manifest.jsonl"
+
+# Screenshot file names end with the capture time, e.g. mismatch_khmer_Account_20250416_103457.png
+# (newer captures add milliseconds: ..._20250416_103457_042.png)
+_TIMESTAMP_SUFFIX_RE = re.compile(r'_\d{8}_\d{6}(?:_\d{3})?$')
+
+
+class ScreenshotRegistry:
+    """
+    Records each screenshot as it is taken so reports can find it without scanning the directory
+
+    Entries are appended to a JSON-lines manifest in the screenshots
+    directory, so later report generation and snapshot replays see them too.
+    """
+
+    # One lock per manifest, shared by the testers running in this process
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, directory="screenshots"):
+        """
+        Args:
+            directory (str): Directory holding the screenshots and the manifest
+        """
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        # (browser, page, language, element) -> file name, and (browser, page, language) -> latest file name
+        self.by_element = {}
+        self.by_page = {}
+        # Screenshot name without timestamp -> latest file name
+        self.by_name = {}
+
+    def _lock(self):
+        with self._locks_guard:
+            return self._locks.setdefault(os.path.abspath(self.manifest_path), threading.Lock())
+
+    def _add(self, entry):
+        file_name = entry["file"]
+        page, language, element = entry.get("page", ""), entry.get("language", ""), entry.get("element", "")
+        browser = entry.get("browser", "")
+        if page or language:
+            self.by_element[(browser, page, language, element)] = file_name
+            self.by_page[(browser, page, language)] = file_name
+        if not browser:
+            # Only browser-less captures can be found by name without mixing up browsers
+            self.by_name[entry.get("name") or _TIMESTAMP_SUFFIX_RE.sub('', os.path.splitext(file_name)[0])] = file_name
+
+    def record(self, path, name="", page="", language="", element="", browser=""):
+        """
+        Register a screenshot that was just saved
+
+        Args:
+            path (str): Path of the saved file (inside the registry directory)
+            name (str): Screenshot name without timestamp, e.g. 'login_failure'
+            page (str): Page the screenshot shows
+            language (str): Language label of the page ('English', 'Khmer', 'Chinese')
+            element (str): Element the screenshot is for, if any
+            browser (str): Browser the screenshot was taken in
+        """
+        entry = {
+            "file": os.path.basename(path), "name": name, "page": page, "language": language,
+            "element": element, "browser": browser
+        }
+        self._add(entry)
+        try:
+            with self._lock():
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logger.warning(f"Failed to record screenshot {path}: {str(e)}")
+
+    def load(self):
+        """
+        Index the directory once by file name, then apply the manifest on top
+
+        The directory pass keeps screenshots taken before the manifest existed findable.
+
+        Returns:
+            ScreenshotRegistry: self
+        """
+        if os.path.isdir(self.directory):
+            # Sorted so the latest capture of a name wins, as timestamps sort chronologically
+            for file_name in sorted(os.listdir(self.directory)):
+                if file_name.endswith(".png"):
+                    self._add({"file": file_name})
+
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._add(json.loads(line))
+                    except (ValueError, KeyError):
+                        logger.warning(f"Skipping malformed line in {self.manifest_path}")
+        return self
+
+    def path(self, file_name):
+        """Get the full path of a registered file name"""
+        return os.path.join(self.directory, file_name)
+
+    def lookup(self, page, language, element=None, browser=""):
+        """
+        Find the screenshot for a mismatch
+
+        Args:
+            page (str): Page of the mismatch
+            language (str): Language label of the mismatch
+            element (str): Element of the mismatch; falls back to the page screenshot
+            browser (str): Browser of the report; captures without a browser are used as a fallback
+
+        Returns:
+            str: Screenshot path, or None
+        """
+        file_name = None
+        for scope in dict.fromkeys((browser, "")):
+            file_name = self.by_element.get((scope, page, language, element)) if element else None
+            file_name = file_name or self.by_page.get((scope, page, language))
+            if file_name:
+                break
+        if not file_name:
+            # Screenshots taken before the registry existed are only known by name
+            file_name = self.by_name.get(f"mismatch_{language.lower()}_{page.replace(' > ', '_')}")
+        return self.path(file_name) if file_name else None
@@ -0,0 +1,167 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger()
+
+# Returns the page's localStorage and sessionStorage as plain objects
+DUMP_STORAGE_SCRIPT = """
+function dump(storage) {
+    const data = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+}
+return JSON.stringify({local: dump(window.localStorage), session: dump(window.sessionStorage)});
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+const state = JSON.parse(arguments[0]);
+for (const [key, value] of Object.entries(state.local || {})) window.localStorage.setItem(key, value);
+for (const [key, value] of Object.entries(state.session || {})) window.sessionStorage.setItem(key, value);
+"""
+
+
+class SessionCache:
+    """Authenticated browser state captured after login and injected into new drivers"""
+
+    # Captured sessions shared by every tester in this process, keyed by base URL
+    _sessions = {}
+    _lock = threading.Lock()
+    # One login lock per base URL, so concurrent testers log in once and share the session
+    _login_locks = {}
+
+    def __init__(self, base_url, session_file=None, max_age=1800):
+        """
+        Args:
+            base_url (str): Application URL the session belongs to
+            session_file (str): Optional JSON file to persist the session between runs
+            max_age (int): Seconds after which a captured session is no longer reused
+        """
+        self.base_url = base_url
+        self.session_file = session_file
+        self.max_age = max_age
+
+    def login_lock(self):
+        """
+        Get the lock serializing logins to this base URL
+
+        A tester holds it from restore through login to capture, so testers
+        starting together wait for the first login instead of each running
+        the full login and 2FA flow.
+
+        Returns:
+            threading.Lock: Lock shared by every SessionCache for the base URL
+        """
+        with self._lock:
+            return self._login_locks.setdefault(self.base_url, threading.Lock())
+
+    def get(self):
+        """Get the cached session state, or None if missing or expired"""
+        with self._lock:
+            state = self._sessions.get(self.base_url)
+            if state is None and self.session_file and os.path.exists(self.session_file):
+                try:
+                    with open(self.session_file, 'r', encoding='utf-8') as f:
+                        state = json.load(f).get(self.base_url)
+                    if state:
+                        self._sessions[self.base_url] = state
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable session file {self.session_file}: {str(e)}")
+                    state = None
+
+        if state and time.time() - state.get("captured_at", 0) > self.max_age:
+            logger.info("Cached session expired")
+            self.clear()
+            return None
+        return state
+
+    def capture(self, driver):
+        """
+        Capture cookies and web storage from a logged-in driver
+
+        Args:
+            driver (WebDriver): Driver with an authenticated session
+        """
+        try:
+            storage = json.loads(driver.execute_script(DUMP_STORAGE_SCRIPT) or "{}")
+            state = {
+                "cookies": driver.get_cookies(),
+                "local": storage.get("local", {}),
+                "session": storage.get("session", {}),
+                "captured_at": time.time()
+            }
+        except Exception as e:
+            logger.warning(f"Failed to capture session: {str(e)}")
+            return
+
+        with self._lock:
+            self._sessions[self.base_url] = state
+            if self.session_file:
+                self._write_file(state)
+        logger.info(f"Captured session with {len(state['cookies'])} cookies")
+
+    def _write_file(self, state):
+        """
+        Persist the session; the file holds credentials so it is private to the user
+
+        Args:
+            state (dict): Session to store for the base URL, or None to remove it
+        """
+        try:
+            sessions = {}
+            if os.path.exists(self.session_file):
+                with open(self.session_file, 'r', encoding='utf-8') as f:
+                    sessions = json.load(f)
+            if state is None:
+                if self.base_url not in sessions:
+                    return
+                sessions.pop(self.base_url)
+            else:
+                sessions[self.base_url] = state
+            fd = os.open(self.session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(sessions, f)
+        except Exception as e:
+            logger.warning(f"Failed to write session file: {str(e)}")
+
+    def restore(self, driver):
+        """
+        Inject the cached session into a driver
+
+        Args:
+            driver (WebDriver): Fresh driver instance
+
+        Returns:
+            bool: True if a session was injected (validity is not checked here)
+        """
+        state = self.get()
+        if not state:
+            return False
+
+        try:
+            # Cookies and storage can only be set once the driver is on the application's origin
+            driver.get(self.base_url)
+            for cookie in state["cookies"]:
+                cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    logger.debug(f"Skipping cookie {cookie.get('name')}: {str(e)}")
+            driver.execute_script(RESTORE_STORAGE_SCRIPT, json.dumps(state))
+            driver.get(self.base_url)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to restore session: {str(e)}")
+            return False
+
+    def clear(self):
+        """Forget the cached session for this base URL, in memory and in the session file"""
+        with self._lock:
+            self._sessions.pop(self.base_url, None)
+            if self.session_file:
+                self._write_file(None)
@@ -0,0 +1,123 @@
+import gzip
+import json
+import logging
+import os
+import re
+import tempfile
+from src.comparison import compare_snapshot
+from src.comparison_pipeline import ComparisonPipeline
+from src.report_generator import ReportGenerator
+from src.results import merge_results, new_results
+from src.translation_cache import load_translation_table
+
+logger = logging.getLogger()
+
+
+class SnapshotStore:
+    """Compressed per-(page, browser, language) text extractions that can be re-verified without a browser"""
+
+    def __init__(self, directory="snapshots"):
+        self.directory = directory
+
+    def path_for(self, page, language, browser=""):
+        """Get the snapshot file for a page, language and browser"""
+        slug = re.sub(r'[^\w]+', '_', page).strip('_') or "page"
+        if browser:
+            slug = f"{slug}__{browser}"
+        return os.path.join(self.directory, f"{slug}__{language}.json.gz")
+
+    def save(self, snapshot):
+        """
+        Write a page snapshot as gzip-compressed JSON, atomically
+
+        Args:
+            snapshot (dict): 'page', 'language', 'browser' and extracted 'items'
+
+        Returns:
+            str: Path of the snapshot file
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(snapshot["page"], snapshot["language"], snapshot.get("browser", ""))
+        # A crash mid-write must not leave a truncated file for replay to trip over
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def load(self, path):
+        """Read one snapshot file"""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def iter_snapshots(self):
+        """Yield every stored snapshot in a stable (file name) order"""
+        if not os.path.isdir(self.directory):
+            return
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json.gz"):
+                yield self.load(os.path.join(self.directory, name))
+
+
+def replay_snapshots(config, snapshot_dir):
+    """
+    Re-run matching on captured snapshots against the configured workbook
+
+    Snapshots are grouped by the browser that captured them, and each browser
+    gets its own results and report, like a live run.
+
+    Args:
+        config (dict): Test configuration (excel_path, cache and comparison settings)
+        snapshot_dir (str): Directory written by a capture run
+
+    Returns:
+        dict: Results for each browser ('' for snapshots captured without one)
+    """
+    _, index = load_translation_table(
+        config.get('excel_path', ''), config.get('cache_dir', '.cache'), config.get('excel_loader', 'pandas'),
+        config.get('normalization')
+    )
+    store = SnapshotStore(snapshot_dir)
+    dynamic = config.get('check_dynamic_content', True)
+    record_checks = config.get('export_results', False)
+    comparison_workers = config.get('comparison_workers', 0)
+
+    # browser -> per-snapshot results (or pipeline futures), in file name order
+    by_browser = {}
+    if comparison_workers:
+        with ComparisonPipeline(index, comparison_workers, dynamic, record_checks) as pipeline:
+            for snapshot in store.iter_snapshots():
+                by_browser.setdefault(snapshot.get("browser", ""), []).append(pipeline.submit(snapshot))
+            by_browser = {
+                browser: [future.result() for future in futures] for browser, futures in by_browser.items()
+            }
+    else:
+        for snapshot in store.iter_snapshots():
+            by_browser.setdefault(snapshot.get("browser", ""), []).append(
+                compare_snapshot(index, snapshot, dynamic, record_checks)
+            )
+
+    results = {}
+    for browser, snapshot_results in by_browser.items():
+        merged = new_results()
+        for page_results in snapshot_results:
+            merge_results(merged, page_results)
+        # Same report layout as collect_unit_results, so replays compare with live runs
+        report_dir = config.get('report_dir', 'reports')
+        if browser:
+            report_dir = os.path.join(report_dir, browser)
+        results[browser] = {
+            'browser': browser,
+            'success': not merged['mismatches'],
+            'results': merged,
+            'failed_units': [],
+            'report_file': ReportGenerator(merged, dict(config, report_dir=report_dir, browser=browser)).generate()
+        }
+        logger.info(f"Replayed {len(snapshot_results)} snapshots captured in {browser or 'an unknown browser'}")
+
+    logger.info(f"Replayed snapshots from {snapshot_dir}")
+    return results
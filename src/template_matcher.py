@@ -0,0 +1,127 @@
+import re
+from collections import namedtuple
+from src.translation_index import LANGUAGES
+
+# Placeholders used in sheet entries: {amount}, {{amount}}, {0}, %(name)s, %s, %d, %1$s, %.2f
+# The printf flags exclude the space flag, so prose such as "5% discount" is not a placeholder
+PLACEHOLDER_RE = re.compile(r'\{\{\s*[\w.]*\s*\}\}|\{[\w.]*\}|%\(\w+\)[sdf]|%(?:\d+\$)?[-+0#]*\d*(?:\.\d+)?[sdfi]')
+
+# Sheet entry compiled into an anchored regex; 'literal' is the fixed text length, used to prefer specific templates
+Template = namedtuple('Template', ['text', 'regex', 'literal', 'owners'])
+
+# A dynamic string matched to a template, with the values filled into its placeholders
+TemplateMatch = namedtuple('TemplateMatch', ['key', 'language', 'template', 'values'])
+
+
+def compile_template(text):
+    """
+    Compile a normalized sheet text containing placeholders into an anchored regex
+
+    Args:
+        text (str): Normalized sheet text
+
+    Returns:
+        tuple: (regex, literal parts), or None if the text has no placeholders or no literal text
+    """
+    literals = PLACEHOLDER_RE.split(text)
+    if len(literals) < 2 or not ''.join(literals).strip():
+        return None
+    pattern = '(.+?)'.join(re.escape(literal) for literal in literals)
+    return re.compile(pattern + r'\Z', re.DOTALL), literals
+
+
+class TemplateMatcher:
+    """
+    Matches dynamic strings ("balance: 1,200.00") against sheet entries with placeholders ("Balance: {amount}")
+
+    Templates are bucketed by their first literal characters (or last, when
+    they start with a placeholder), so a string is only tried against the
+    few templates sharing its prefix or suffix.
+    """
+
+    def __init__(self, index, prefix_length=4):
+        """
+        Args:
+            index (TranslationIndex): Translation lookups to compile templates from
+            prefix_length (int): Literal characters used to bucket templates
+        """
+        self.normalize = index.normalize
+        self.prefix_length = prefix_length
+        # normalized sheet text -> Template
+        self.templates = {}
+        self.by_prefix = {}
+        self.by_suffix = {}
+        # Templates whose literal ends are too short to bucket
+        self.unbucketed = []
+
+        for lang in LANGUAGES:
+            for text, keys in index.text_index[lang].items():
+                template = self.templates.get(text)
+                if template is None:
+                    compiled = compile_template(text)
+                    if compiled is None:
+                        continue
+                    regex, literals = compiled
+                    template = Template(text, regex, sum(len(literal) for literal in literals), [])
+                    self.templates[text] = template
+                    self._bucket(template, literals)
+                template.owners.extend((key, lang) for key in keys)
+
+    def _bucket(self, template, literals):
+        if len(literals[0]) >= self.prefix_length:
+            self.by_prefix.setdefault(literals[0][:self.prefix_length], []).append(template)
+        elif len(literals[-1]) >= self.prefix_length:
+            self.by_suffix.setdefault(literals[-1][-self.prefix_length:], []).append(template)
+        else:
+            self.unbucketed.append(template)
+
+    def __len__(self):
+        return len(self.templates)
+
+    def candidates(self, normalized):
+        """Get the templates that could match a normalized string"""
+        return (
+            self.by_prefix.get(normalized[:self.prefix_length], [])
+            + self.by_suffix.get(normalized[-self.prefix_length:], [])
+            + self.unbucketed
+        )
+
+    def match(self, text, language=None):
+        """
+        Find the most specific template matching a dynamic string
+
+        Args:
+            text (str): Scraped text (normalized first)
+            language (str): Only consider templates in this language, or None for all
+
+        Returns:
+            TemplateMatch: The match, or None
+        """
+        normalized = self.normalize(text)
+        best = None
+        for template in self.candidates(normalized):
+            owners = [owner for owner in template.owners if language is None or owner[1] == language]
+            if not owners or (best and template.literal <= best[0].literal):
+                continue
+            found = template.regex.match(normalized)
+            if found:
+                best = (template, owners[0], found.groups())
+
+        if best is None:
+            return None
+        template, (key, lang), values = best
+        return TemplateMatch(key, lang, template.text, values)
+
+    def matches_text(self, template_text, text):
+        """
+        Check a dynamic string against one sheet text
+
+        Args:
+            template_text (str): Normalized sheet text (e.g. the expected translation of a key)
+            text (str): Scraped text (normalized first)
+
+        Returns:
+            bool: Whether the sheet text is a template and the string fills it
+        """
+        template = self.templates.get(template_text)
+        return bool(template and template.regex.match(self.normalize(text)))
@@ -1,3 +1,4 @@
+import concurrent.futures
 import os
 import time
 import pandas as pd
@@ -11,7 +12,15 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from openpyxl import load_workbook
-import re
+from src.driver_resolver import DriverResolver
+from src.element_finder import ElementFinder
+from src.page_readiness import PageReadiness
+from src.comparison import compare_snapshot
+from src.results import LANGUAGE_LABELS, merge_results, new_results
+from src.screenshot_registry import ScreenshotRegistry
+from src.session_cache import SessionCache
+from src.snapshot_store import SnapshotStore
+from src.translation_cache import load_translation_table
 
 # Configure logging
 log_dir = "logs"
@@ -209,154 +218,6 @@ class TranslationTester:
             self.take_screenshot("2fa_handling_failure")
             raise
 
-def change_language(self, language_code):
-    """
-    Enhanced language change function with wait verification
-    
-    Args:
-        language_code (str): 'en', 'kh', or 'cn'
-    """
-    try:
-        # Map of language codes to display text and attributes
-        language_map = {
-            'en': {'text': 'English', 'value': 'en', 'attr': 'english'},
-            'kh': {'text': 'ខ្មែរ', 'value': 'kh', 'attr': 'khmer'},
-            'cn': {'text': '中文', 'value': 'cn', 'attr': 'chinese'},
-        }
-        
-        # Multiple strategies to find language selector
-        selector_strategies = [
-            # Strategy 1: Common language selector button/dropdown
-            ("//button[contains(@class,'language') or contains(@class,'lang-switcher')]", 
-             f"//li[contains(text(),'{language_map[language_code]['text']}') or @value='{language_map[language_code]['value']}']"),
-            
-            # Strategy 2: Icon-based language selector
-            ("//div[contains(@class,'language-selector') or contains(@class,'lang-select')]", 
-             f"//a[contains(@class,'{language_map[language_code]['attr']}') or @data-lang='{language_code}']"),
-             
-            # Strategy 3: Direct language links
-            (None, f"//a[contains(@class,'lang') and (contains(text(),'{language_map[language_code]['text']}') or @data-lang='{language_code}')]")
-        ]
-        
-        for opener_selector, language_selector in selector_strategies:
-            try:
-                # If two-step (opener then selector)
-                if opener_selector:
-                    opener = self.find_element_safe(By.XPATH, opener_selector, timeout=5)
-                    if opener:
-                        self.driver.execute_script("arguments[0].click();", opener)
-                        time.sleep(0.5)  # Wait for dropdown to appear
-                
-                # Select the language option
-                language_option = self.find_element_safe(By.XPATH, language_selector, timeout=5)
-                if language_option:
-                    self.driver.execute_script("arguments[0].click();", language_option)
-                    
-                    # Wait for page to refresh or update after language change
-                    WebDriverWait(self.driver, 10).until(
-                        EC.staleness_of(language_option) or 
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                    
-                    # Additional wait for AJAX to complete
-                    time.sleep(2)
-                    
-                    # Verify language change by checking HTML lang attribute or other indicators
-                    html_element = self.driver.find_element(By.TAG_NAME, "html")
-                    page_lang = html_element.get_attribute("lang") or ""
-                    
-                    # Check if language changed correctly (approximation)
-                    if language_code.lower() in page_lang.lower() or self.verify_language_change(language_code):
-                        logger.info(f"Successfully changed language to {language_code}")
-                        return True
-            
-            except Exception as e:
-                logger.debug(f"Language change strategy failed: {str(e)}")
-                continue
-                
-        # Final fallback: Try direct URL parameter if applicable
-        try:
-            current_url = self.driver.current_url
-            if "lang=" in current_url:
-                new_url = re.sub(r'lang=[^&]+', f'lang={language_code}', current_url)
-            else:
-                separator = "&" if "?" in current_url else "?"
-                new_url = f"{current_url}{separator}lang={language_code}"
-                
-            self.driver.get(new_url)
-            time.sleep(2)
-            logger.info(f"Attempted language change via URL: {new_url}")
-            return self.verify_language_change(language_code)
-        except:
-            pass
-            
-        logger.error(f"Failed to change language to {language_code}")
-        return False
-            
-    except Exception as e:
-        logger.error(f"Error changing language to {language_code}: {str(e)}")
-        self.take_screenshot(f"language_change_error_{language_code}")
-        return False
-        
-def verify_language_change(self, expected_language):
-        """Verify language was changed by checking known elements"""
-        try:
-            # Sample text in different languages for common UI elements
-            language_markers = {
-                'en': ['Dashboard', 'Account', 'Login', 'Settings'],
-                'kh': ['ផ្ទាំងគ្រប់គ្រង', 'គណនី', 'ចូល'],
-                'cn': ['仪表板', '账户', '登录']
-            }
-            
-            page_source = self.driver.page_source
-            markers = language_markers.get(expected_language, [])
-            
-            # Check if any language markers are present
-            for marker in markers:
-                if marker in page_source:
-                    return True
-                    
-            return False
-        except:
-            return False
-
-def navigate_to_page(self, menu_path):
-        """
-        Navigate to a specific page in the application
-
-        Args:
-            menu_path (list): List of menu items to click, in order
-        """
-        try:
-            self.current_page = " > ".join(menu_path)
-            logger.info(f"Navigating to {self.current_page}")
-
-            for i, menu_item in enumerate(menu_path):
-                # Adjust XPath for menu items based on level
-                if i == 0:  # Main menu
-                    menu_element = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, f"//span[contains(text(), '{menu_item}')]"))  # Adjust selector as needed
-                    )
-                else:  # Submenu
-                    menu_element = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, f"//li[contains(text(), '{menu_item}')]"))  # Adjust selector as needed
-                    )
-
-                menu_element.click()
-                time.sleep(1)  # Wait for submenu to appear or page to load
-
-            # Wait for page content to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'content') or contains(@class, 'page')]"))  # Adjust selector as needed
-            )
-
-            logger.info(f"Successfully navigated to {self.current_page}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to navigate to {self.current_page}: {str(e)}")
-            self.take_screenshot(f"navigation_failure_{self.current_page.replace(' > ', '_')}")
-            return
-
 # Configure logging
 log_dir = "logs"
 screenshots_dir = "screenshots"
@@ -395,17 +256,35 @@ class TranslationTester:
         self.password = password
         self.driver = None
         self.translations_df = None
-        self.results = {
-            "total_elements": 0,
-            "en_matched": 0,
-            "kh_matched": 0,
-            "cn_matched": 0,
-            "en_mismatched": 0,
-            "kh_mismatched": 0,
-            "cn_mismatched": 0,
-            "mismatches": []
+        self.translation_index = None
+        self.wait_time = 10
+        self.cache_dir = ".cache"
+        self.excel_loader = "pandas"
+        self.extraction_mode = "script"
+        self.verify_translation_keys = False
+        self.reuse_session = True
+        self.session_file = None
+        self.session_max_age = 1800
+        self.readiness = {
+            "timeout": 10,
+            "lang_timeout": 3,
+            "quiet_period_ms": 300,
+            "poll_interval": 0.1
         }
+        self.normalization = None
+        self.check_dynamic_content = True
+        self.record_checks = False
+        self.driver_resolver = DriverResolver()
+        self.defer_page_waits = False
+        self._page_readiness = None
+        self.snapshot_dir = None
+        self.screenshots_dir = screenshots_dir
+        self.screenshot_on_mismatch = True
+        self.screenshot_registry = None
+        self.results = new_results()
         self.current_page = ""
+        # Browser type driven by this tester, used to keep snapshots and screenshots apart
+        self.browser_name = ""
         
     def setup(self):
         """Set up the WebDriver and load translation data"""
@@ -421,7 +300,7 @@ class TranslationTester:
             
             # Initialize WebDriver
             self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(self.driver_resolver.resolve('chrome')),
                 options=chrome_options
             )
             self.driver.implicitly_wait(10)
@@ -436,19 +315,15 @@ class TranslationTester:
             return False
             
     def load_translations(self):
-        """Load translation data from Excel file"""
+        """Load translation data from Excel file (or the parsed-workbook cache)"""
         try:
             # Load the Excel file
             logger.info(f"Loading translations from {self.excel_path}")
-            self.translations_df = pd.read_excel(self.excel_path)
-            
-            # Validate the expected columns exist
-            required_columns = ["Key", "Original EN", "Original CN", "Original KH", "KH Confirm from BIC", "CN Confirm from BIC"]
-            for column in required_columns:
-                if column not in self.translations_df.columns:
-                    raise ValueError(f"Required column '{column}' not found in Excel file")
+            self.translations_df, self.translation_index = load_translation_table(
+                self.excel_path, self.cache_dir, self.excel_loader, self.normalization
+            )
             
-            logger.info(f"Successfully loaded {len(self.translations_df)} translation entries")
+            logger.info(f"Successfully loaded {len(self.translation_index)} translation entries")
         except Exception as e:
             logger.error(f"Failed to load translations: {str(e)}")
             raise
@@ -459,8 +334,8 @@ class TranslationTester:
             logger.info(f"Navigating to {self.base_url}")
             self.driver.get(self.base_url)
             
-            # Add a longer initial wait for the page to fully load
-            time.sleep(5)
+            # Wait for the page to fully load
+            self.wait_for_page()
             
             # Wait for login form with more flexible locators
             logger.info("Waiting for login form")
@@ -486,11 +361,9 @@ class TranslationTester:
             logger.info("Entering credentials")
             username_field.clear()
             username_field.send_keys(self.username)
-            time.sleep(1)
 
             password_field.clear()
             password_field.send_keys(self.password)
-            time.sleep(1)
 
             # Find and click login button with multiple possible locators
             logger.info("Submitting login form")
@@ -503,13 +376,7 @@ class TranslationTester:
 
             # Wait for successful login with multiple possible indicators
             logger.info("Waiting for successful login")
-            WebDriverWait(self.driver, 30).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Dashboard')]")),
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'dashboard')]")),
-                    EC.url_contains("dashboard")
-                )
-            )
+            WebDriverWait(self.driver, 30).until(EC.any_of(*self._login_indicators()))
 
             logger.info("Login successful")
             return True
@@ -522,6 +389,95 @@ class TranslationTester:
             logger.error(f"Page source: {self.driver.page_source[:500]}...")  # First 500 chars
             return False
             
+    def wait_for_page(self, language_code=None):
+        """
+        Wait until the page has settled instead of sleeping a fixed time
+
+        Always blocks; used between steps where the next one needs the page
+        (the next menu item, the login form).
+
+        Args:
+            language_code (str): Also wait for html[lang] to switch to this language
+        """
+        return self.page_readiness().wait_until_ready(language_code)
+
+    def page_readiness(self):
+        """Readiness checker for the current driver, kept so what it learns about the app carries over"""
+        if self._page_readiness is None:
+            self._page_readiness = PageReadiness(self.driver, **self.readiness)
+        self._page_readiness.driver = self.driver
+        return self._page_readiness
+
+    def settle_page(self, language_code=None):
+        """
+        Final wait after a navigation or language switch, before the page is read
+
+        Args:
+            language_code (str): Also wait for html[lang] to switch to this language
+        """
+        if self.defer_page_waits:
+            # The async orchestrator awaits readiness itself without blocking a thread
+            return True
+        return self.wait_for_page(language_code)
+
+    def _login_indicators(self):
+        """Conditions that show the user is logged in"""
+        return [
+            EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Dashboard')]")),
+            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'dashboard')]")),
+            EC.url_contains("dashboard")
+        ]
+
+    def is_logged_in(self, timeout=5):
+        """Quick check whether the current page shows an authenticated session"""
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.any_of(*self._login_indicators()))
+            return True
+        except TimeoutException:
+            return False
+
+    def authenticate(self):
+        """
+        Log in, reusing a cached session (cookies and web storage) when one is valid
+
+        Falls back to the full login and 2FA flow, then captures the new session
+        so other languages, pages and browsers can skip it. Only one tester per
+        application logs in at a time; the others wait and restore its session.
+        """
+        if not self.reuse_session:
+            return self._login_with_2fa()
+
+        session = SessionCache(self.base_url, self.session_file, self.session_max_age)
+        if session.get() and self._restore_session(session):
+            return True
+
+        with session.login_lock():
+            # Another tester may have logged in while this one was waiting
+            if self._restore_session(session):
+                return True
+            if session.get():
+                logger.info("Cached login session is no longer valid, logging in again")
+                session.clear()
+
+            if not self._login_with_2fa():
+                return False
+            session.capture(self.driver)
+            return True
+
+    def _restore_session(self, session):
+        """Inject the cached session and check that it is still logged in"""
+        if session.restore(self.driver) and self.is_logged_in():
+            logger.info("Reused cached login session")
+            return True
+        return False
+
+    def _login_with_2fa(self):
+        """Run the full login and 2FA flow"""
+        if not self.login():
+            return False
+        self.handle_2fa()
+        return True
+
     def handle_2fa(self):
         """Handle two-factor authentication if present"""
         try:
@@ -581,7 +537,7 @@ class TranslationTester:
             language_option.click()
 
             # Wait for page to reload/update after language change
-            time.sleep(2)
+            self.settle_page(language)
 
             logger.info(f"Changed language to {language}")
             return True
@@ -613,7 +569,10 @@ class TranslationTester:
                     )
 
                 menu_element.click()
-                time.sleep(1)  # Wait for submenu to appear or page to load
+                if i < len(menu_path) - 1:
+                    self.wait_for_page()  # The submenu must be there before the next click
+                else:
+                    self.settle_page()
 
             # Wait for page content to load
             WebDriverWait(self.driver, 10).until(
@@ -626,3 +585,167 @@ class TranslationTester:
             logger.error(f"Failed to navigate to {self.current_page}: {str(e)}")
             self.take_screenshot(f"navigation_failure_{self.current_page.replace(' > ', '_')}")
             return False
+
+    def capture_snapshot(self, language):
+        """
+        Extract the translatable text of the current page without comparing it
+
+        Args:
+            language (str): Language code the page is displayed in ('en', 'kh', 'cn')
+
+        Returns:
+            dict: Snapshot with 'page', 'language', 'browser' and extracted 'items'
+        """
+        finder = ElementFinder(self.driver, self.wait_time)
+
+        if self.extraction_mode == "script":
+            # One execute_script round-trip for the whole page
+            items = [
+                {"text": item["text"], "element": item["xpath"], "key": item.get("key")}
+                for item in finder.extract_page_texts()
+            ]
+        else:
+            items = [{"text": element.text, "element": element.tag_name} for element in finder.find_page_elements()]
+
+        if self.verify_translation_keys:
+            items.extend(self._translation_key_items(finder, items))
+
+        return {"page": self.current_page, "language": language, "browser": self.browser_name, "items": items}
+
+    def _translation_key_items(self, finder, items):
+        """
+        Resolve the sheet keys rendered on the page with one bulk lookup
+
+        Keys already carried by extracted items are skipped, so this adds the
+        keyed elements the text extraction does not pick up (e.g. containers).
+
+        Returns:
+            list: Items with the element text and its key, compared against that key's translation
+        """
+        extracted = {item["key"] for item in items if item.get("key")}
+        found = finder.find_texts_by_translation_keys(
+            key for key in self.translation_index.entries if key not in extracted
+        )
+        return [
+            {"text": text, "element": f"[{key}]", "key": key}
+            for key, texts in found.items()
+            for text in texts
+            if text
+        ]
+
+    def check_page(self, language, pipeline=None):
+        """
+        Compare the visible text of the current page against the translation index
+
+        Args:
+            language (str): Language code the page is displayed in ('en', 'kh', 'cn')
+            pipeline (ComparisonPipeline): Hand the snapshot to this process pool instead of comparing here
+
+        Returns:
+            Future or bool: The pipeline future, or True once results are updated
+        """
+        snapshot = self.capture_snapshot(language)
+        if self.snapshot_dir:
+            # Keep the raw extraction so later workbooks can be checked with --replay
+            SnapshotStore(self.snapshot_dir).save(snapshot)
+
+        if pipeline:
+            future = pipeline.submit(snapshot)
+            if self.screenshot_on_mismatch:
+                return self._screenshot_if_mismatched(future, language)
+            return future
+
+        page_results = compare_snapshot(
+            self.translation_index, snapshot, self.check_dynamic_content, self.record_checks
+        )
+        merge_results(self.results, page_results)
+        if self.screenshot_on_mismatch and page_results["mismatches"]:
+            self._take_mismatch_screenshot(language)
+        logger.info(f"Checked {len(snapshot['items'])} elements on {self.current_page} ({language})")
+        return True
+
+    def _screenshot_if_mismatched(self, future, language):
+        """
+        Keep a screenshot of the page until the process pool reports on it
+
+        The page is gone by the time the pool answers, so the image is grabbed
+        now without comparing anything on the browser thread, and saved only
+        if the comparison finds mismatches.
+
+        Args:
+            future (Future): Pipeline future of the page's snapshot
+            language (str): Language code the page is displayed in
+
+        Returns:
+            Future: Resolves to the page's results once the screenshot is saved (or dropped)
+        """
+        try:
+            image = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error(f"Failed to capture screenshot of {self.current_page}: {str(e)}")
+            return future
+
+        label = LANGUAGE_LABELS[language]
+        name = self._mismatch_screenshot_name(label)
+        path = self._screenshot_path(name)
+        page, browser, registry = self.current_page, self.browser_name, self._screenshot_registry()
+        outcome = concurrent.futures.Future()
+
+        def save(done):
+            try:
+                page_results = done.result()
+            except Exception as e:
+                outcome.set_exception(e)
+                return
+            if page_results["mismatches"]:
+                try:
+                    os.makedirs(self.screenshots_dir, exist_ok=True)
+                    with open(path, 'wb') as f:
+                        f.write(image)
+                    registry.record(path, name, page, label, browser=browser)
+                except Exception as e:
+                    logger.error(f"Failed to save screenshot {name}: {str(e)}")
+            outcome.set_result(page_results)
+
+        future.add_done_callback(save)
+        return outcome
+
+    def _mismatch_screenshot_name(self, label):
+        return f"mismatch_{label.lower()}_{self.current_page.replace(' > ', '_')}"
+
+    def _take_mismatch_screenshot(self, language):
+        label = LANGUAGE_LABELS[language]
+        self.take_screenshot(self._mismatch_screenshot_name(label), label)
+
+    def _screenshot_registry(self):
+        if self.screenshot_registry is None:
+            self.screenshot_registry = ScreenshotRegistry(self.screenshots_dir)
+        return self.screenshot_registry
+
+    def _screenshot_path(self, name):
+        # Browsers share the directory, and one page can be captured twice within a second
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        file_name = f"{name}_{self.browser_name}_{timestamp}" if self.browser_name else f"{name}_{timestamp}"
+        return os.path.join(self.screenshots_dir, f"{file_name}.png")
+
+    def take_screenshot(self, name, language=""):
+        """
+        Save a screenshot of the current page and record it in the screenshot registry
+
+        Args:
+            name (str): File name prefix, e.g. 'login_failure'
+            language (str): Language label of the page, for mismatch screenshots
+
+        Returns:
+            str: Path of the screenshot, or None if it could not be taken
+        """
+        path = self._screenshot_path(name)
+        try:
+            os.makedirs(self.screenshots_dir, exist_ok=True)
+            self.driver.save_screenshot(path)
+        except Exception as e:
+            logger.error(f"Failed to take screenshot {name}: {str(e)}")
+            return None
+
+        self._screenshot_registry().record(path, name, self.current_page, language, browser=self.browser_name)
+        return path
@@ -0,0 +1,94 @@
+import functools
+import re
+import unicodedata
+
+# Text normalization applied to sheet entries and scraped strings before comparing them
+DEFAULT_NORMALIZATION = {
+    "unicode_form": "NFC",          # NFC, NFKC (also folds compatibility forms) or None
+    "strip_zero_width": True,       # ZWSP/ZWNJ/ZWJ/word joiner/BOM/soft hyphen
+    "khmer_reorder": True,          # Vowel typed before a coeng subscript -> canonical order
+    "fold_width": True,             # Full-width ASCII and ideographic space -> half-width
+    "fold_punctuation": True,       # CJK and typographic punctuation -> ASCII
+    "lowercase": True
+}
+
+UNICODE_FORMS = ("NFC", "NFD", "NFKC", "NFKD")
+
+ZERO_WIDTH_CHARS = "\u200b\u200c\u200d\u2060\ufeff\u00ad"
+
+# Full-width '!'..'~' map onto ASCII '!'..'~'
+WIDTH_TABLE = {0xFF01 + offset: 0x21 + offset for offset in range(94)}
+WIDTH_TABLE[0x3000] = " "
+
+PUNCTUATION_TABLE = {
+    "。": ".", "、": ",", "；": ";", "：": ":", "？": "?", "！": "!",
+    "「": '"', "」": '"', "『": '"', "』": '"', "“": '"', "”": '"', "„": '"',
+    "‘": "'", "’": "'", "‚": "'", "′": "'",
+    "【": "[", "】": "]", "〔": "[", "〕": "]", "〈": "<", "〉": ">", "《": "<<", "》": ">>",
+    "–": "-", "—": "-", "―": "-", "‐": "-", "‑": "-", "−": "-", "～": "~", "〜": "~",
+    "…": "...", "・": ".", "﹐": ",", "﹒": "."
+}
+
+# A dependent vowel followed by coeng + consonant should follow the subscript instead
+_KHMER_VOWEL_COENG_RE = re.compile('([\u17b6-\u17c5])(\u17d2[\u1780-\u17b3])')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class TextNormalizer:
+    """Configurable Unicode normalization with precompiled translation tables and a per-string cache"""
+
+    def __init__(self, settings=None, cache_size=65536):
+        """
+        Args:
+            settings (dict): Overrides for DEFAULT_NORMALIZATION
+            cache_size (int): Normalized strings remembered (pages repeat the same strings)
+        """
+        self.settings = dict(DEFAULT_NORMALIZATION, **(settings or {}))
+        self.cache_size = cache_size
+
+        form = self.settings["unicode_form"]
+        if form and form not in UNICODE_FORMS:
+            raise ValueError(f"Unsupported Unicode normalization form: {form}")
+
+        # One str.translate table for every enabled character-level fold
+        table = {}
+        if self.settings["strip_zero_width"]:
+            table.update({ord(char): None for char in ZERO_WIDTH_CHARS})
+        if self.settings["fold_width"]:
+            table.update(WIDTH_TABLE)
+        if self.settings["fold_punctuation"]:
+            table.update(str.maketrans(PUNCTUATION_TABLE))
+        self._table = table
+        self._normalize = functools.lru_cache(maxsize=cache_size)(self._normalize_uncached)
+
+    def __getstate__(self):
+        # The cache wrapper cannot be pickled; rebuild it from the settings
+        return {"settings": self.settings, "cache_size": self.cache_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["settings"], state["cache_size"])
+
+    def _normalize_uncached(self, text):
+        form = self.settings["unicode_form"]
+        if form:
+            text = unicodedata.normalize(form, text)
+        if self._table:
+            text = text.translate(self._table)
+        if self.settings["khmer_reorder"]:
+            text = _KHMER_VOWEL_COENG_RE.sub(r'\2\1', text)
+        text = _WHITESPACE_RE.sub(' ', text).strip()
+        return text.lower() if self.settings["lowercase"] else text
+
+    def __call__(self, text):
+        """
+        Normalize a sheet entry or scraped string for comparison
+
+        Args:
+            text (str): Raw text (None and non-strings are converted)
+
+        Returns:
+            str: Normalized text
+        """
+        if not isinstance(text, str):
+            text = '' if text is None else str(text)
+        return self._normalize(text)
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import pandas as pd
+from src.excel_parser import NORMALIZATION_SETTINGS, load_translations, stream_translation_index
+from src.text_normalizer import TextNormalizer
+from src.translation_index import TranslationIndex
+
+logger = logging.getLogger()
+
+# Bump when the cached payload layout changes
+CACHE_FORMAT_VERSION = 2
+
+
+class TranslationCache:
+    """On-disk cache of parsed translation workbooks keyed by content hash"""
+
+    # Parsed tables shared by every tester in this process (e.g. parallel browser workers)
+    _memory = {}
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, cache_dir=".cache"):
+        self.cache_dir = os.path.join(cache_dir, "translations")
+
+    @staticmethod
+    def file_hash(path):
+        """Get the SHA-256 digest of a file's contents"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def cache_key(self, excel_path, settings=None):
+        """
+        Build the cache key for a workbook
+
+        Args:
+            excel_path (str): Path to the Excel file
+            settings (dict): Normalization settings the table was parsed with
+
+        Returns:
+            str: Hex digest identifying the workbook contents and settings
+        """
+        digest = hashlib.sha256()
+        digest.update(self.file_hash(excel_path).encode())
+        digest.update(json.dumps(settings or {}, sort_keys=True).encode())
+        digest.update(f"{CACHE_FORMAT_VERSION}:{pd.__version__}".encode())
+        return digest.hexdigest()
+
+    def _cache_file(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _lock_for(self, key):
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def load(self, key):
+        """Load a cached (DataFrame or None, TranslationIndex) pair, or None on a miss"""
+        if key in self._memory:
+            return self._memory[key]
+
+        cache_file = self._cache_file(key)
+        if not os.path.exists(cache_file):
+            return None
+
+        try:
+            with open(cache_file, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get('version') != CACHE_FORMAT_VERSION:
+                return None
+            entry = (payload['table'], payload['index'])
+            self._memory[key] = entry
+            return entry
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable translation cache {cache_file}: {str(e)}")
+            return None
+
+    def store(self, key, df, index):
+        """Write a parsed table and its index to the cache"""
+        self._memory[key] = (df, index)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = {'version': CACHE_FORMAT_VERSION, 'table': df, 'index': index}
+            # Write to a temp file first so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_file(key))
+        except Exception as e:
+            logger.warning(f"Failed to write translation cache: {str(e)}")
+
+    def get_or_load(self, excel_path, loader, settings=None, normalization=None):
+        """
+        Get the parsed table for a workbook, parsing it only on a cache miss
+
+        Args:
+            excel_path (str): Path to the Excel file
+            loader (callable): Parses the workbook into a DataFrame (or a TranslationIndex) on a miss
+            settings (dict): Normalization settings used by the loader
+            normalization (dict): TextNormalizer settings for an index built from a DataFrame
+
+        Returns:
+            tuple: (DataFrame, TranslationIndex)
+        """
+        key = self.cache_key(excel_path, settings)
+
+        # One parse per workbook even when several workers start at once
+        with self._lock_for(key):
+            entry = self.load(key)
+            if entry is not None:
+                logger.info(f"Loaded translations for {excel_path} from cache")
+                return entry
+
+            # Streaming loaders build the index directly and produce no table
+            loaded = loader(excel_path)
+            if isinstance(loaded, TranslationIndex):
+                df, index = None, loaded
+            else:
+                df, index = loaded, TranslationIndex.from_dataframe(loaded, normalization)
+            self.store(key, df, index)
+            return df, index
+
+
+def load_translation_table(excel_path, cache_dir=".cache", excel_loader="pandas", normalization=None):
+    """
+    Load a workbook's translations through the shared cache
+
+    Args:
+        excel_path (str): Path to the Excel file
+        cache_dir (str): Cache directory
+        excel_loader (str): 'pandas', or 'streaming' for the read-only openpyxl pass (no DataFrame is kept)
+        normalization (dict): TextNormalizer settings for comparing sheet entries with scraped text
+
+    Returns:
+        tuple: (DataFrame or None, TranslationIndex)
+    """
+    if excel_loader == "streaming":
+        loader = lambda path: stream_translation_index(path, normalization=normalization)
+    else:
+        # load_translations keeps a legacy 'self' parameter that it does not use
+        loader = lambda path: load_translations(None, path)
+
+    # The cache validates columns, normalizes text and builds the lookup index on a miss
+    return TranslationCache(cache_dir).get_or_load(
+        excel_path,
+        loader,
+        dict(NORMALIZATION_SETTINGS, loader=excel_loader, text=TextNormalizer(normalization).settings),
+        normalization
+    )
@@ -0,0 +1,243 @@
+from src.text_normalizer import TextNormalizer
+
+# Sheet columns holding the text expected on screen for each language
+LANGUAGE_COLUMNS = {
+    'en': 'Original EN',
+    'kh': 'KH Confirm from BIC',
+    'cn': 'CN Confirm from BIC'
+}
+LANGUAGES = list(LANGUAGE_COLUMNS.keys())
+
+# Default normalization, for callers without an index at hand
+_DEFAULT_NORMALIZER = TextNormalizer()
+
+
+def normalize_text(text):
+    """
+    Normalize a string for lookups with the default TextNormalizer settings
+
+    Args:
+        text (str): Raw text from the sheet or the page
+
+    Returns:
+        str: Normalized text
+    """
+    return _DEFAULT_NORMALIZER(text)
+
+
+class TranslationIndex:
+    """Hash-based lookup tables over the translation sheet, built once at load time"""
+
+    def __init__(self, normalization=None):
+        """
+        Args:
+            normalization (dict): TextNormalizer settings for sheet entries and scraped strings
+        """
+        self.normalize = TextNormalizer(normalization)
+        # key -> {'en': ..., 'kh': ..., 'cn': ...}
+        self.entries = {}
+        # key -> normalized texts, computed once per sheet entry
+        self.normalized = {}
+        # language -> normalized text -> [keys]
+        self.text_index = {lang: {} for lang in LANGUAGES}
+        # Substring, fuzzy and placeholder matchers and the batch comparer, built on first use
+        self._matcher = None
+        self._fuzzy = None
+        self._templates = None
+        self._batch = None
+
+    @classmethod
+    def from_dataframe(cls, df, normalization=None):
+        """
+        Build the index from a translations DataFrame
+
+        Args:
+            df (DataFrame): Translations with the "Key" and language columns
+            normalization (dict): TextNormalizer settings
+
+        Returns:
+            TranslationIndex: Populated index
+        """
+        index = cls(normalization)
+        columns = ['Key'] + [LANGUAGE_COLUMNS[lang] for lang in LANGUAGES]
+        for values in df[columns].itertuples(index=False, name=None):
+            index.add(values[0], dict(zip(LANGUAGES, values[1:])))
+        return index
+
+    @classmethod
+    def from_rows(cls, rows, normalization=None):
+        """
+        Build the index from an iterable of sheet rows
+
+        Args:
+            rows (iterable): Dicts keyed by sheet column name
+            normalization (dict): TextNormalizer settings
+
+        Returns:
+            TranslationIndex: Populated index
+        """
+        index = cls(normalization)
+        for row in rows:
+            index.add(row.get('Key'), {lang: row.get(column, '') for lang, column in LANGUAGE_COLUMNS.items()})
+        return index
+
+    def add(self, key, translations):
+        """
+        Add one sheet entry to the index
+
+        Args:
+            key (str): Translation key
+            translations (dict): Text per language code ('en', 'kh', 'cn')
+        """
+        if key is None or key == '':
+            return
+        key = str(key)
+        entry = {lang: self._clean(translations.get(lang)) for lang in LANGUAGES}
+        # Keep the first occurrence of duplicate keys, matching DataFrame lookups
+        if key in self.entries:
+            return
+        self.entries[key] = entry
+        self.normalized[key] = {lang: self.normalize(text) for lang, text in entry.items()}
+        self._matcher = None
+        self._fuzzy = None
+        self._templates = None
+        self._batch = None
+
+        for lang, normalized in self.normalized[key].items():
+            if not normalized:
+                continue
+            keys = self.text_index[lang].setdefault(normalized, [])
+            if key not in keys:
+                keys.append(key)
+
+    def __getstate__(self):
+        # The matchers are cheap to rebuild compared to pickling them
+        state = dict(self.__dict__)
+        state['_matcher'] = None
+        state['_fuzzy'] = None
+        state['_templates'] = None
+        state['_batch'] = None
+        return state
+
+    def matcher(self):
+        """
+        Get the Aho–Corasick matcher over all translations, building it on first use
+
+        Returns:
+            TranslationMatcher: Finds every translation contained in a text in one pass
+        """
+        if getattr(self, '_matcher', None) is None:
+            from src.aho_corasick import TranslationMatcher
+            self._matcher = TranslationMatcher(self)
+        return self._matcher
+
+    def fuzzy(self):
+        """
+        Get the n-gram fuzzy matcher over all translations, building it on first use
+
+        Returns:
+            FuzzyMatcher: Finds the nearest translation to a text with its similarity score
+        """
+        if getattr(self, '_fuzzy', None) is None:
+            from src.fuzzy_matcher import FuzzyMatcher
+            self._fuzzy = FuzzyMatcher(self)
+        return self._fuzzy
+
+    def templates(self):
+        """
+        Get the placeholder template matcher, building it on first use
+
+        Returns:
+            TemplateMatcher: Matches dynamic strings against entries such as "Balance: {amount}"
+        """
+        if getattr(self, '_templates', None) is None:
+            from src.template_matcher import TemplateMatcher
+            self._templates = TemplateMatcher(self)
+        return self._templates
+
+    def batch(self):
+        """
+        Get the vectorized batch comparer, building it on first use
+
+        Returns:
+            BatchComparer: Compares all strings of a page in one pass
+        """
+        if getattr(self, '_batch', None) is None:
+            from src.batch_comparison import BatchComparer
+            self._batch = BatchComparer(self)
+        return self._batch
+
+    @staticmethod
+    def _clean(value):
+        """Convert empty cells (None/NaN) to empty strings"""
+        if value is None or value != value:
+            return ''
+        return str(value)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Get all translations for a key, or None if the key is unknown"""
+        return self.entries.get(key)
+
+    def translation(self, key, language):
+        """Get the expected text for a key in one language"""
+        entry = self.entries.get(key)
+        return entry.get(language, '') if entry else ''
+
+    def normalized_translation(self, key, language):
+        """Get the precomputed normalized text for a key in one language"""
+        entry = self.normalized.get(key)
+        return entry.get(language, '') if entry else ''
+
+    def keys_for_text(self, text, language=None):
+        """
+        Find the keys whose translation equals the given text
+
+        Args:
+            text (str): Text to look up (normalized before lookup)
+            language (str): Restrict to one language code, or None for all
+
+        Returns:
+            list: Matching keys
+        """
+        normalized = self.normalize(text)
+        if language:
+            return list(self.text_index.get(language, {}).get(normalized, []))
+
+        keys = []
+        for lang in LANGUAGES:
+            for key in self.text_index[lang].get(normalized, []):
+                if key not in keys:
+                    keys.append(key)
+        return keys
+
+    def key_for_text(self, text, language=None):
+        """Get the first key whose translation equals the text, or None"""
+        keys = self.keys_for_text(text, language)
+        return keys[0] if keys else None
+
+    def lookup(self, text):
+        """
+        Reverse lookup of a text across all languages
+
+        Args:
+            text (str): Text to look up
+
+        Returns:
+            list: (key, language) pairs the text belongs to
+        """
+        normalized = self.normalize(text)
+        return [(key, lang) for lang in LANGUAGES for key in self.text_index[lang].get(normalized, [])]
+
+    def contains(self, text, language):
+        """Check whether the text is a known translation in the given language"""
+        return self.normalize(text) in self.text_index.get(language, {})
+
+    def to_lookup_dict(self):
+        """Get a plain key -> translations dict"""
+        return {key: dict(entry) for key, entry in self.entries.items()}
@@ -0,0 +1,61 @@
+import pytest
+from src.aho_corasick import AhoCorasick, TranslationMatcher
+from src.translation_index import TranslationIndex
+
+
+def make_matcher(entries, min_length=2):
+    index = TranslationIndex()
+    for key, translations in entries.items():
+        index.add(key, translations)
+    return TranslationMatcher(index, min_length)
+
+
+def test_overlapping_patterns():
+    automaton = AhoCorasick()
+    for pattern in ("he", "she", "his", "hers"):
+        automaton.add(pattern)
+    found = sorted((end, automaton.patterns[pattern_id]) for end, pattern_id in automaton.iter_matches("ushers"))
+    assert found == [(4, "he"), (4, "she"), (6, "hers")]
+
+
+def test_add_after_build_raises():
+    automaton = AhoCorasick().build()
+    with pytest.raises(RuntimeError):
+        automaton.add("late")
+
+
+def test_find_all_respects_word_boundaries():
+    matcher = make_matcher({"in": {"en": "in", "kh": "", "cn": ""}, "login": {"en": "Login", "kh": "", "cn": ""}})
+    assert [match.key for match in matcher.find_all("Login")] == ["login"]
+    assert [match.key for match in matcher.find_all("Sign in")] == ["in"]
+
+
+def test_cjk_hits_need_no_word_boundary():
+    matcher = make_matcher({"account": {"en": "Account", "kh": "", "cn": "账户"}})
+    match = matcher.best_match("我的账户余额", "cn")
+    assert (match.key, match.language, match.start, match.end) == ("account", "cn", 2, 4)
+
+
+def test_best_match_prefers_longest_and_filters_language():
+    matcher = make_matcher({
+        "balance": {"en": "Balance", "kh": "", "cn": ""},
+        "available": {"en": "Available balance", "kh": "", "cn": ""}
+    })
+    assert matcher.best_match("Available balance: 10").key == "available"
+    assert matcher.best_match("Available balance: 10", "cn") is None
+
+
+def test_min_length_skips_short_entries():
+    matcher = make_matcher({"a": {"en": "A", "kh": "", "cn": ""}, "ok": {"en": "OK", "kh": "", "cn": ""}})
+    assert len(matcher) == 1
+
+
+def test_scan_items_offsets_are_per_item():
+    matcher = make_matcher({
+        "save": {"en": "Save", "kh": "", "cn": ""},
+        "cancel": {"en": "Cancel", "kh": "", "cn": ""}
+    })
+    hits = matcher.scan_items(["Save", "Nothing here", "Press Cancel"])
+    assert [[(match.key, match.start, match.end) for match in item] for item in hits] == [
+        [("save", 0, 4)], [], [("cancel", 6, 12)]
+    ]
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+from src import async_runner
+from src.async_runner import AsyncBrowserSession, run_async_tests
+from src.results import new_results
+
+CONFIG = {"browsers": ["chrome"], "navigation_paths": [["Dashboard"], ["Account"]]}
+
+
+def run(monkeypatch, config, unit_call, **kwargs):
+    async def start(self):
+        pass
+
+    async def run_unit(self, language, path):
+        await self.call(unit_call)
+        return new_results()
+
+    async def close(self):
+        pass
+
+    monkeypatch.setattr(AsyncBrowserSession, "start", start)
+    monkeypatch.setattr(AsyncBrowserSession, "run_unit", run_unit)
+    monkeypatch.setattr(AsyncBrowserSession, "close", close)
+    monkeypatch.setattr(async_runner, "collect_unit_results", lambda units, unit_results, config: unit_results)
+    return asyncio.run(run_async_tests(config, **kwargs))
+
+
+def test_sessions_share_the_configured_threads(monkeypatch):
+    threads = set()
+
+    def webdriver_call():
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+
+    unit_results = run(monkeypatch, dict(CONFIG, async_threads=2), webdriver_call, sessions_per_browser=6)
+    assert len(unit_results) == 6
+    assert all(isinstance(result, dict) for result in unit_results.values())
+    assert len(threads) <= 2
+
+
+def test_timeout_does_not_wait_for_hung_webdriver_call(monkeypatch):
+    release = threading.Event()
+    started = time.monotonic()
+    try:
+        unit_results = run(monkeypatch, CONFIG, lambda: release.wait(5), unit_timeout=0.2)
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+    assert elapsed < 2
+    assert any(isinstance(result, TimeoutError) for result in unit_results.values())
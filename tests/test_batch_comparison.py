@@ -0,0 +1,54 @@
+from src.batch_comparison import BatchComparer
+from src.comparison import compare_item
+from src.results import CHECK_FIELDS, new_results
+from src.translation_index import TranslationIndex
+
+
+def make_index():
+    index = TranslationIndex()
+    index.add("save", {"en": "Save", "kh": "រក្សាទុក", "cn": "保存"})
+    index.add("cancel", {"en": "Cancel", "kh": "បោះបង់", "cn": "取消"})
+    index.add("balance", {"en": "Balance: {amount}", "kh": "", "cn": ""})
+    return index
+
+
+ITEMS = [
+    {"text": "Save", "element": "button#save"},
+    {"text": "  CANCEL ", "element": "button#cancel"},
+    {"text": "Cancel", "element": "button#ok", "key": "save"},
+    {"text": "Balance: 10.00", "element": "span.balance"},
+    {"text": "保存", "element": "button#other"},
+    {"text": "Unknown label", "element": "label"}
+]
+
+
+def test_match_flags():
+    comparer = BatchComparer(make_index())
+    texts = [item["text"] for item in ITEMS]
+    keys = [item.get("key") for item in ITEMS]
+    assert comparer.match_flags(texts, "en", keys).tolist() == [True, True, False, False, False, False]
+
+
+def test_compare_agrees_with_per_item_path():
+    index = make_index()
+    batched = BatchComparer(index).compare(new_results(), "Home", "en", ITEMS)
+    one_by_one = new_results()
+    for item in ITEMS:
+        compare_item(index, one_by_one, "Home", "en", item)
+    assert batched == one_by_one
+    assert batched["total_elements"] == len(ITEMS)
+    assert batched["en_matched"] == 3
+
+
+def test_compare_records_checks():
+    results = BatchComparer(make_index()).compare(new_results(), "Home", "en", ITEMS, record_checks=True)
+    checks = [dict(zip(CHECK_FIELDS, check)) for check in results["checks"]]
+    assert [check["matched"] for check in checks] == [True, True, False, True, False, False]
+    assert [check["key"] for check in checks[:5]] == ["save", "cancel", "save", "balance", "save"]
+    assert checks[2]["expected"] == "Save" and checks[2]["actual"] == "Cancel"
+    assert all(check["language"] == "English" and check["page"] == "Home" for check in checks)
+
+
+def test_checks_are_off_by_default():
+    results = BatchComparer(make_index()).compare(new_results(), "Home", "en", ITEMS)
+    assert results["checks"] == []
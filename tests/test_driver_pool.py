@@ -0,0 +1,133 @@
+import queue
+import src.tester
+from src import browser_manager
+from src.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, number, heap_bytes=None):
+        self.number = number
+        self.heap_bytes = heap_bytes
+        self.quit_called = False
+        self.pages = []
+
+    def execute_script(self, script, *args):
+        if script == "return 1;":
+            return 0 if self.quit_called else 1
+        if "usedJSHeapSize" in script:
+            return self.heap_bytes
+        return None
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeFactory:
+    def __init__(self, heap_bytes=None):
+        self.drivers = []
+        self.heap_bytes = heap_bytes
+
+    def __call__(self):
+        driver = FakeDriver(len(self.drivers), self.heap_bytes)
+        self.drivers.append(driver)
+        return driver
+
+
+def test_release_resets_and_reuses_driver():
+    factory = FakeFactory()
+    pool = DriverPool(factory, size=1, max_uses=5)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert driver.pages == ["about:blank"]
+    assert pool.acquire() is driver
+    assert len(factory.drivers) == 1
+
+
+def test_release_recycles_after_max_uses():
+    factory = FakeFactory()
+    pool = DriverPool(factory, size=1, max_uses=2)
+    first = pool.acquire()
+    pool.release(first)
+    pool.release(pool.acquire())
+    assert first.quit_called
+    assert pool.acquire() is not first
+    assert len(factory.drivers) == 2
+
+
+def test_renew_keeps_driver_until_max_uses():
+    factory = FakeFactory()
+    pool = DriverPool(factory, size=1, max_uses=3)
+    driver = pool.acquire()
+    assert pool.renew(driver) is driver
+    assert pool.renew(driver) is driver
+    assert driver.pages == []
+
+    replacement = pool.renew(driver)
+    assert replacement is not driver
+    assert driver.quit_called
+    assert len(factory.drivers) == 2
+
+
+def test_renew_recycles_on_memory_limit():
+    factory = FakeFactory(heap_bytes=600 * 1024 * 1024)
+    pool = DriverPool(factory, size=1, max_uses=50, max_memory_mb=512)
+    driver = pool.acquire()
+    assert pool.renew(driver) is not driver
+    assert driver.quit_called
+
+
+def test_unhealthy_idle_driver_is_replaced():
+    factory = FakeFactory()
+    pool = DriverPool(factory, size=1)
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.quit_called = True
+    assert pool.acquire() is not driver
+
+
+class FakeTester:
+    instances = []
+
+    def __init__(self, *args):
+        self.driver = None
+        self.logins = []
+        FakeTester.instances.append(self)
+
+    def load_translations(self):
+        pass
+
+    def authenticate(self):
+        self.logins.append(self.driver)
+        return True
+
+
+def test_shard_worker_recycles_drivers_between_units(monkeypatch):
+    FakeTester.instances = []
+    monkeypatch.setattr(src.tester, "TranslationTester", FakeTester)
+    monkeypatch.setattr(browser_manager, "configure_tester", lambda tester, config: None)
+    drivers_per_unit = []
+    monkeypatch.setattr(
+        browser_manager, "run_unit",
+        lambda tester, language, path, pipeline=None: drivers_per_unit.append(tester.driver) or {}
+    )
+
+    factory = FakeFactory()
+    pool = DriverPool(factory, size=1, max_uses=2)
+    work_queue = queue.Queue()
+    units = [("chrome", "en", (f"Page {n}",)) for n in range(5)]
+    for unit in units:
+        work_queue.put(unit)
+
+    unit_results = {}
+    browser_manager._shard_worker("chrome", work_queue, unit_results, {}, pool)
+
+    assert set(unit_results) == set(units)
+    assert [driver.number for driver in drivers_per_unit] == [0, 0, 1, 1, 2]
+    assert [driver.number for driver in FakeTester.instances[0].logins] == [0, 1, 2]
+    assert factory.drivers[0].quit_called and factory.drivers[1].quit_called
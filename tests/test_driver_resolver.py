@@ -0,0 +1,102 @@
+import json
+import os
+import time
+import pytest
+from src import driver_resolver
+from src.driver_resolver import DriverResolver
+
+
+class FakeManager:
+    """Stands in for a webdriver-manager class; installs return the next queued path or error"""
+
+    outcomes = []
+    installs = 0
+
+    def install(self):
+        FakeManager.installs += 1
+        outcome = FakeManager.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setitem(driver_resolver.DRIVER_MANAGERS, "chrome", FakeManager)
+    monkeypatch.setattr(DriverResolver, "_resolved", {})
+    FakeManager.outcomes = []
+    FakeManager.installs = 0
+    return FakeManager
+
+
+def driver_binary(tmp_path, name):
+    path = tmp_path / name
+    path.write_text("binary")
+    return str(path)
+
+
+def write_manifest(path, driver_path, age):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"chrome": {"path": driver_path, "resolved_at": time.time() - age}}, f)
+
+
+def test_resolves_once_and_pins_the_path(tmp_path, manager):
+    manifest = str(tmp_path / "webdrivers.json")
+    path = driver_binary(tmp_path, "chromedriver")
+    manager.outcomes = [path]
+
+    assert DriverResolver(manifest).resolve("Chrome") == path
+    assert DriverResolver(manifest).resolve("chrome") == path
+    assert manager.installs == 1
+    with open(manifest, 'r', encoding='utf-8') as f:
+        assert json.load(f)["chrome"]["path"] == path
+
+
+def test_fresh_manifest_entry_skips_install(tmp_path, manager):
+    manifest = str(tmp_path / "webdrivers.json")
+    write_manifest(manifest, driver_binary(tmp_path, "pinned"), age=10)
+    assert DriverResolver(manifest, ttl=60).resolve("chrome") == str(tmp_path / "pinned")
+    assert manager.installs == 0
+
+
+def test_expired_manifest_entry_is_re_resolved(tmp_path, manager):
+    manifest = str(tmp_path / "webdrivers.json")
+    write_manifest(manifest, driver_binary(tmp_path, "pinned"), age=120)
+    manager.outcomes = [driver_binary(tmp_path, "fresh")]
+    assert DriverResolver(manifest, ttl=60).resolve("chrome") == str(tmp_path / "fresh")
+
+
+def test_offline_falls_back_to_stale_entry(tmp_path, manager):
+    manifest = str(tmp_path / "webdrivers.json")
+    write_manifest(manifest, driver_binary(tmp_path, "pinned"), age=120)
+    manager.outcomes = [ConnectionError("offline")]
+    assert DriverResolver(manifest, ttl=60).resolve("chrome") == str(tmp_path / "pinned")
+
+
+def test_offline_without_entry_raises(tmp_path, manager):
+    manager.outcomes = [ConnectionError("offline")]
+    with pytest.raises(ConnectionError):
+        DriverResolver(str(tmp_path / "webdrivers.json")).resolve("chrome")
+
+
+def test_process_cache_is_per_manifest(tmp_path, manager):
+    first = DriverResolver(str(tmp_path / "a.json"))
+    second = DriverResolver(str(tmp_path / "b.json"))
+    manager.outcomes = [driver_binary(tmp_path, "a"), driver_binary(tmp_path, "b")]
+    assert first.resolve("chrome") == str(tmp_path / "a")
+    assert second.resolve("chrome") == str(tmp_path / "b")
+
+
+def test_failed_manifest_write_keeps_the_old_file(tmp_path, manager):
+    manifest = str(tmp_path / "webdrivers.json")
+    write_manifest(manifest, "old", age=0)
+    DriverResolver(manifest)._write_manifest({"chrome": {"path": object()}})
+
+    with open(manifest, 'r', encoding='utf-8') as f:
+        assert json.load(f)["chrome"]["path"] == "old"
+    assert os.listdir(str(tmp_path)) == ["webdrivers.json"]
+
+
+def test_unsupported_browser(manager):
+    with pytest.raises(ValueError):
+        DriverResolver().resolve("safari")
@@ -0,0 +1,39 @@
+import json
+import pytest
+from src.browser_manager import run_unit
+from src.element_finder import ElementFinder
+from src.tester import TranslationTester
+from src.translation_index import TranslationIndex
+
+
+class FakeDriver:
+    def __init__(self, response):
+        self.response = response
+
+    def execute_script(self, script, *args):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+def test_extract_page_texts():
+    items = [{"xpath": "/html/body/h1[1]", "tag": "h1", "text": "Account", "key": None, "rect": [0, 0, 10, 10]}]
+    assert ElementFinder(FakeDriver(json.dumps(items))).extract_page_texts() == items
+    assert ElementFinder(FakeDriver(None)).extract_page_texts() == []
+
+
+def test_extraction_failure_raises():
+    with pytest.raises(RuntimeError):
+        ElementFinder(FakeDriver(Exception("javascript error"))).extract_page_texts()
+
+
+def test_extraction_failure_fails_the_unit():
+    tester = TranslationTester("https://example.com", "", "user", "secret")
+    tester.driver = FakeDriver(Exception("javascript error"))
+    tester.translation_index = TranslationIndex()
+    tester.navigate_to_page = lambda path: True
+    tester.change_language = lambda language: True
+
+    with pytest.raises(RuntimeError):
+        run_unit(tester, "en", ("Account",))
+    assert tester.results["total_elements"] == 0
@@ -0,0 +1,101 @@
+import logging
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from src.excel_parser import normalize_columns, stream_translation_index
+
+# Required columns in a different order, padded and mixed with unrelated ones
+HEADER = ["Module", "Key", "Original EN", "Original CN", "Original KH", "Remarks",
+          "KH Confirm from BIC", " CN Confirm from BIC ", "Notes"]
+
+
+def make_workbook(tmp_path, rows, header=HEADER):
+    """Write a translations sheet followed by an unrelated sheet"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Translations"
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    other = workbook.create_sheet("Changelog")
+    other.append(["Key", "Original EN"])
+    other.append(["changelog.only", "Not a translation"])
+    path = str(tmp_path / "translations.xlsx")
+    workbook.save(path)
+    return path
+
+
+def row(key, en, kh="", cn="", module="Account", notes="ignored"):
+    return [module, key, en, "原文", "ដើម", "remark", kh, cn, notes]
+
+
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_normalize_columns_cleans_text_columns(dtype):
+    df = pd.DataFrame({
+        "Key": pd.Series(["common.fromDate ", "help"], dtype=dtype),
+        "Original EN": pd.Series(["From  date", "Terms &amp; conditions"], dtype=dtype),
+        "KH Confirm from BIC": pd.Series(["ជំនួយ\xa0", None], dtype=dtype)
+    })
+    normalize_columns(df)
+    assert df["Key"].tolist() == ["common.fromDate", "help"]
+    assert df["Original EN"].tolist() == ["From date", "Terms & conditions"]
+    assert df["KH Confirm from BIC"].tolist() == ["ជំនួយ", ""]
+
+
+def test_normalize_columns_skips_numeric_columns():
+    df = pd.DataFrame({"Key": [1, 2]})
+    normalize_columns(df)
+    assert df["Key"].tolist() == [1, 2]
+
+
+def test_stream_reads_required_columns_by_header(tmp_path):
+    path = make_workbook(tmp_path, [
+        row(" account.title ", "My  account", "គណនី", "账户"),
+        row("help", "Terms &amp; conditions"),
+        row(None, "No key"),
+        row("pay", None, cn="支付")
+    ])
+    index = stream_translation_index(path)
+
+    assert sorted(index.entries) == ["account.title", "help", "pay"]
+    assert index.get("account.title") == {"en": "My account", "kh": "គណនី", "cn": "账户"}
+    assert index.translation("help", "en") == "Terms & conditions"
+    assert index.get("pay") == {"en": "", "kh": "", "cn": "支付"}
+    assert "changelog.only" not in index
+
+
+def test_stream_reads_a_named_sheet(tmp_path):
+    path = make_workbook(tmp_path, [row("account.title", "Account")])
+    with pytest.raises(ValueError, match="Original CN"):
+        stream_translation_index(path, sheet_name="Changelog")
+
+
+def test_stream_stops_at_the_last_required_column(tmp_path, monkeypatch):
+    path = make_workbook(tmp_path, [row("account.title", "Account")])
+    calls = []
+    iter_rows = ReadOnlyWorksheet.iter_rows
+
+    def spy(self, *args, **kwargs):
+        calls.append(kwargs)
+        return iter_rows(self, *args, **kwargs)
+
+    monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", spy)
+    stream_translation_index(path)
+    assert calls[-1]["min_row"] == 2
+    assert calls[-1]["max_col"] == HEADER.index(" CN Confirm from BIC ") + 1
+
+
+def test_stream_missing_columns(tmp_path):
+    header = [name for name in HEADER if name != "KH Confirm from BIC"]
+    path = make_workbook(tmp_path, [], header)
+    with pytest.raises(ValueError, match="KH Confirm from BIC"):
+        stream_translation_index(path)
+
+
+def test_stream_warns_about_duplicate_keys(tmp_path, caplog):
+    path = make_workbook(tmp_path, [row("save", "Save"), row("save", "Save again"), row("cancel", "Cancel")])
+    with caplog.at_level(logging.WARNING):
+        index = stream_translation_index(path)
+    assert index.translation("save", "en") == "Save"
+    assert "Found 1 duplicate keys" in caplog.text
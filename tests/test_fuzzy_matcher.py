@@ -0,0 +1,51 @@
+from src.fuzzy_matcher import FuzzyMatcher, bounded_levenshtein, ngrams
+from src.translation_index import TranslationIndex
+
+
+def make_matcher(entries, **kwargs):
+    index = TranslationIndex()
+    for key, text in entries.items():
+        index.add(key, {"en": text, "kh": "", "cn": ""})
+    return FuzzyMatcher(index, **kwargs)
+
+
+def test_ngrams_pad_short_strings():
+    assert ngrams("a") == {"\x02\x02a", "\x02a\x03", "a\x03\x03"}
+    assert len(ngrams("")) == 2
+
+
+def test_bounded_levenshtein():
+    assert bounded_levenshtein("kitten", "sitting", 3) == 3
+    assert bounded_levenshtein("kitten", "sitting", 2) is None
+    assert bounded_levenshtein("same", "same", 0) == 0
+    assert bounded_levenshtein("", "abc", 3) == 3
+    assert bounded_levenshtein("a", "abcdef", 2) is None
+
+
+def test_closest_finds_typo():
+    matcher = make_matcher({"balance": "Account balance", "history": "Transaction history"})
+    match = matcher.closest("Acount balance")
+    assert (match.key, match.distance) == ("balance", 1)
+    assert match.score == round(1 - 1 / len("account balance"), 4)
+
+
+def test_closest_respects_threshold():
+    matcher = make_matcher({"balance": "Account balance"}, threshold=0.95)
+    assert matcher.closest("Acount balanse") is None
+    assert matcher.closest("Unrelated text") is None
+    assert matcher.closest("") is None
+
+
+def test_closest_prefers_requested_language():
+    index = TranslationIndex()
+    index.add("ok_en", {"en": "Confirm", "kh": "", "cn": ""})
+    index.add("ok_kh", {"en": "", "kh": "Confirm", "cn": ""})
+    assert FuzzyMatcher(index).closest("Confirn", "kh").key == "ok_kh"
+
+
+def test_results_are_cached():
+    matcher = make_matcher({"balance": "Account balance"}, cache_size=1)
+    first = matcher.closest("Acount balance")
+    assert matcher.closest("Acount balance") is first
+    matcher.closest("Account balanc")
+    assert len(matcher._cache) == 1
@@ -0,0 +1,75 @@
+import pytest
+from src import incremental
+from src.incremental import IncrementalState, changed_keys, run_incremental_tests, sheet_fingerprint
+from src.results import new_results
+from src.snapshot_store import SnapshotStore
+from src.translation_index import TranslationIndex
+
+UNITS = [("chrome", "en", ("Dashboard",)), ("chrome", "en", ("Account",))]
+
+
+def make_index(entries, normalization=None):
+    index = TranslationIndex(normalization)
+    for key, text in entries.items():
+        index.add(key, {"en": text, "kh": "", "cn": ""})
+    return index
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Run run_incremental_tests against a given sheet without a browser; returns the units that were re-checked"""
+    config = {
+        "snapshot_dir": str(tmp_path / "snapshots"),
+        "incremental_state": str(tmp_path / "state.json")
+    }
+    store = SnapshotStore(config["snapshot_dir"])
+    store.save({"page": "Dashboard", "language": "en", "browser": "chrome", "items": [{"text": "Summer promo"}]})
+    store.save({"page": "Account", "language": "en", "browser": "chrome", "items": [{"text": "Account"}]})
+
+    def run_with(index):
+        checked = []
+
+        def fake_run_units(config, units, workers_per_browser=None, pools=None):
+            checked.extend(units)
+            return {unit: new_results() for unit in units}
+
+        monkeypatch.setattr(incremental, "load_translation_index", lambda config: index)
+        monkeypatch.setattr(incremental, "build_work_units", lambda config: list(UNITS))
+        monkeypatch.setattr(incremental, "run_units", fake_run_units)
+        monkeypatch.setattr(incremental, "collect_unit_results", lambda units, unit_results, config: unit_results)
+        run_incremental_tests(config)
+        return checked
+
+    return run_with
+
+
+def test_changed_keys():
+    old = sheet_fingerprint(make_index({"a": "A", "b": "B"}))
+    new = sheet_fingerprint(make_index({"a": "A2", "c": "C"}))
+    assert changed_keys(old, new) == {"a", "b", "c"}
+
+
+def test_first_run_checks_everything(run):
+    assert run(make_index({"account": "Account"})) == UNITS
+
+
+def test_unchanged_sheet_checks_nothing(run):
+    run(make_index({"account": "Account"}))
+    assert run(make_index({"account": "Account"})) == []
+
+
+def test_edited_key_rechecks_its_page(run):
+    run(make_index({"account": "Account"}))
+    assert run(make_index({"account": "My account"})) == [UNITS[1]]
+
+
+def test_added_key_rechecks_the_page_showing_it(run):
+    run(make_index({"account": "Account"}))
+    assert run(make_index({"account": "Account", "promo": "Summer promo"})) == [UNITS[0]]
+
+
+def test_normalization_change_checks_everything(run, tmp_path):
+    run(make_index({"account": "Account"}))
+    assert run(make_index({"account": "Account"}, {"lowercase": False})) == UNITS
+    state = IncrementalState(str(tmp_path / "state.json"))
+    assert state.load() and state.normalization["lowercase"] is False
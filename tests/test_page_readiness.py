@@ -0,0 +1,41 @@
+import json
+import time
+from src.page_readiness import PageReadiness
+
+
+class FakeDriver:
+    def __init__(self, lang):
+        self.lang = lang
+        self.polls = 0
+
+    def execute_script(self, script, *args):
+        self.polls += 1
+        return json.dumps({"readyState": "complete", "pending": 0, "quietMs": 1000, "lang": self.lang})
+
+
+def make_readiness(lang):
+    return PageReadiness(FakeDriver(lang), timeout=1, lang_timeout=0.2, quiet_period_ms=300, poll_interval=0.05)
+
+
+def test_matching_lang_returns_immediately():
+    readiness = make_readiness("km")
+    assert readiness.wait_until_ready("kh")
+    assert not readiness.lang_missing
+
+
+def test_missing_lang_is_waited_for_only_once():
+    readiness = make_readiness("")
+    assert not readiness.wait_for_lang("kh")
+    assert readiness.lang_missing
+
+    polls = readiness.driver.polls
+    started = time.monotonic()
+    assert readiness.wait_for_lang("cn")
+    assert time.monotonic() - started < 0.1
+    assert readiness.driver.polls == polls
+
+
+def test_wrong_lang_keeps_waiting():
+    readiness = make_readiness("en")
+    assert not readiness.wait_for_lang("kh")
+    assert not readiness.lang_missing
@@ -0,0 +1,39 @@
+import src.tester
+from src.tester import TranslationTester
+
+
+class RecordingReadiness:
+    calls = []
+
+    def __init__(self, driver, **settings):
+        pass
+
+    def wait_until_ready(self, language_code=None):
+        RecordingReadiness.calls.append(language_code)
+        return True
+
+
+def make_tester(monkeypatch, deferred):
+    RecordingReadiness.calls = []
+    monkeypatch.setattr(src.tester, "PageReadiness", RecordingReadiness)
+    tester = TranslationTester("https://example.com", "", "user", "secret")
+    tester.defer_page_waits = deferred
+    return tester
+
+
+def test_intermediate_waits_block_even_when_deferred(monkeypatch):
+    tester = make_tester(monkeypatch, deferred=True)
+    assert tester.wait_for_page()
+    assert RecordingReadiness.calls == [None]
+
+
+def test_final_wait_is_left_to_the_async_runner(monkeypatch):
+    tester = make_tester(monkeypatch, deferred=True)
+    assert tester.settle_page("kh")
+    assert RecordingReadiness.calls == []
+
+
+def test_final_wait_blocks_when_not_deferred(monkeypatch):
+    tester = make_tester(monkeypatch, deferred=False)
+    assert tester.settle_page("kh")
+    assert RecordingReadiness.calls == ["kh"]
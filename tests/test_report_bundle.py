@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import re
+import zipfile
+from PIL import Image
+from src.report_bundle import ReportBundle, resolve_chartjs
+from src.report_generator import ReportGenerator
+from src.results import new_results
+from src.screenshot_registry import ScreenshotRegistry
+
+
+def save_png(path, color, size=(1200, 800)):
+    Image.new("RGB", size, color).save(path, format="PNG")
+    return str(path)
+
+
+def test_screenshots_are_stored_once_per_content(tmp_path):
+    first = save_png(tmp_path / "a.png", "red")
+    copy = save_png(tmp_path / "b.png", "red")
+    other = save_png(tmp_path / "c.png", "blue")
+
+    with ReportBundle(str(tmp_path / "bundle.zip"), thumbnail_size=200, thumbnail_format="jpeg") as bundle:
+        thumb, full = bundle.add_screenshot(first)
+        assert bundle.add_screenshot(copy) == (thumb, full)
+        assert bundle.add_screenshot(first) == (thumb, full)
+        assert bundle.add_screenshot(other) != (thumb, full)
+        assert bundle.add_screenshot(str(tmp_path / "missing.png")) is None
+        assert bundle.duplicates == 1
+
+    with zipfile.ZipFile(str(tmp_path / "bundle.zip")) as archive:
+        names = archive.namelist()
+        assert len([name for name in names if name.startswith("screenshots/full/")]) == 2
+        assert thumb.startswith("screenshots/thumbs/") and thumb.endswith(".jpg")
+        with Image.open(io.BytesIO(archive.read(thumb))) as image:
+            assert max(image.size) == 200
+
+
+def test_unreadable_image_uses_full_size_as_thumbnail(tmp_path):
+    path = tmp_path / "broken.png"
+    path.write_bytes(b"not an image")
+    with ReportBundle(str(tmp_path / "bundle.zip")) as bundle:
+        thumb, full = bundle.add_screenshot(str(path))
+    assert thumb == full
+
+
+def test_configured_chartjs_is_used(tmp_path):
+    chartjs = tmp_path / "chart.js"
+    chartjs.write_text("window.Chart = function() {};")
+    assert resolve_chartjs({"chartjs_path": str(chartjs)}) == str(chartjs)
+
+
+def test_report_bundle_contents(tmp_path):
+    screenshots_dir = tmp_path / "screenshots"
+    screenshots_dir.mkdir()
+    registry = ScreenshotRegistry(str(screenshots_dir))
+    for element in ("/h1", "/p"):
+        # Identical captures of two elements are stored once
+        path = save_png(screenshots_dir / f"mismatch{element.replace('/', '_')}.png", "red")
+        registry.record(path, "", "Account", "English", element)
+    chartjs = tmp_path / "chart.js"
+    chartjs.write_text("window.Chart = function() {};")
+
+    results = new_results()
+    results["total_elements"] = 2
+    results["en_mismatched"] = 2
+    results["mismatches"] = [
+        {"page": "Account", "element": element, "language": "English", "actual": "x", "expected": "y"}
+        for element in ("/h1", "/p")
+    ]
+    config = {
+        "report_dir": str(tmp_path / "reports"),
+        "screenshots_dir": str(screenshots_dir),
+        "report_bundle": True,
+        "chartjs_path": str(chartjs),
+        "thumbnail_format": "jpeg"
+    }
+    archive_path = ReportGenerator(results, config).generate()
+    assert archive_path.endswith(".zip") and os.path.exists(archive_path)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        names = set(archive.namelist())
+        report = archive.read("index.html").decode("utf-8")
+    assert "assets/chart.umd.min.js" in names
+    assert '<script src="assets/chart.umd.min.js"></script>' in report
+
+    blob = re.search(r'id="mismatchData">(.*?)</script>', report, re.S).group(1)
+    screenshots = json.loads(blob)["screenshots"]
+    assert len(screenshots) == 1
+    assert set(screenshots[0]) <= names
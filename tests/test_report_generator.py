@@ -0,0 +1,96 @@
+import io
+import json
+import os
+import re
+from src.report_generator import ReportGenerator
+from src.results import new_results
+from src.screenshot_registry import ScreenshotRegistry
+
+HOSTILE = "</script><script>alert(1)</script>"
+
+
+def make_results():
+    results = new_results()
+    results["total_elements"] = 3
+    results["en_matched"] = 1
+    results["en_mismatched"] = 1
+    results["kh_mismatched"] = 1
+    results["mismatches"] = [
+        {"page": "Account", "element": "/h1", "language": "English", "key": "title",
+         "actual": HOSTILE, "expected": "Account", "closest_key": "title", "score": 0.5},
+        {"page": "Account", "element": "/p", "language": "Khmer", "key": "", "actual": "x",
+         "expected": "", "closest_key": "", "score": 0.0}
+    ]
+    return results
+
+
+def make_config(tmp_path, **overrides):
+    config = {
+        "report_dir": str(tmp_path / "reports"),
+        "screenshots_dir": str(tmp_path / "screenshots"),
+        "password": "secret"
+    }
+    config.update(overrides)
+    return config
+
+
+def mismatch_blob(report):
+    found = re.search(r'<script type="application/json" id="mismatchData">(.*?)</script>', report, re.S)
+    return json.loads(found.group(1))
+
+
+def test_json_for_script_escapes_closing_tags():
+    encoded = ReportGenerator._json_for_script([HOSTILE])
+    assert "</" not in encoded
+    assert json.loads(encoded) == [HOSTILE]
+
+
+def test_mismatch_blob_round_trips(tmp_path):
+    config = make_config(tmp_path)
+    os.makedirs(config["screenshots_dir"])
+    shot = os.path.join(config["screenshots_dir"], "shot.png")
+    with open(shot, 'wb') as f:
+        f.write(b"png")
+    ScreenshotRegistry(config["screenshots_dir"]).record(shot, "shot", "Account", "English", "/h1")
+
+    with open(ReportGenerator(make_results(), config).generate(), 'r', encoding='utf-8') as f:
+        report = f.read()
+    assert report.count(HOSTILE) == 0
+
+    data = mismatch_blob(report)
+    assert data["pages"] == ["Account"]
+    assert data["languages"] == ["English", "Khmer"]
+    assert [row[3] for row in data["rows"]] == [HOSTILE, "x"]
+    assert data["screenshots"] == [[os.path.join("..", "screenshots", "shot.png")] * 2]
+    assert [row[8] for row in data["rows"]] == [0, -1]
+
+
+def test_password_is_masked(tmp_path):
+    with open(ReportGenerator(make_results(), make_config(tmp_path)).generate(), 'r', encoding='utf-8') as f:
+        report = f.read()
+    assert "secret" not in report
+    assert "********" in report
+
+
+def test_write_chunks_batches_writes():
+    class CountingWriter(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    writer = CountingWriter()
+    ReportGenerator._write_chunks(writer, (str(i) for i in range(1200)), batch_size=500)
+    assert writer.writes == 3
+    assert writer.getvalue() == "".join(str(i) for i in range(1200))
+
+
+def test_match_rate_counts_each_check_once(tmp_path):
+    results = new_results()
+    results["total_elements"] = 4
+    results["en_matched"] = 2
+    results["kh_matched"] = 2
+    with open(ReportGenerator(results, make_config(tmp_path)).generate(), 'r', encoding='utf-8') as f:
+        report = f.read()
+    assert '<div class="stat-value success">100.00%</div>' in report
@@ -0,0 +1,57 @@
+import json
+import pytest
+from src import results_export
+from src.report_generator import ReportGenerator
+from src.results import CHECK_FIELDS, merge_results, new_results
+from src.results_export import write_checks_jsonl, write_checks_parquet
+
+CHECKS = [
+    ("Account", "English", "/h1", "title", "Account", "Account", True, 1700000000.0, 1.5),
+    ("Account", "Khmer", "/p", "", "", "Unknown", False, 1700000000.5, 1.5),
+    ("Dashboard", "Chinese", "/span", "save", "保存", "保存", True, 1700000001.0, 0.25)
+]
+
+
+def test_jsonl_rows(tmp_path):
+    path = tmp_path / "checks.jsonl"
+    assert write_checks_jsonl(iter(CHECKS), str(path), "run-1", batch_size=2) == 3
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [row["run"] for row in rows] == ["run-1"] * 3
+    assert [tuple(row[field] for field in CHECK_FIELDS) for row in rows] == CHECKS
+
+
+def test_parquet_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "checks.parquet"
+    assert write_checks_parquet(iter(CHECKS), str(path), "run-1", batch_size=2) == 3
+
+    table = pq.read_table(str(path))
+    assert table.column_names == ["run"] + CHECK_FIELDS
+    assert pq.ParquetFile(str(path)).metadata.num_row_groups == 2
+    assert table.column("matched").to_pylist() == [True, False, True]
+    assert table.column("expected").to_pylist() == ["Account", "", "保存"]
+
+
+def test_parquet_is_skipped_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_export, "pa", None)
+    path = tmp_path / "checks.parquet"
+    assert write_checks_parquet(CHECKS, str(path), "run-1") is None
+    assert not path.exists()
+
+
+def test_merged_checks_are_exported_next_to_the_report(tmp_path):
+    results = new_results()
+    for check in CHECKS:
+        shard = new_results()
+        shard["checks"].append(check)
+        merge_results(results, shard)
+
+    generator = ReportGenerator(results, {"report_dir": str(tmp_path)})
+    generator.report_file = str(tmp_path / "translation_test_report_1.html")
+    exported = generator.export_results("1")
+    assert exported[0] == str(tmp_path / "translation_test_report_1.jsonl")
+    with open(exported[0], 'r', encoding='utf-8') as f:
+        assert sum(1 for _ in f) == 3
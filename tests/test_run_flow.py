@@ -0,0 +1,51 @@
+import sys
+import main
+from src import browser_manager
+
+
+def test_run_test_on_browser_runs_units_for_that_browser(monkeypatch, tmp_path):
+    ran = []
+
+    def fake_run_units(config, units, workers_per_browser=None, pools=None):
+        ran.extend(units)
+        return {unit: browser_manager.new_results() for unit in units}
+
+    monkeypatch.setattr(browser_manager, "run_units", fake_run_units)
+    config = {
+        "browsers": ["chrome", "firefox"],
+        "navigation_paths": [["Dashboard"]],
+        "report_dir": str(tmp_path),
+        "screenshots_dir": str(tmp_path / "screenshots")
+    }
+    result = browser_manager.run_test_on_browser("firefox", config)
+
+    assert {unit[0] for unit in ran} == {"firefox"}
+    assert len(ran) == 3
+    assert result["success"]
+    assert result["report_file"].startswith(str(tmp_path / "firefox"))
+
+
+def test_run_test_on_browser_reports_errors(monkeypatch):
+    def failing_run_units(config, units, workers_per_browser=None, pools=None):
+        raise RuntimeError("driver failed to start")
+
+    monkeypatch.setattr(browser_manager, "run_units", failing_run_units)
+    result = browser_manager.run_test_on_browser("chrome", {"navigation_paths": [["Dashboard"]]})
+    assert result == {"browser": "chrome", "success": False, "error": "driver failed to start"}
+
+
+def test_default_cli_invocation_runs_units(monkeypatch, capsys):
+    calls = []
+
+    def fake_run_sharded_tests(config):
+        calls.append(config)
+        return {"chrome": {"browser": "chrome", "success": True, "report_file": "reports/chrome/report.html"}}
+
+    monkeypatch.setattr(main, "run_sharded_tests", fake_run_sharded_tests)
+    monkeypatch.setattr(sys, "argv", [
+        "main.py", "--url", "https://example.com", "--excel", "sheet.xlsx", "--username", "u", "--password", "p"
+    ])
+    main.main()
+
+    assert len(calls) == 1
+    assert "chrome: Passed" in capsys.readouterr().out
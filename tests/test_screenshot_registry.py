@@ -0,0 +1,57 @@
+import os
+from src.screenshot_registry import ScreenshotRegistry
+
+
+def touch(directory, name):
+    path = os.path.join(str(directory), name)
+    with open(path, 'wb') as f:
+        f.write(b"png")
+    return path
+
+
+def test_record_and_lookup_by_element_and_page(tmp_path):
+    registry = ScreenshotRegistry(str(tmp_path))
+    path = touch(tmp_path, "mismatch_khmer_Account_chrome_20250416_103457_001.png")
+    registry.record(path, "mismatch_khmer_Account", "Account", "Khmer", "/h1", "chrome")
+
+    assert registry.lookup("Account", "Khmer", "/h1", "chrome") == path
+    assert registry.lookup("Account", "Khmer", "/other", "chrome") == path
+    assert registry.lookup("Account", "English", "/h1", "chrome") is None
+
+
+def test_browsers_do_not_share_screenshots(tmp_path):
+    registry = ScreenshotRegistry(str(tmp_path))
+    chrome = touch(tmp_path, "mismatch_khmer_Account_chrome_20250416_103457_001.png")
+    firefox = touch(tmp_path, "mismatch_khmer_Account_firefox_20250416_103457_002.png")
+    registry.record(chrome, "mismatch_khmer_Account", "Account", "Khmer", browser="chrome")
+    registry.record(firefox, "mismatch_khmer_Account", "Account", "Khmer", browser="firefox")
+
+    assert registry.lookup("Account", "Khmer", browser="chrome") == chrome
+    assert registry.lookup("Account", "Khmer", browser="firefox") == firefox
+    assert registry.lookup("Account", "Khmer", browser="edge") is None
+
+
+def test_manifest_is_read_back(tmp_path):
+    path = touch(tmp_path, "mismatch_chinese_Dashboard_edge_20250416_103457_001.png")
+    ScreenshotRegistry(str(tmp_path)).record(path, "mismatch_chinese_Dashboard", "Dashboard", "Chinese", browser="edge")
+
+    registry = ScreenshotRegistry(str(tmp_path)).load()
+    assert registry.lookup("Dashboard", "Chinese", browser="edge") == path
+
+
+def test_screenshots_from_before_the_manifest_are_found_by_name(tmp_path):
+    touch(tmp_path, "mismatch_khmer_Account_Account List_20250416_103000.png")
+    latest = touch(tmp_path, "mismatch_khmer_Account_Account List_20250416_103457.png")
+
+    registry = ScreenshotRegistry(str(tmp_path)).load()
+    assert registry.lookup("Account > Account List", "Khmer", browser="chrome") == latest
+
+
+def test_malformed_manifest_lines_are_skipped(tmp_path):
+    path = touch(tmp_path, "shot.png")
+    registry = ScreenshotRegistry(str(tmp_path))
+    registry.record(path, "shot", "Dashboard", "English")
+    with open(registry.manifest_path, 'a', encoding='utf-8') as f:
+        f.write("not json\n")
+
+    assert ScreenshotRegistry(str(tmp_path)).load().lookup("Dashboard", "English") == path
@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import uuid
+import pytest
+from src.session_cache import SessionCache
+from src.tester import TranslationTester
+
+
+class FakeDriver:
+    """Keeps cookies and storage like a browser on one origin"""
+
+    def __init__(self):
+        self.cookies = []
+        self.storage = {"local": {}, "session": {}}
+
+    def get(self, url):
+        pass
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        if args:
+            state = json.loads(args[0])
+            self.storage["local"].update(state["local"])
+            self.storage["session"].update(state["session"])
+            return None
+        return json.dumps(self.storage)
+
+
+@pytest.fixture
+def base_url():
+    # Sessions are shared per base URL across the process, so each test gets its own
+    return f"https://{uuid.uuid4().hex}.example.com"
+
+
+def logged_in_driver():
+    driver = FakeDriver()
+    driver.cookies.append({"name": "sid", "value": "abc"})
+    driver.storage["local"]["token"] = "t"
+    return driver
+
+
+def test_capture_and_restore(base_url):
+    cache = SessionCache(base_url)
+    cache.capture(logged_in_driver())
+
+    driver = FakeDriver()
+    assert cache.restore(driver)
+    assert driver.cookies == [{"name": "sid", "value": "abc"}]
+    assert driver.storage["local"] == {"token": "t"}
+
+
+def test_expired_session_is_not_restored(base_url):
+    cache = SessionCache(base_url, max_age=0)
+    cache.capture(logged_in_driver())
+    time.sleep(0.01)
+    assert cache.get() is None
+    assert not cache.restore(FakeDriver())
+
+
+def test_session_file_is_shared_and_cleared(base_url, tmp_path):
+    session_file = str(tmp_path / "sessions.json")
+    SessionCache(base_url, session_file).capture(logged_in_driver())
+    SessionCache._sessions.pop(base_url)
+
+    cache = SessionCache(base_url, session_file)
+    assert cache.get()["cookies"] == [{"name": "sid", "value": "abc"}]
+
+    cache.clear()
+    with open(session_file, 'r', encoding='utf-8') as f:
+        assert base_url not in json.load(f)
+    assert SessionCache(base_url, session_file).get() is None
+
+
+def test_concurrent_testers_log_in_once(base_url):
+    logins = []
+
+    def make_tester():
+        tester = TranslationTester(base_url, "", "user", "secret")
+        tester.driver = FakeDriver()
+
+        def login():
+            logins.append(tester)
+            time.sleep(0.05)
+            tester.driver.cookies.append({"name": "sid", "value": "abc"})
+            return True
+
+        tester.login = login
+        tester.handle_2fa = lambda: None
+        tester.is_logged_in = lambda: bool(tester.driver.cookies)
+        return tester
+
+    testers = [make_tester() for _ in range(6)]
+    outcomes = []
+    threads = [threading.Thread(target=lambda t=t: outcomes.append(t.authenticate())) for t in testers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes == [True] * 6
+    assert len(logins) == 1
+    assert all(tester.driver.cookies for tester in testers)
+
+
+def test_invalid_cached_session_triggers_login(base_url):
+    SessionCache(base_url).capture(logged_in_driver())
+
+    tester = TranslationTester(base_url, "", "user", "secret")
+    tester.driver = FakeDriver()
+    logins = []
+    tester.login = lambda: logins.append(1) or True
+    tester.handle_2fa = lambda: None
+    tester.is_logged_in = lambda: False
+
+    assert tester.authenticate()
+    assert logins == [1]
@@ -0,0 +1,58 @@
+import os
+import pytest
+from src import snapshot_store
+from src.snapshot_store import SnapshotStore
+from src.translation_index import TranslationIndex
+
+
+def snapshot(browser, text="Hello"):
+    return {"page": "Account > Account List", "language": "kh", "browser": browser, "items": [{"text": text}]}
+
+
+def test_browsers_get_separate_files(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    chrome = store.save(snapshot("chrome", "from chrome"))
+    firefox = store.save(snapshot("firefox", "from firefox"))
+
+    assert chrome != firefox
+    assert store.load(chrome)["items"] == [{"text": "from chrome"}]
+    assert store.load(firefox)["items"] == [{"text": "from firefox"}]
+    assert os.path.basename(chrome) == "Account_Account_List__chrome__kh.json.gz"
+
+
+def test_iter_snapshots_in_file_name_order(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.save(snapshot("firefox"))
+    store.save(snapshot("chrome"))
+    assert [s["browser"] for s in store.iter_snapshots()] == ["chrome", "firefox"]
+
+
+def test_failed_write_keeps_the_previous_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    path = store.save(snapshot("chrome", "original"))
+
+    unserializable = snapshot("chrome")
+    unserializable["items"] = [{"text": object()}]
+    with pytest.raises(TypeError):
+        store.save(unserializable)
+
+    assert store.load(path)["items"] == [{"text": "original"}]
+    assert os.listdir(str(tmp_path)) == [os.path.basename(path)]
+
+
+def test_replay_reports_each_browser_separately(tmp_path, monkeypatch):
+    index = TranslationIndex()
+    index.add("hello", {"en": "", "kh": "Hello", "cn": ""})
+    monkeypatch.setattr(snapshot_store, "load_translation_table", lambda *args: (None, index))
+
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.save(snapshot("chrome"))
+    store.save(snapshot("firefox", "Wrong"))
+    config = {"report_dir": str(tmp_path / "reports"), "screenshots_dir": str(tmp_path / "screenshots")}
+
+    results = snapshot_store.replay_snapshots(config, store.directory)
+    assert list(results) == ["chrome", "firefox"]
+    assert results["chrome"]["success"] and not results["firefox"]["success"]
+    assert results["chrome"]["results"]["total_elements"] == 1
+    assert results["firefox"]["results"]["kh_mismatched"] == 1
+    assert os.path.dirname(results["firefox"]["report_file"]) == str(tmp_path / "reports" / "firefox")
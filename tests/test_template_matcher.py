@@ -0,0 +1,58 @@
+from src.template_matcher import TemplateMatcher, compile_template
+from src.translation_index import TranslationIndex
+
+
+def make_matcher(entries):
+    index = TranslationIndex()
+    for key, text in entries.items():
+        index.add(key, {"en": text, "kh": "", "cn": ""})
+    return TemplateMatcher(index)
+
+
+def test_percent_in_prose_is_not_a_placeholder():
+    assert compile_template("up to 5% discount") is None
+    assert compile_template("0% fee") is None
+    assert compile_template("100% safe") is None
+
+
+def test_percent_in_prose_does_not_match_other_text():
+    matcher = make_matcher({"discount": "Up to 5% discount", "fee": "0% fee"})
+    assert matcher.match("Up to 5% xdiscount", "en") is None
+    assert matcher.match("0% xfee", "en") is None
+
+
+def test_brace_placeholder():
+    matcher = make_matcher({"balance": "Balance: {amount}"})
+    found = matcher.match("Balance: 1,200.00", "en")
+    assert found.key == "balance"
+    assert found.values == ("1,200.00",)
+
+
+def test_double_brace_placeholder():
+    matcher = make_matcher({"welcome": "Welcome back, {{ name }}!"})
+    found = matcher.match("Welcome back, John!", "en")
+    assert found.key == "welcome"
+    assert found.values == ("john",)
+
+
+def test_named_printf_placeholder():
+    matcher = make_matcher({"items": "%(count)s items in cart"})
+    found = matcher.match("3 items in cart", "en")
+    assert found.key == "items"
+    assert found.values == ("3",)
+
+
+def test_printf_placeholders_with_flags():
+    regex, literals = compile_template("total: %-5.2f usd, %1$s left")
+    assert literals == ["total: ", " usd, ", " left"]
+    assert regex.match("total: 12.50 usd, 3 left")
+
+
+def test_most_specific_template_wins():
+    matcher = make_matcher({"generic": "{a}: {b}", "specific": "Balance: {amount}"})
+    assert matcher.match("Balance: 10", "en").key == "specific"
+
+
+def test_language_filter():
+    matcher = make_matcher({"balance": "Balance: {amount}"})
+    assert matcher.match("Balance: 10", "kh") is None
@@ -0,0 +1,106 @@
+import concurrent.futures
+import os
+from src.comparison import compare_snapshot
+from src.tester import TranslationTester
+from src.translation_index import TranslationIndex
+
+
+class FakeDriver:
+    def save_screenshot(self, path):
+        with open(path, 'wb') as f:
+            f.write(b"png")
+        return True
+
+    def get_screenshot_as_png(self):
+        return b"png"
+
+
+class FakePipeline:
+    """Compares later, like the process pool answering after the browser moved on"""
+
+    def __init__(self, index):
+        self.index = index
+        self.submitted = []
+
+    def submit(self, snapshot):
+        future = concurrent.futures.Future()
+        self.submitted.append((snapshot, future))
+        return future
+
+    def finish(self):
+        for snapshot, future in self.submitted:
+            future.set_result(compare_snapshot(self.index, snapshot))
+
+
+def make_tester(tmp_path, texts):
+    index = TranslationIndex()
+    index.add("balance", {"en": "Balance: {amount}", "kh": "", "cn": ""})
+    index.add("account", {"en": "Account", "kh": "", "cn": ""})
+
+    tester = TranslationTester("https://example.com", "", "user", "secret")
+    tester.driver = FakeDriver()
+    tester.browser_name = "firefox"
+    tester.translation_index = index
+    tester.screenshots_dir = str(tmp_path)
+    tester.current_page = "Dashboard"
+    tester.capture_snapshot = lambda language: {
+        "page": "Dashboard", "language": language, "browser": "firefox", "items": [{"text": text} for text in texts]
+    }
+    return tester
+
+
+def screenshots(tmp_path):
+    return sorted(name for name in os.listdir(str(tmp_path)) if name.endswith(".png"))
+
+
+def test_pipeline_path_takes_mismatch_screenshot(tmp_path):
+    tester = make_tester(tmp_path, ["Account", "Unknown text"])
+    pipeline = FakePipeline(tester.translation_index)
+
+    future = tester.check_page("en", pipeline)
+    assert len(pipeline.submitted) == 1
+    assert screenshots(tmp_path) == []
+
+    tester.current_page = "Next page"
+    pipeline.finish()
+    assert future.result()["en_mismatched"] == 1
+    [name] = screenshots(tmp_path)
+    assert name.startswith("mismatch_english_Dashboard_firefox_")
+    assert tester.screenshot_registry.lookup("Dashboard", "English", browser="firefox")
+
+
+def test_pipeline_path_does_not_compare_on_the_browser_thread(tmp_path, monkeypatch):
+    tester = make_tester(tmp_path, ["Unknown text"])
+    pipeline = FakePipeline(tester.translation_index)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("matched on the browser thread")
+
+    monkeypatch.setattr(tester.translation_index, "batch", fail)
+    monkeypatch.setattr(tester.translation_index, "templates", fail)
+    tester.check_page("en", pipeline)
+
+
+def test_pipeline_path_skips_screenshot_for_clean_page(tmp_path):
+    tester = make_tester(tmp_path, ["Account", "Balance: 1,200.00"])
+    pipeline = FakePipeline(tester.translation_index)
+    future = tester.check_page("en", pipeline)
+    pipeline.finish()
+    assert future.result()["en_matched"] == 2
+    assert screenshots(tmp_path) == []
+
+
+def test_pipeline_failure_is_passed_on(tmp_path):
+    tester = make_tester(tmp_path, ["Unknown text"])
+    pipeline = FakePipeline(tester.translation_index)
+    future = tester.check_page("en", pipeline)
+    pipeline.submitted[0][1].set_exception(RuntimeError("worker died"))
+    assert isinstance(future.exception(), RuntimeError)
+    assert screenshots(tmp_path) == []
+
+
+def test_inline_path_takes_mismatch_screenshot(tmp_path):
+    tester = make_tester(tmp_path, ["Unknown text"])
+    assert tester.check_page("en")
+    assert tester.results["en_mismatched"] == 1
+    assert len(screenshots(tmp_path)) == 1
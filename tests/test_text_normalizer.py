@@ -0,0 +1,47 @@
+import pickle
+import pytest
+from src.text_normalizer import TextNormalizer
+
+
+def test_defaults():
+    normalize = TextNormalizer()
+    assert normalize("  Hello\u200b   World ") == "hello world"
+    assert normalize(None) == ""
+    assert normalize(42) == "42"
+
+
+def test_composes_to_nfc():
+    assert TextNormalizer()("Cafe\u0301") == "caf\u00e9"
+
+
+def test_khmer_vowel_before_coeng_is_reordered():
+    typed = "\u1780\u17b6\u17d2\u179a"
+    canonical = "\u1780\u17d2\u179a\u17b6"
+    normalize = TextNormalizer()
+    assert normalize(typed) == normalize(canonical) == canonical
+    assert TextNormalizer({"khmer_reorder": False})(typed) == typed
+
+
+def test_width_and_punctuation_folding():
+    normalize = TextNormalizer()
+    assert normalize("ＡＢＣ　１２３") == "abc 123"
+    assert normalize("确认！") == "确认!"
+    assert normalize("“Save” — now…") == '"save" - now...'
+
+
+def test_folds_can_be_disabled():
+    normalize = TextNormalizer({"fold_width": False, "fold_punctuation": False, "lowercase": False})
+    assert normalize("ＡＢＣ！") == "ＡＢＣ！"
+    assert normalize("Save") == "Save"
+
+
+def test_invalid_unicode_form_raises():
+    with pytest.raises(ValueError):
+        TextNormalizer({"unicode_form": "NFX"})
+
+
+def test_pickle_round_trip():
+    normalize = TextNormalizer({"lowercase": False}, cache_size=10)
+    restored = pickle.loads(pickle.dumps(normalize))
+    assert restored.settings == normalize.settings
+    assert restored("Ｓave") == "Save"
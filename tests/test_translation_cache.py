@@ -0,0 +1,69 @@
+import pandas as pd
+from src.translation_cache import TranslationCache
+from src.translation_index import LANGUAGE_COLUMNS, TranslationIndex
+
+
+def make_workbook(tmp_path, content=b"workbook"):
+    path = tmp_path / "translations.xlsx"
+    path.write_bytes(content)
+    return str(path)
+
+
+def dataframe_loader(calls):
+    def loader(path):
+        calls.append(path)
+        return pd.DataFrame([{"Key": "save", **dict(zip(LANGUAGE_COLUMNS.values(), ["Save", "រក្សាទុក", "保存"]))}])
+    return loader
+
+
+def test_cache_key_tracks_contents_and_settings(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache"))
+    path = make_workbook(tmp_path)
+    key = cache.cache_key(path, {"lowercase": True})
+    assert cache.cache_key(path, {"lowercase": True}) == key
+    assert cache.cache_key(path, {"lowercase": False}) != key
+    make_workbook(tmp_path, b"edited")
+    assert cache.cache_key(path, {"lowercase": True}) != key
+
+
+def test_get_or_load_parses_once(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache"))
+    path = make_workbook(tmp_path)
+    calls = []
+    df, index = cache.get_or_load(path, dataframe_loader(calls), {"run": "first"})
+    assert list(df["Key"]) == ["save"]
+    assert index.key_for_text("保存", "cn") == "save"
+
+    cache.get_or_load(path, dataframe_loader(calls), {"run": "first"})
+    assert calls == [path]
+
+
+def test_cached_index_is_read_back_from_disk(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache"))
+    path = make_workbook(tmp_path)
+    calls = []
+    cache.get_or_load(path, dataframe_loader(calls), {"run": "disk"})
+    TranslationCache._memory.clear()
+
+    df, index = cache.get_or_load(path, dataframe_loader(calls), {"run": "disk"})
+    assert calls == [path]
+    assert index.key_for_text("SAVE", "en") == "save"
+    assert index.matcher().best_match("Save changes").key == "save"
+
+
+def test_streaming_loader_keeps_no_table(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache"))
+    path = make_workbook(tmp_path)
+    streamed = TranslationIndex()
+    streamed.add("save", {"en": "Save", "kh": "", "cn": ""})
+    df, index = cache.get_or_load(path, lambda path: streamed, {"loader": "streaming"})
+    assert df is None and index is streamed
+
+
+def test_unreadable_cache_file_is_a_miss(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache"))
+    path = make_workbook(tmp_path)
+    key = cache.cache_key(path, {"run": "corrupt"})
+    (tmp_path / "cache" / "translations").mkdir(parents=True)
+    (tmp_path / "cache" / "translations" / f"{key}.pkl").write_bytes(b"not a pickle")
+    assert cache.load(key) is None
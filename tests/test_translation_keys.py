@@ -0,0 +1,61 @@
+import json
+from src.tester import TranslationTester
+from src.translation_index import TranslationIndex
+
+
+class FakeDriver:
+    """Answers the extraction and bulk key lookup scripts from a fixed page"""
+
+    def __init__(self, extracted, keyed):
+        self.extracted = extracted
+        self.keyed = keyed
+        self.requested_keys = None
+
+    def execute_script(self, script, *args):
+        if args:
+            self.requested_keys = list(args[0])
+            return json.dumps({key: texts for key, texts in self.keyed.items() if key in self.requested_keys})
+        return json.dumps(self.extracted)
+
+
+def make_tester(driver, verify):
+    index = TranslationIndex()
+    index.add("title", {"en": "Account", "kh": "", "cn": ""})
+    index.add("total", {"en": "Total", "kh": "", "cn": ""})
+    tester = TranslationTester("https://example.com", "", "user", "secret")
+    tester.driver = driver
+    tester.translation_index = index
+    tester.verify_translation_keys = verify
+    tester.current_page = "Account"
+    return tester
+
+
+def page():
+    extracted = [{"xpath": "/html/body/h1[1]", "text": "Account", "key": "title"}]
+    # 'total' sits on a container element the text extraction skips
+    return FakeDriver(extracted, {"title": ["Account"], "total": ["Totl"]})
+
+
+def test_bulk_key_lookup_adds_keyed_elements():
+    driver = page()
+    snapshot = make_tester(driver, verify=True).capture_snapshot("en")
+
+    assert driver.requested_keys == ["total"]
+    assert snapshot["items"][-1] == {"text": "Totl", "element": "[total]", "key": "total"}
+
+
+def test_keyed_elements_are_compared_against_their_key():
+    tester = make_tester(page(), verify=True)
+    tester.screenshot_on_mismatch = False
+    tester.check_page("en")
+
+    assert tester.results["en_mismatched"] == 1
+    [mismatch] = tester.results["mismatches"]
+    assert (mismatch["key"], mismatch["expected"], mismatch["actual"]) == ("total", "Total", "Totl")
+
+
+def test_bulk_key_lookup_is_opt_in():
+    driver = page()
+    snapshot = make_tester(driver, verify=False).capture_snapshot("en")
+    assert driver.requested_keys is None
+    assert len(snapshot["items"]) == 1